@@ -0,0 +1,317 @@
+"""
+Vision I benchmark suite.
+
+Times each pipeline stage on synthetic scenes with a stub
+detector (no camera, GPU or network needed), writes the
+results to JSON and optionally compares them with a baseline.
+
+Usage (from the repository root):
+
+    python -m benchmarks.run
+    python -m benchmarks.run --scenes crowded --frames 600
+    python -m benchmarks.run --baseline benchmarks/baseline.json
+    python -m benchmarks.run --save-baseline
+"""
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+from benchmarks.scenes import NAMES, SCENES, generate_scene, video_fixture
+from benchmarks.stub_detector import StubDetector
+from src.decision.rules import DecisionEngine
+from src.features.motion import MotionEstimator
+from src.memory.short_term_memory import ShortTermMemory
+from src.tracking.tracker import MultiObjectTracker
+from src.utils.logger import DecisionLogger
+from src.vision.camera import Camera
+
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCH_DIR / "results" / "latest.json"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_THRESHOLDS = BENCH_DIR / "thresholds.yaml"
+
+WIDTH, HEIGHT = 640, 480
+
+
+def summarize(samples, warmup=0):
+    """
+    Latency statistics for per-iteration samples (seconds).
+    """
+    samples = np.asarray(samples[warmup:] or samples, dtype=np.float64) * 1000
+    p50, p95, p99 = np.percentile(samples, (50, 95, 99))
+    return {
+        "iterations": int(len(samples)),
+        "mean_ms": float(samples.mean()),
+        "min_ms": float(samples.min()),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+    }
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+# --------------------------------------------------
+# Stage benchmarks: each returns per-iteration seconds
+# --------------------------------------------------
+
+def bench_postprocess(script, workdir):
+    detector = StubDetector(script, NAMES)
+    return [timed(detector.detect, None)[0] for _ in script]
+
+
+def bench_evaluate(script, workdir):
+    detector = StubDetector(script, NAMES)
+    batches = [detector.detect_batch(None) for _ in script]
+
+    engine = DecisionEngine(
+        frame_width=WIDTH, logger=DecisionLogger(str(workdir / "evaluate.jsonl"))
+    )
+    samples = [timed(engine.evaluate, batch)[0] for batch in batches]
+    engine.logger.close()
+    return samples
+
+
+def bench_memory(script, workdir):
+    detector = StubDetector(script, NAMES)
+    frames = [detector.detect_batch(None) for _ in script]
+    memory = ShortTermMemory()
+
+    def step(batch):
+        for label, box in zip(batch.labels, batch.boxes.tolist()):
+            if not memory.is_recent(label, box):
+                memory.update(label, box)
+
+    return [timed(step, batch)[0] for batch in frames]
+
+
+def bench_motion(script, workdir):
+    detector = StubDetector(script, NAMES)
+    tracker = MultiObjectTracker()
+    estimator = MotionEstimator()
+
+    samples = []
+    for _ in script:
+        track_ids = tracker.update(detector.detect_batch(None))
+        samples.append(timed(estimator.estimate_batch, tracker, track_ids)[0])
+    return samples
+
+
+def bench_logger(script, workdir):
+    logger = DecisionLogger(str(workdir / "logger.jsonl"))
+    rng = np.random.default_rng(0)
+
+    samples = []
+    for detections in script:
+        for x1, _, x2, _, _, cls in detections:
+            samples.append(timed(
+                logger.log,
+                NAMES.get(int(cls), "object"),
+                float(rng.uniform(0.5, 5.0)),
+                "CENTER" if x1 < WIDTH / 2 < x2 else "LEFT",
+                "APPROACHING",
+                "Obstacle ahead. Please stop.",
+            )[0])
+
+    logger.close()
+    return samples or [0.0]
+
+
+def bench_end_to_end(script, workdir, video=None, kind="sparse"):
+    source = video or video_fixture(kind, len(script), WIDTH, HEIGHT)
+    camera = Camera(str(source), threaded=False)
+    detector = StubDetector(script, NAMES)
+    engine = DecisionEngine(
+        frame_width=WIDTH, logger=DecisionLogger(str(workdir / "end_to_end.jsonl"))
+    )
+
+    samples = []
+    while True:
+        start = time.perf_counter()
+        frame = camera.read()
+        if frame is None:
+            break
+        engine.evaluate(detector.detect_batch(frame.image))
+        samples.append(time.perf_counter() - start)
+
+    camera.release()
+    engine.logger.close()
+    return samples
+
+
+STAGES = {
+    "detector.postprocess": bench_postprocess,
+    "decision.evaluate": bench_evaluate,
+    "memory.short_term": bench_memory,
+    "motion.estimate_batch": bench_motion,
+    "logger.log": bench_logger,
+    "end_to_end": bench_end_to_end,
+}
+
+
+def run_suite(scenes, stages, frames=300, seed=0, warmup=10, video=None):
+    """
+    Run the selected stage benchmarks on each scene.
+
+    :return: Dict of 'stage[scene]' -> latency statistics
+    """
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+
+        for kind in scenes:
+            script = generate_scene(kind, frames, WIDTH, HEIGHT, seed)
+            objects = sum(len(d) for d in script) / max(len(script), 1)
+
+            for stage in stages:
+                if stage == "end_to_end":
+                    samples = bench_end_to_end(script, workdir, video, kind)
+                else:
+                    samples = STAGES[stage](script, workdir)
+
+                name = f"{stage}[{kind}]"
+                results[name] = summarize(samples, warmup)
+                results[name]["objects_per_frame"] = round(objects, 2)
+                print(f"[BENCH] {name:<36} p50 {results[name]['p50_ms']:8.3f} ms  "
+                      f"p99 {results[name]['p99_ms']:8.3f} ms")
+
+    return results
+
+
+# --------------------------------------------------
+# Baseline comparison
+# --------------------------------------------------
+
+def load_thresholds(path=DEFAULT_THRESHOLDS):
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, "r") as f:
+        return yaml.safe_load(f) or {}
+
+
+def allowed_slowdown(name, thresholds):
+    """
+    Relative slowdown allowed for a benchmark (first matching pattern wins).
+    """
+    for pattern, limit in (thresholds.get("benchmarks") or {}).items():
+        if fnmatch.fnmatchcase(name, pattern):
+            return float(limit)
+    return float(thresholds.get("default", 0.15))
+
+
+def compare(results, baseline, thresholds):
+    """
+    Compare results against a baseline run.
+
+    :return: List of comparison rows; rows with 'regression' True failed
+    """
+    metric = thresholds.get("metric", "p50_ms")
+    min_delta = float(thresholds.get("min_delta_ms", 0.0))
+    rows = []
+
+    for name, stats in results.items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None or not reference.get(metric):
+            continue
+
+        before, after = reference[metric], stats[metric]
+        change = (after - before) / before
+        limit = allowed_slowdown(name, thresholds)
+
+        rows.append({
+            "name": name,
+            "metric": metric,
+            "baseline": before,
+            "current": after,
+            "change": change,
+            "limit": limit,
+            "regression": change > limit and after - before > min_delta,
+        })
+
+    return rows
+
+
+def print_comparison(rows):
+    print("\n" + "=" * 72)
+    print(f"{'Benchmark':<36}{'Baseline':>10}{'Current':>10}{'Change':>9}  Status")
+    print("-" * 72)
+    for row in rows:
+        status = "REGRESSION" if row["regression"] else "ok"
+        print(f"{row['name']:<36}{row['baseline']:>10.3f}{row['current']:>10.3f}"
+              f"{row['change']:>+9.1%}  {status}")
+    print("=" * 72)
+
+
+# --------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vision I benchmark suite")
+    parser.add_argument("--scenes", nargs="+", default=list(SCENES), choices=list(SCENES))
+    parser.add_argument("--stages", nargs="+", default=list(STAGES), choices=list(STAGES))
+    parser.add_argument("--frames", type=int, default=300, help="Frames per scene")
+    parser.add_argument("--warmup", type=int, default=10, help="Leading samples to discard")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--video", help="Recorded video for end_to_end (default: synthetic fixture)")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--baseline", help="Baseline JSON to compare against")
+    parser.add_argument("--thresholds", default=str(DEFAULT_THRESHOLDS))
+    parser.add_argument("--save-baseline", action="store_true",
+                        help=f"Also write the results to {DEFAULT_BASELINE}")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.scenes, args.stages, args.frames, args.seed,
+                        args.warmup, args.video)
+
+    report = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "frames": args.frames,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+    outputs = [Path(args.output)] + ([DEFAULT_BASELINE] if args.save_baseline else [])
+    for path in outputs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2))
+        print(f"[INFO] Results written to {path}")
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+
+        rows = compare(results, baseline, load_thresholds(args.thresholds))
+        print_comparison(rows)
+        report["comparison"] = rows
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+        if any(row["regression"] for row in rows):
+            print("[X ERROR] Performance regression detected")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Synthetic scenes for Vision I benchmarks.
+
+Generates deterministic per-frame detection scripts (sparse,
+crowded and vehicle-heavy streets) with objects that move,
+grow while approaching and enter/leave the view, plus video
+fixtures rendered from those scripts.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+
+# Subset of the COCO class map used by yolov8n
+NAMES = {
+    0: "person",
+    1: "bicycle",
+    2: "car",
+    3: "motorcycle",
+    5: "bus",
+    7: "truck",
+    13: "bench",
+    56: "chair",
+}
+
+# kind -> (min objects, max objects, {class id: weight}, max speed px/frame)
+SCENES = {
+    "sparse": (0, 3, {0: 0.5, 56: 0.3, 13: 0.2}, 4.0),
+    "crowded": (20, 40, {0: 0.85, 1: 0.1, 56: 0.05}, 3.0),
+    "vehicles": (5, 12, {2: 0.5, 7: 0.15, 5: 0.1, 3: 0.1, 0: 0.15}, 9.0),
+}
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+def generate_scene(kind="sparse", frames=300, width=640, height=480, seed=0):
+    """
+    Generate a detection script for a synthetic scene.
+
+    :param kind: 'sparse', 'crowded' or 'vehicles'
+    :param frames: Number of frames
+    :param seed: Random seed (same seed, same script)
+    :return: List of (N, 6) float32 arrays (x1, y1, x2, y2, conf, cls)
+    """
+    if kind not in SCENES:
+        raise ValueError(f"Unknown scene '{kind}'. Choose from: {', '.join(SCENES)}")
+
+    low, high, weights, max_speed = SCENES[kind]
+    classes = np.array(list(weights), dtype=np.float32)
+    probs = np.array(list(weights.values()))
+    probs = probs / probs.sum()
+
+    rng = np.random.default_rng(seed)
+
+    def spawn(count):
+        size = rng.uniform(30, 160, (count, 2))
+        centers = rng.uniform((0, 0), (width, height), (count, 2))
+        velocity = rng.uniform(-max_speed, max_speed, (count, 2))
+        growth = rng.uniform(-0.03, 0.06, count)       # > 0: approaching
+        return centers, size, velocity, growth, rng.choice(classes, count, p=probs)
+
+    count = int(rng.integers(low, high + 1))
+    centers, size, velocity, growth, cls = spawn(count)
+    script = []
+
+    for _ in range(frames):
+        centers = centers + velocity
+        size = np.clip(size * (1 + growth)[:, None], 10, (width, height))
+
+        # Objects leaving the view are replaced by new arrivals
+        inside = (
+            (centers[:, 0] > 0) & (centers[:, 0] < width)
+            & (centers[:, 1] > 0) & (centers[:, 1] < height)
+            & (size[:, 0] < width * 0.9)
+        )
+        if not inside.all():
+            fresh = spawn(int((~inside).sum()))
+            for column, values in zip((centers, size, velocity, growth, cls), fresh):
+                column[~inside] = values
+
+        half = size / 2
+        boxes = np.clip(
+            np.hstack([centers - half, centers + half]), 0, (width, height, width, height)
+        )
+        confidences = rng.uniform(0.3, 0.99, len(boxes))
+
+        script.append(np.column_stack([boxes, confidences, cls]).astype(np.float32))
+
+    return script
+
+
+def render_frame(detections, width=640, height=480):
+    """
+    Draw a detection script frame as flat-shaded boxes.
+
+    :param detections: (N, 6) array from generate_scene()
+    :return: (height, width, 3) uint8 BGR image
+    """
+    image = np.full((height, width, 3), 40, dtype=np.uint8)
+
+    for x1, y1, x2, y2, _, cls in detections:
+        shade = 80 + (int(cls) * 37) % 170
+        image[int(y1):int(y2), int(x1):int(x2)] = (shade, 255 - shade, 128)
+
+    return image
+
+
+def video_fixture(kind="sparse", frames=120, width=640, height=480, seed=0, fps=15):
+    """
+    Path to a recorded video of a synthetic scene, written once.
+
+    :return: Path of the MJPG .avi fixture
+    """
+    import cv2
+
+    path = FIXTURE_DIR / f"{kind}-{frames}-{width}x{height}-{seed}.avi"
+    if path.exists():
+        return path
+
+    FIXTURE_DIR.mkdir(parents=True, exist_ok=True)
+    writer = cv2.VideoWriter(
+        str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height)
+    )
+    if not writer.isOpened():
+        raise RuntimeError(f"Unable to write video fixture: {path}")
+
+    for detections in generate_scene(kind, frames, width, height, seed):
+        writer.write(render_frame(detections, width, height))
+    writer.release()
+
+    return path
@@ -0,0 +1,90 @@
+"""
+Stub detector for Vision I benchmarks.
+
+Replays a detection script through ultralytics-shaped results,
+so the real postprocessing path (DetectionBatch conversion,
+confidence filtering, dict output) is exercised without a
+camera, GPU, model weights or network access.
+"""
+
+import numpy as np
+
+from src.vision.detector import ObjectDetector
+
+
+class _Tensor:
+    __slots__ = ("array",)
+
+    def __init__(self, array):
+        self.array = array
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.array
+
+
+class _Boxes:
+    __slots__ = ("data",)
+
+    def __init__(self, array):
+        self.data = _Tensor(array)
+
+    def __len__(self):
+        return len(self.data.array)
+
+
+class StubResult:
+    __slots__ = ("boxes", "speed")
+
+    def __init__(self, array):
+        self.boxes = _Boxes(array)
+        self.speed = {"preprocess": 0.0, "inference": 0.0, "postprocess": 0.0}
+
+
+class StubBackend:
+    name = "stub"
+    imgsz = 640
+    dynamic_imgsz = True
+    model = None
+
+    def __init__(self, script, names):
+        """
+        :param script: List of (N, 6) arrays, replayed in a loop
+        :param names: Mapping of class id to label
+        """
+        self.script = script
+        self.names = names
+        self.index = 0
+
+    def predict(self, frame, imgsz: int = None):
+        results = []
+        for _ in frame if isinstance(frame, list) else [frame]:
+            detections = self.script[self.index % len(self.script)]
+            self.index += 1
+            results.append(StubResult(np.array(detections, dtype=np.float32)))
+        return results
+
+    def warmup(self, runs: int = 2):
+        return 0.0
+
+
+class StubDetector(ObjectDetector):
+    def __init__(self, script, names, confidence_threshold: float = 0.5):
+        """
+        ObjectDetector with scripted output instead of a model.
+
+        The stub backend goes through ObjectDetector's constructor
+        and detect_batch()/detect() are its own, so the benchmarks
+        time the real postprocessing code.
+
+        :param script: List of (N, 6) arrays from generate_scene()
+        :param names: Mapping of class id to label
+        :param confidence_threshold: Minimum confidence to keep
+        """
+        super().__init__(
+            confidence_threshold=confidence_threshold,
+            backend=StubBackend(script, names),
+            warmup=False,
+        )
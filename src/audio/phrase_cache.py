@@ -0,0 +1,139 @@
+"""
+Phrase audio cache for Vision I.
+
+The decision engine only produces a small, closed set of
+phrases (rule templates x labels x verbosity). They are
+rendered to WAV once, kept on disk between runs and loaded
+into memory so alerts can be played back immediately instead
+of being synthesized every time.
+"""
+
+import hashlib
+import wave
+from pathlib import Path
+
+from src.audio.sinks import AudioClip
+from src.features.direction import DIRECTIONS
+from src.safety.alert_manager import CRITICAL
+
+
+def alert_vocabulary(rule_table, labels):
+    """
+    Every phrase the rule table can produce.
+
+    Templates using {distance} are continuous and are left to
+    live TTS. Non-critical phrases also get the truncated
+    low-verbosity variant.
+
+    :param rule_table: RuleTable
+    :param labels: Iterable of object labels
+    :return: Set of phrase strings
+    """
+    labels = sorted(set(labels))
+    phrases = set()
+
+    for rule in rule_table.rules:
+        if "{distance" in rule.message:
+            continue
+
+        label_values = labels if "{label}" in rule.message else [""]
+        direction_values = DIRECTIONS if "{direction}" in rule.message else [None]
+
+        for label in label_values:
+            for direction in direction_values:
+                text = rule.render(label, direction, None)
+                phrases.add(text)
+                if rule.severity < CRITICAL:
+                    phrases.add(text.split(".")[0])
+
+    return phrases
+
+
+class PhraseCache:
+    def __init__(self, cache_dir="cache/phrases", rate: int = 160):
+        """
+        :param cache_dir: Directory holding rendered WAV files
+        :param rate: Speech rate the phrases are rendered at
+        """
+        self.cache_dir = Path(cache_dir)
+        self.rate = rate
+        self.clips = {}
+
+    def _path(self, text):
+        digest = hashlib.sha1(f"{self.rate}|{text}".encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{digest}.wav"
+
+    def render_missing(self, engine, texts):
+        """
+        Render phrases not yet on disk with a TTS engine.
+
+        :param engine: Initialized pyttsx3 engine
+        :param texts: Phrases to make available
+        :return: Number of phrases rendered
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        missing = [text for text in texts if not self._path(text).exists()]
+        for text in missing:
+            engine.save_to_file(text, str(self._path(text)))
+
+        if missing:
+            engine.runAndWait()
+
+        return len(missing)
+
+    def load(self, texts):
+        """
+        Load rendered phrases into memory.
+
+        :return: Number of phrases loaded
+        """
+        for text in texts:
+            path = self._path(text)
+            if text in self.clips or not path.exists():
+                continue
+
+            try:
+                with wave.open(str(path), "rb") as f:
+                    self.clips[text] = AudioClip(
+                        text,
+                        f.readframes(f.getnframes()),
+                        f.getnchannels(),
+                        f.getsampwidth(),
+                        f.getframerate(),
+                    )
+            except (wave.Error, EOFError) as e:
+                # Unusable render (e.g. non-WAV driver output): use live TTS
+                print(f"[PHRASE CACHE] Skipping '{text}': {e}")
+
+        return len(self.clips)
+
+    def pending(self, texts):
+        """
+        Load phrases already rendered on disk.
+
+        :return: Phrases that still need rendering, in the given order
+        """
+        texts = list(texts)
+        self.load(texts)
+        return [text for text in texts if text not in self.clips]
+
+    def render(self, engine, text):
+        """
+        Render one phrase and load it.
+
+        :param engine: Initialized pyttsx3 engine (not speaking meanwhile)
+        :return: True if the phrase can now be played from the cache
+        """
+        self.render_missing(engine, [text])
+        self.load([text])
+        return text in self.clips
+
+    def get(self, text):
+        """
+        :return: AudioClip for the phrase, or None for unknown text
+        """
+        return self.clips.get(text)
+
+    def __len__(self):
+        return len(self.clips)
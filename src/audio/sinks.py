@@ -0,0 +1,106 @@
+"""
+Audio output sinks for Vision I.
+
+Plays pre-rendered PCM clips with low latency. The null sink
+accepts clips without producing sound, for tests, benchmarks
+and headless runs.
+"""
+
+import time
+
+
+class AudioClip:
+    __slots__ = ("text", "frames", "channels", "sample_width", "sample_rate")
+
+    def __init__(self, text, frames, channels, sample_width, sample_rate):
+        """
+        A pre-rendered phrase.
+
+        :param text: Phrase text
+        :param frames: Raw PCM bytes
+        :param channels: Number of channels
+        :param sample_width: Bytes per sample
+        :param sample_rate: Samples per second
+        """
+        self.text = text
+        self.frames = frames
+        self.channels = channels
+        self.sample_width = sample_width
+        self.sample_rate = sample_rate
+
+    def duration(self):
+        bytes_per_second = self.channels * self.sample_width * self.sample_rate
+        return len(self.frames) / bytes_per_second if bytes_per_second else 0.0
+
+
+class AudioSink:
+    def play(self, clip):
+        """
+        Start playing a clip without blocking.
+        """
+        raise NotImplementedError
+
+    def is_playing(self):
+        return False
+
+    def stop(self):
+        pass
+
+
+class NullAudioSink(AudioSink):
+    def __init__(self, realtime: bool = False):
+        """
+        :param realtime: Report clips as playing for their duration
+        """
+        self.realtime = realtime
+        self.played = []
+        self.ends_at = 0.0
+
+    def play(self, clip):
+        self.played.append(clip.text)
+        if self.realtime:
+            self.ends_at = time.time() + clip.duration()
+
+    def is_playing(self):
+        return time.time() < self.ends_at
+
+    def stop(self):
+        self.ends_at = 0.0
+
+
+class SimpleAudioSink(AudioSink):
+    def __init__(self):
+        try:
+            import simpleaudio
+        except ImportError as e:
+            raise ImportError(
+                "simpleaudio is required for the 'simpleaudio' audio sink"
+            ) from e
+
+        self.simpleaudio = simpleaudio
+        self.current = None
+
+    def play(self, clip):
+        self.stop()
+        self.current = self.simpleaudio.play_buffer(
+            clip.frames, clip.channels, clip.sample_width, clip.sample_rate
+        )
+
+    def is_playing(self):
+        return self.current is not None and self.current.is_playing()
+
+    def stop(self):
+        if self.current is not None:
+            self.current.stop()
+            self.current = None
+
+
+def create_sink(name: str = "simpleaudio"):
+    """
+    Create an audio sink by name ('simpleaudio' or 'null').
+    """
+    if name == "null":
+        return NullAudioSink()
+    if name == "simpleaudio":
+        return SimpleAudioSink()
+    raise ValueError(f"Unknown audio sink: {name}")
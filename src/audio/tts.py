@@ -2,39 +2,342 @@
 Text-to-Speech module for Vision I.
 
 Handles voice output safely in a real-time loop.
+
+A single long-lived worker thread owns the TTS engine and
+speaks messages from a priority queue keyed on alert severity.
+CRITICAL warnings interrupt lower-severity speech, and stale
+or duplicate queued messages are dropped. Phrases found in the
+optional phrase cache are played from pre-rendered audio; any
+other text falls back to live TTS. pyttsx3 drivers are not
+thread-safe, so missing phrases are rendered by the same worker
+with the same engine, one at a time whenever no message is
+waiting; until a phrase's clip is ready it is spoken live.
 """
 
-import pyttsx3
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+
+from src.safety.alert_manager import AlertManager, CRITICAL
 
 
 class VoiceAssistant:
-    def __init__(self):
+    def __init__(
+        self,
+        rate: int = 160,
+        max_age: float = 2.0,
+        max_queue: int = 4,
+        phrase_cache=None,
+        phrases=(),
+        sink=None,
+        metrics=None,
+    ):
         """
         Initialize voice assistant.
+
+        :param rate: Speech rate (words per minute)
+        :param max_age: Seconds after which a queued non-critical
+                        message is considered stale and dropped
+        :param max_queue: Maximum number of queued messages
+        :param phrase_cache: Optional PhraseCache of pre-rendered phrases
+        :param phrases: Phrases to pre-render into the cache at startup, or a
+                        callable returning them (resolved on the worker)
+        :param sink: AudioSink used to play cached phrases
+        :param metrics: Optional MetricsCollector for enqueue-to-speech latency
         """
+        self.rate = rate
+        self.max_age = max_age
+        self.max_queue = max_queue
+        self.alert_manager = AlertManager()
+
+        self.phrase_cache = phrase_cache if sink is not None else None
+        self.phrases = phrases
+        self.sink = sink
+        self.metrics = metrics
+
         self.engine = None
+        self.ready = threading.Event()
+        self.init_time = 0.0
+        self.queue = []                 # heap of (-severity, seq, enqueued, message)
+        self.sequence = itertools.count()
+        self.condition = threading.Condition()
+        self.running = True
 
-    def speak(self, message: str):
+        self.speaking_severity = None
+        self.preempt = False
+        self.pending_start = None
+        self.unrendered = deque()       # phrases still to render into the cache
+        self.rendered = 0
+
+        # Statistics
+        self.start_latencies = deque(maxlen=512)
+        self.spoken = 0
+        self.cached = 0
+        self.dropped = 0
+        self.interrupted = 0
+
+        self.worker = threading.Thread(
+            target=self._run, name="vision-tts", daemon=True
+        )
+        self.worker.start()
+
+    # --------------------------------------------------
+
+    def speak(self, message, severity: int = None):
         """
-        Convert text message to speech safely.
+        Queue a message for speech. Returns immediately.
 
-        :param message: Text to be spoken
+        :param message: Decision or text to be spoken
+        :param severity: Alert severity (default: the decision's, or
+                         classified from text)
         """
         if not message:
             return
 
-        try:
-            if self.engine is None:
-                self.engine = pyttsx3.init()
-                self.engine.setProperty("rate", 160)
+        if severity is None:
+            severity = self.alert_manager.classify(message)
+        if not isinstance(message, str):
+            message = message.render()
+
+        with self.condition:
+            # Coalesce: a newer copy of the same message replaces the old one
+            before = len(self.queue)
+            self.queue = [item for item in self.queue if item[3] != message]
+            self.dropped += before - len(self.queue)
+
+            heapq.heapify(self.queue)
+            heapq.heappush(
+                self.queue, (-severity, next(self.sequence), time.time(), message)
+            )
+
+            # Keep only the most important messages (oldest first among equals)
+            while len(self.queue) > self.max_queue:
+                self.queue.remove(max(self.queue, key=lambda item: (item[0], -item[1])))
+                heapq.heapify(self.queue)
+                self.dropped += 1
+
+            if (
+                severity >= CRITICAL
+                and self.speaking_severity is not None
+                and self.speaking_severity < severity
+            ):
+                self.preempt = True
 
-            print(f"[VOICE] {message}")
-            self.engine.say(message)
-            self.engine.runAndWait()
+            self.condition.notify()
+
+    def _next_message(self, timeout: float = None):
+        """
+        Pop the most urgent fresh message, dropping stale ones.
+
+        :param timeout: Seconds to wait for a message (None: until closed)
+        :return: (severity, enqueued, message), or None if closed or
+                 nothing arrived in time
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self.condition:
+            while self.running:
+                while self.queue:
+                    neg_severity, _, enqueued, message = heapq.heappop(self.queue)
+                    severity = -neg_severity
+                    if severity < CRITICAL and time.time() - enqueued > self.max_age:
+                        self.dropped += 1
+                        continue
+                    self.speaking_severity = severity
+                    self.preempt = False
+                    return severity, enqueued, message
 
-            # IMPORTANT: reset engine for next cycle
+                if deadline is None:
+                    self.condition.wait(0.5)
+                elif time.time() < deadline:
+                    self.condition.wait(min(0.5, deadline - time.time()))
+                else:
+                    break
+
+        return None
+
+    # --------------------------------------------------
+
+    def _record_start(self, enqueued):
+        latency = time.time() - enqueued
+        self.start_latencies.append(latency)
+        if self.metrics is not None:
+            self.metrics.observe("tts_queue", latency)
+
+    def _on_start(self, name):
+        if self.pending_start is not None:
+            self._record_start(self.pending_start)
+            self.pending_start = None
+        self.unrendered = deque()       # phrases still to render into the cache
+        self.rendered = 0
+
+    def _on_word(self, name, location, length):
+        # pyttsx3 only supports interrupting speech from its own callbacks
+        if self.preempt:
+            self.preempt = False
+            self.interrupted += 1
             self.engine.stop()
-            self.engine = None
 
+    def _init_engine(self):
+        import pyttsx3
+
+        self.engine = pyttsx3.init()
+        self.engine.setProperty("rate", self.rate)
+        self.engine.connect("started-utterance", self._on_start)
+        self.engine.connect("started-word", self._on_word)
+
+    def _play_cached(self, clip, enqueued):
+        """
+        Play a pre-rendered phrase, stopping early on preemption.
+        """
+        print(f"[VOICE] {clip.text}")
+        self._record_start(enqueued)
+        self.sink.play(clip)
+
+        while self.sink.is_playing():
+            if self.preempt:
+                self.preempt = False
+                self.interrupted += 1
+                self.sink.stop()
+                break
+            time.sleep(0.005)
+
+        self.cached += 1
+        self.spoken += 1
+
+    def _start_engine(self):
+        """
+        Initialize the engine up front so the first alert is not delayed.
+        """
+        start = time.perf_counter()
+        try:
+            self._init_engine()
         except Exception as e:
             print(f"[TTS ERROR] {e}")
+            self.engine = None
+        self.init_time = time.perf_counter() - start
+        self.ready.set()
+
+    def _prepare_phrases(self):
+        """
+        Load cached phrases and queue the missing ones for rendering.
+        """
+        try:
+            phrases = self.phrases() if callable(self.phrases) else self.phrases
+            self.unrendered = deque(self.phrase_cache.pending(sorted(phrases)))
+        except Exception as e:
+            print(f"[PHRASE CACHE ERROR] {e}")
+            return
+
+        if not self.unrendered:
+            print(f"[PHRASE CACHE] {len(self.phrase_cache)} phrases ready")
+
+    def _render_next(self):
+        """
+        Render one missing phrase with the worker's engine.
+
+        Only called while no message is waiting, so a render delays
+        an alert by at most one short phrase.
+        """
+        text = self.unrendered.popleft()
+        try:
+            if self.engine is None:
+                self._init_engine()
+            self.phrase_cache.render(self.engine, text)
+            self.rendered += 1
+        except Exception as e:
+            print(f"[PHRASE CACHE ERROR] {e}")
+            # Leave the rest to live TTS and rebuild the engine for speech
+            self.unrendered.clear()
+            self.engine = None
+
+        if not self.unrendered:
+            print(f"[PHRASE CACHE] {len(self.phrase_cache)} phrases ready "
+                  f"({self.rendered} rendered)")
+
+    def wait_ready(self, timeout: float = None):
+        """
+        Wait for the speech engine to finish initializing.
+
+        :return: Seconds the engine took to initialize
+        """
+        self.ready.wait(timeout)
+        return self.init_time
+
+    def _run(self):
+        self._start_engine()
+
+        if self.phrase_cache is not None and self.phrases:
+            self._prepare_phrases()
+
+        while self.running:
+            # Render missing phrases only while nothing is waiting to be said
+            item = self._next_message(0 if self.unrendered else None)
+            if item is None:
+                if self.running and self.unrendered:
+                    self._render_next()
+                    continue
+                break
+
+            _, enqueued, message = item
+
+            clip = self.phrase_cache.get(message) if self.phrase_cache is not None else None
+            if clip is not None:
+                try:
+                    self._play_cached(clip, enqueued)
+                    continue
+                except Exception as e:
+                    print(f"[AUDIO ERROR] {e}")
+                finally:
+                    self.speaking_severity = None
+
+            try:
+                if self.engine is None:
+                    self._init_engine()
+
+                print(f"[VOICE] {message}")
+                self.pending_start = enqueued
+                self.engine.say(message)
+                self.engine.runAndWait()
+                self.spoken += 1
+
+            except Exception as e:
+                print(f"[TTS ERROR] {e}")
+                # Rebuild the engine on the next message
+                self.engine = None
+
+            finally:
+                self.speaking_severity = None
+
+    # --------------------------------------------------
+
+    def average_start_latency(self):
+        """
+        Mean seconds from enqueue to speech start.
+        """
+        if not self.start_latencies:
+            return 0.0
+        return sum(self.start_latencies) / len(self.start_latencies)
+
+    def report(self):
+        print(f"Speech spoken/dropped  : {self.spoken}/{self.dropped} "
+              f"({self.cached} cached, {self.interrupted} interrupted)")
+        print(f"Speech start latency   : {self.average_start_latency() * 1000:.0f} ms")
+
+    def close(self, timeout: float = 2.0):
+        """
+        Stop the speech worker.
+        """
+        with self.condition:
+            self.running = False
+            self.queue = []
+            self.condition.notify()
+        if self.sink is not None:
+            self.sink.stop()
+        if self.engine is not None:
+            try:
+                self.engine.stop()
+            except Exception:
+                pass
+        self.worker.join(timeout)
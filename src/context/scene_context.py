@@ -3,41 +3,164 @@ Scene context inference for Vision I.
 
 Infers environment context based on detected objects
 and motion patterns.
+
+Per-frame evidence (vehicles, people, moving people, any
+object) is kept as running sums over a sliding window of
+recent frames, so each update is O(1) in the window length.
+A new context must be the window's verdict for a dwell time
+before it replaces the current one, and leaving OUTDOOR or
+CROWDED requires the evidence to drop clearly below the
+entering level, so the context (and the thresholds derived
+from it) no longer flips from frame to frame. An approaching
+vehicle switches to OUTDOOR immediately.
 """
 
+from collections import deque
+
+from src.features.motion import MOTIONS, APPROACHING, STATIONARY, UNKNOWN
+
+
+VEHICLES = frozenset({"car", "bus", "truck", "motorcycle"})
+PEOPLE = frozenset({"person"})
+
+# Motion values (codes or names) that do not count as moving
+STILL = frozenset({UNKNOWN, STATIONARY, MOTIONS[UNKNOWN], MOTIONS[STATIONARY]})
+APPROACH = frozenset({APPROACHING, MOTIONS[APPROACHING]})
+
 
 class SceneContext:
-    def __init__(self):
+    def __init__(
+        self,
+        window: int = 15,
+        dwell: int = 5,
+        crowd_size: float = 4,
+        vehicle_share: float = 0.3,
+        object_share: float = 0.5,
+    ):
+        """
+        :param window: Frames of evidence considered
+        :param dwell: Consecutive frames a new context must be the
+                      verdict before it is adopted
+        :param crowd_size: Average people per frame for CROWDED
+        :param vehicle_share: Share of frames with a vehicle for OUTDOOR
+        :param object_share: Share of frames with any object for INDOOR
+        """
+        self.window = max(1, int(window))
+        self.dwell = max(1, int(dwell))
+        self.crowd_size = crowd_size
+        self.vehicle_share = vehicle_share
+        self.object_share = object_share
+
         self.current_context = "CLEAR"
+        self.candidate = None
+        self.candidate_frames = 0
+
+        # Per-frame evidence and its running sums over the window
+        self.frames = deque()
+        self.vehicle_frames = 0
+        self.people = 0
+        self.moving_people = 0
+        self.object_frames = 0
+
+    # --------------------------------------------------
+
+    def _observe(self, labels, motions):
+        """
+        Count one frame's evidence and slide the window.
+
+        :return: True if an approaching vehicle is in view
+        """
+        vehicles = people = moving_people = 0
+        approaching_vehicle = False
+        if hasattr(motions, "tolist"):
+            motions = motions.tolist()
+
+        for i, label in enumerate(labels):
+            motion = motions[i] if motions is not None else UNKNOWN
+            if label in VEHICLES:
+                vehicles += 1
+                if motion in APPROACH:
+                    approaching_vehicle = True
+            elif label in PEOPLE:
+                people += 1
+                if motion not in STILL:
+                    moving_people += 1
+
+        evidence = (vehicles > 0, people, moving_people, len(labels) > 0)
+        self.frames.append(evidence)
+        self.vehicle_frames += evidence[0]
+        self.people += people
+        self.moving_people += moving_people
+        self.object_frames += evidence[3]
+
+        if len(self.frames) > self.window:
+            old = self.frames.popleft()
+            self.vehicle_frames -= old[0]
+            self.people -= old[1]
+            self.moving_people -= old[2]
+            self.object_frames -= old[3]
+
+        return approaching_vehicle
+
+    def _verdict(self):
+        """
+        Context suggested by the current window, with hysteresis
+        on leaving OUTDOOR and CROWDED.
+        """
+        n = len(self.frames)
+        current = self.current_context
+
+        vehicle_share = self.vehicle_frames / n
+        people = self.people / n
+        # Moving people take more space and attention than standing ones
+        crowd = people + 0.5 * self.moving_people / n
+
+        outdoor_level = self.vehicle_share / 2 if current == "OUTDOOR" else self.vehicle_share
+        crowd_level = self.crowd_size - 1 if current == "CROWDED" else self.crowd_size
+
+        if vehicle_share >= outdoor_level:
+            return "OUTDOOR"
+        if crowd >= crowd_level:
+            return "CROWDED"
+        if self.object_frames / n >= self.object_share:
+            return "INDOOR"
+        return "CLEAR"
 
     def infer(self, detections, motions=None):
         """
         Infer scene context.
 
-        :param detections: List of detection dicts
-        :param motions: Optional list of motion states
+        :param detections: DetectionBatch or list of detection dicts
+                           (empty frames count as evidence too)
+        :param motions: Optional motion codes or names, one per detection
         :return: Context string
         """
+        if hasattr(detections, "labels"):
+            labels = detections.labels
+        else:
+            labels = [obj.get("label", "") for obj in detections or ()]
 
-        if not detections:
-            self.current_context = "CLEAR"
-            return self.current_context
-
-        labels = [obj.get("label", "") for obj in detections]
-        num_objects = len(labels)
-
-        # Vehicle presence → OUTDOOR
-        if any(label in ["car", "bus", "truck", "motorcycle"] for label in labels):
+        if self._observe(labels, motions):
+            # Safety first: no dwell before reacting to traffic
             self.current_context = "OUTDOOR"
+            self.candidate = None
             return self.current_context
 
-        # Many people → CROWDED
-        if labels.count("person") >= 4:
-            self.current_context = "CROWDED"
+        verdict = self._verdict()
+        if verdict == self.current_context:
+            self.candidate = None
             return self.current_context
 
-        # Default fallback
-        self.current_context = "INDOOR"
+        if verdict == self.candidate:
+            self.candidate_frames += 1
+        else:
+            self.candidate = verdict
+            self.candidate_frames = 1
+
+        if self.candidate_frames >= self.dwell:
+            self.current_context = verdict
+            self.candidate = None
+
         return self.current_context
 
     def get(self):
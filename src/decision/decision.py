@@ -0,0 +1,61 @@
+"""
+Decision records for Vision I.
+
+DecisionEngine.evaluate() returns a Decision instead of a
+sentence. Severity, direction, label, distance and motion stay
+structured all the way to the speech and log boundaries, where
+the rule's message template is rendered, so no module has to
+recover them from the text.
+"""
+
+
+class Decision:
+    __slots__ = (
+        "template_id", "template", "severity",
+        "label", "direction", "distance", "motion", "brief",
+    )
+
+    def __init__(self, template_id, template, severity, label=None, direction=None,
+                 distance=None, motion=None, brief: bool = False):
+        """
+        :param template_id: ID of the rule that produced the decision
+        :param template: Message template of that rule
+        :param severity: Severity of the rule
+        :param label: Object label
+        :param direction: 'LEFT', 'CENTER', 'RIGHT' or None
+        :param distance: Relative distance or None
+        :param motion: Motion state name or None
+        :param brief: Speak only the first sentence (low verbosity)
+        """
+        self.template_id = template_id
+        self.template = template
+        self.severity = severity
+        self.label = label
+        self.direction = direction
+        self.distance = distance
+        self.motion = motion
+        self.brief = brief
+
+    def render(self, brief: bool = None):
+        """
+        Message text for speech or logs.
+
+        :param brief: Override the decision's verbosity
+        """
+        text = self.template.format(
+            label=self.label,
+            direction=(self.direction or "").lower(),
+            distance=self.distance,
+        )
+        if self.brief if brief is None else brief:
+            text = text.split(".")[0]
+        return text
+
+    def __str__(self):
+        return self.render()
+
+    def __repr__(self):
+        return (
+            f"Decision({self.template_id}, {self.severity.name}, "
+            f"{self.label}, {self.direction})"
+        )
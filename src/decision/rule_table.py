@@ -0,0 +1,279 @@
+"""
+Declarative rule table for Vision I.
+
+Loads navigation rules from YAML and compiles them into an
+ordered evaluator. Each rule's direction, motion and label
+predicates become lookup tables indexed by the per-frame code
+arrays, and rules that cannot match the current frame (wrong
+context, no detection in their direction or with their label)
+are skipped before any per-detection work is done.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from src.decision.decision import Decision
+from src.features.direction import DIRECTIONS
+from src.features.motion import MOTIONS
+from src.safety.alert_manager import LOW, MEDIUM, HIGH, CRITICAL
+from src.utils.config_loader import load_yaml
+
+
+SEVERITIES = {
+    "LOW": LOW,
+    "MEDIUM": MEDIUM,
+    "HIGH": HIGH,
+    "CRITICAL": CRITICAL,
+}
+
+
+def _as_list(value):
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+
+def _code_table(values, vocabulary, field):
+    """
+    Boolean lookup table over a code vocabulary (all True if unconstrained).
+    """
+    table = np.zeros(len(vocabulary), dtype=bool)
+    if values is None:
+        table[:] = True
+        return table
+
+    for value in values:
+        if value not in vocabulary:
+            raise ValueError(f"Unknown {field} '{value}' in rule table")
+        table[vocabulary.index(value)] = True
+    return table
+
+
+class Rule:
+    __slots__ = (
+        "rule_id", "priority", "severity", "message",
+        "direction_table", "motion_table",
+        "labels", "exclude_labels", "contexts",
+        "distance_below", "distance_above",
+    )
+
+    def __init__(self, spec):
+        """
+        :param spec: Rule mapping loaded from the YAML rule table
+        """
+        when = spec.get("when", {}) or {}
+
+        self.rule_id = spec["id"]
+        self.priority = spec.get("priority", 100)
+        self.message = spec["message"]
+
+        severity = str(spec.get("severity", "MEDIUM")).upper()
+        if severity not in SEVERITIES:
+            raise ValueError(f"Unknown severity '{severity}' in rule '{self.rule_id}'")
+        self.severity = SEVERITIES[severity]
+
+        self.direction_table = _code_table(
+            _as_list(when.get("direction")), DIRECTIONS, "direction"
+        )
+        self.motion_table = _code_table(
+            _as_list(when.get("motion")), MOTIONS, "motion"
+        )
+
+        labels = _as_list(when.get("labels"))
+        excluded = _as_list(when.get("exclude_labels"))
+        contexts = _as_list(when.get("context"))
+
+        self.labels = frozenset(labels) if labels is not None else None
+        self.exclude_labels = frozenset(excluded or ())
+        self.contexts = frozenset(contexts) if contexts is not None else None
+
+        self.distance_below = when.get("distance_below")
+        self.distance_above = when.get("distance_above")
+
+    def label_allowed(self, label):
+        if label in self.exclude_labels:
+            return False
+        return self.labels is None or label in self.labels
+
+    def decide(self, label, direction, distance, motion):
+        """
+        Decision record for a matched detection.
+        """
+        return Decision(
+            self.rule_id, self.message, self.severity,
+            label, direction, distance, motion,
+        )
+
+    def render(self, label, direction, distance):
+        """
+        Fill the message template for a matched detection.
+        """
+        return self.message.format(
+            label=label,
+            direction=(direction or "").lower(),
+            distance=distance,
+        )
+
+
+class RuleTable:
+    def __init__(self, rules):
+        """
+        Compile a list of Rule objects into an ordered evaluator.
+
+        :param rules: Iterable of Rule
+        """
+        self.rules = sorted(rules, key=lambda rule: rule.priority)
+
+        self._context_cache = {}
+        self._label_cache = (None, None)
+
+    @classmethod
+    def load(cls, path="config/rules.yaml"):
+        """
+        Load a rule table from YAML.
+        """
+        rules_path = Path(path)
+        if not rules_path.exists():
+            raise FileNotFoundError(f"Rule table not found: {path}")
+
+        data = load_yaml(rules_path)
+
+        return cls(Rule(spec) for spec in data.get("rules", []))
+
+    # --------------------------------------------------
+
+    def _active(self, context):
+        """
+        Rules enabled in a scene context, split into (critical, regular).
+        """
+        cached = self._context_cache.get(context)
+        if cached is None:
+            active = [
+                rule for rule in self.rules
+                if rule.contexts is None or context in rule.contexts
+            ]
+            cached = (
+                [rule for rule in active if rule.severity >= CRITICAL],
+                [rule for rule in active if rule.severity < CRITICAL],
+            )
+            self._context_cache[context] = cached
+        return cached
+
+    def _label_tables(self, names):
+        """
+        Per-rule boolean lookup over class ids, cached per label mapping.
+        """
+        cached_names, tables = self._label_cache
+        if cached_names is names:
+            return tables
+
+        size = max(names, default=-1) + 1
+        tables = {}
+        for rule in self.rules:
+            if rule.labels is None and not rule.exclude_labels:
+                continue
+            table = np.zeros(size, dtype=bool)
+            for class_id, label in names.items():
+                table[class_id] = rule.label_allowed(label)
+            tables[rule.rule_id] = table
+
+        self._label_cache = (names, tables)
+        return tables
+
+    def _threshold(self, value, thresholds):
+        if isinstance(value, str):
+            return thresholds[value]
+        return float(value)
+
+    def _mask(self, rule, batch, distances, directions, motions,
+              thresholds, label_tables):
+        """
+        Boolean mask of detections matching a rule.
+        """
+        mask = rule.direction_table[directions]
+        mask &= rule.motion_table[motions]
+
+        table = label_tables.get(rule.rule_id)
+        if table is not None:
+            mask &= table[batch.class_ids]
+
+        if rule.distance_below is not None:
+            mask &= distances < self._threshold(rule.distance_below, thresholds)
+        if rule.distance_above is not None:
+            mask &= distances > self._threshold(rule.distance_above, thresholds)
+
+        return mask
+
+    def _can_match(self, rule, present_directions, label_tables, present_ids):
+        """
+        Cheap per-frame check that skips rules with no possible candidate.
+        """
+        if not (rule.direction_table & present_directions).any():
+            return False
+
+        table = label_tables.get(rule.rule_id)
+        if table is not None and not table[present_ids].any():
+            return False
+
+        return True
+
+    # --------------------------------------------------
+
+    def evaluate(self, batch, distances, directions, motions, thresholds, context=None):
+        """
+        Find the winning rule for a frame.
+
+        CRITICAL rules are tried first in priority order and the first
+        one matching any detection wins immediately. Otherwise the
+        first detection matching any rule wins, using the highest
+        priority rule that matches it.
+
+        :param batch: DetectionBatch
+        :param distances: float array (NaN when unknown)
+        :param directions: Direction codes (index into DIRECTIONS)
+        :param motions: Motion codes (index into MOTIONS)
+        :param thresholds: Named distance thresholds, e.g. {'center': 1.5}
+        :param context: Current scene context
+        :return: (Rule, detection index), or (None, None)
+        """
+        critical, regular = self._active(context)
+
+        present_directions = np.bincount(directions, minlength=len(DIRECTIONS)) > 0
+        present_ids = np.unique(batch.class_ids)
+        label_tables = self._label_tables(batch.names)
+
+        # NaN distances never compare True, so unknown distances never match
+        with np.errstate(invalid="ignore"):
+            for rule in critical:
+                if not self._can_match(rule, present_directions, label_tables, present_ids):
+                    continue
+                mask = self._mask(rule, batch, distances, directions, motions,
+                                  thresholds, label_tables)
+                if mask.any():
+                    return rule, int(mask.argmax())
+
+            best_index = None
+            best_rule = None
+            for rule in regular:
+                if not self._can_match(rule, present_directions, label_tables, present_ids):
+                    continue
+                mask = self._mask(rule, batch, distances, directions, motions,
+                                  thresholds, label_tables)
+                if not mask.any():
+                    continue
+
+                # Rules are in priority order, so only a strictly earlier
+                # detection can displace the current best
+                index = int(mask.argmax())
+                if best_index is None or index < best_index:
+                    best_index = index
+                    best_rule = rule
+
+                    # Nothing can beat the first detection
+                    if best_index == 0:
+                        break
+
+        return best_rule, best_index
@@ -9,43 +9,71 @@ intelligent navigation guidance.
 
 import time
 
+import numpy as np
+
 from src.learning.adaptive_rules import AdaptiveThresholds
 from src.features.distance import DistanceEstimator
-from src.features.direction import DirectionEstimator
-from src.features.motion import MotionEstimator
+from src.features.direction import DirectionEstimator, DIRECTIONS
+from src.features.motion import MotionEstimator, MOTIONS
+from src.decision.rule_table import RuleTable
 from src.utils.logger import DecisionLogger
 from src.utils.metrics import MetricsCollector
+from src.utils.clock import wall_clock
 from src.context.scene_context import SceneContext
-from src.safety.alert_manager import AlertManager
+from src.safety.alert_manager import AlertManager, CRITICAL
 from src.memory.short_term_memory import ShortTermMemory
 from src.profiles.user_profile import UserProfile
+from src.tracking.tracker import MultiObjectTracker
+from src.vision.detections import DetectionBatch
 
 
 class DecisionEngine:
-    def __init__(self, frame_width: int = 640, cooldown_seconds: float = 3.0):
+    def __init__(self, frame_width: int = 640, cooldown_seconds: float = 3.0,
+                 rules_path: str = "config/rules.yaml", logger=None,
+                 clock=None, profile: str = None, thresholds=None):
         """
         Initialize the decision engine.
+
+        :param rules_path: YAML rule table
+        :param logger: DecisionLogger to use (default: JSONL in logs/)
+        :param clock: Callable returning the current time (default: wall
+                      clock; replay passes a ManualClock)
+        :param profile: User profile name (default: the one selected in
+                        the profile config)
+        :param thresholds: Base distance thresholds ('center_distance',
+                           'side_distance', 'min_distance', 'max_distance')
         """
+        self.clock = clock or wall_clock
 
         # Feature extractors
         self.distance_estimator = DistanceEstimator()
         self.direction_estimator = DirectionEstimator(frame_width)
         self.motion_estimator = MotionEstimator()
+        self.tracker = MultiObjectTracker()
+
+        # Declarative rule table, compiled once at startup
+        self.rules = RuleTable.load(rules_path)
 
         # Timing
         self.cooldown_seconds = cooldown_seconds
         self.last_spoken_time = 0
 
         # Phase 3
-        self.adaptive = AdaptiveThresholds()
-        self.metrics = MetricsCollector()
-        self.logger = DecisionLogger()
+        thresholds = thresholds or {}
+        self.adaptive = AdaptiveThresholds(
+            base_center_distance=thresholds.get("center_distance", 1.5),
+            base_side_distance=thresholds.get("side_distance", 2.0),
+            min_distance=thresholds.get("min_distance", 1.0),
+            max_distance=thresholds.get("max_distance", 3.0),
+        )
+        self.metrics = MetricsCollector(clock=self.clock)
+        self.logger = logger or DecisionLogger()
 
         # Phase 5
         self.context = SceneContext()
         self.alert_manager = AlertManager()
-        self.memory = ShortTermMemory()
-        self.user_profile = UserProfile()
+        self.memory = ShortTermMemory(clock=self.clock)
+        self.user_profile = UserProfile(profile=profile)
         self.cooldown_seconds = self.user_profile.cooldown()
 
     # --------------------------------------------------
@@ -65,6 +93,21 @@ class DecisionEngine:
         else:
             print("Most common object     : None")
 
+        print(f"Frames processed       : {self.metrics.counters['frames']} "
+              f"({self.metrics.fps():.1f} FPS)")
+        print(f"Frames dropped         : {self.metrics.counters['dropped_frames']}")
+
+        summary = self.metrics.latency_summary()
+        if summary:
+            print("\nLatency (ms)           :    p50     p95     p99")
+            for stage, stats in summary.items():
+                print(f"  {stage:<21}: {stats['p50']:>6.1f}  {stats['p95']:>6.1f}  {stats['p99']:>6.1f}")
+
+        # Flush and stop the background log writer
+        self.logger.close()
+        if self.logger.dropped:
+            print(f"Log events dropped     : {self.logger.dropped}")
+
         print("========================================\n")
 
     # --------------------------------------------------
@@ -72,13 +115,33 @@ class DecisionEngine:
     def evaluate(self, detections):
         """
         Evaluate detected objects and return a navigation decision.
+
+        :param detections: DetectionBatch or list of detection dicts
+        :return: Decision to deliver, or None
         """
+        start = time.perf_counter()
+        try:
+            return self._evaluate(detections)
+        finally:
+            self.metrics.observe("evaluate", time.perf_counter() - start)
+
+    def _evaluate(self, detections):
 
-        if not detections:
+        batch = DetectionBatch.from_dicts(detections)
+
+        # ---------- Tracking: stable IDs across frames ----------
+        # Updated on empty frames too so unmatched tracks age out
+        track_ids = self.tracker.update(batch)
+
+        if not len(batch):
+            # Empty frames still count towards the context window
+            self.context.infer(batch)
             return None
 
+        motions = self.motion_estimator.estimate_batch(self.tracker, track_ids)
+
         # ---------- Phase 5.1: Scene Context ----------
-        context = self.context.infer(detections)
+        context = self.context.infer(batch, motions)
 
         # ---------- Adaptive thresholds ----------
         center_threshold = self.adaptive.get_center_threshold()
@@ -99,130 +162,74 @@ class DecisionEngine:
         center_threshold = max(center_threshold, 0.5)
         side_threshold = max(side_threshold, 0.5)
 
-        best_decision = None
-        best_context = {}
+        current_time = self.clock()
 
-        current_time = time.time()
+        # ---------- Feature extraction (whole frame) ----------
+        distances = self.distance_estimator.estimate_batch(batch.boxes)
+        directions = self.direction_estimator.estimate_batch(batch.boxes)
 
         # ---------- Rule evaluation ----------
-        for idx, obj in enumerate(detections):
-            label = obj.get("label")
-            bbox = obj.get("bbox")
-
-            distance = self.distance_estimator.estimate(bbox)
-            direction = self.direction_estimator.estimate(bbox)
-            motion = self.motion_estimator.estimate(str(idx), bbox)
-
-            # CRITICAL: Approaching object straight ahead
-            if motion == "APPROACHING" and direction == "CENTER":
-                best_decision = f"Warning. {label} approaching ahead."
-                best_context = {
-                    "label": label,
-                    "bbox": bbox,
-                    "distance": distance,
-                    "direction": direction,
-                    "motion": motion,
-                }
-                break  # CRITICAL always wins
-
-            # HIGH: Obstacle close in center
-            if (
-                best_decision is None
-                and distance is not None
-                and distance < center_threshold
-                and direction == "CENTER"
-            ):
-                best_decision = "Obstacle ahead. Please stop."
-                best_context = {
-                    "label": label,
-                    "bbox": bbox,
-                    "distance": distance,
-                    "direction": direction,
-                    "motion": motion,
-                }
-
-            # LOW: Side obstacles
-            if (
-                best_decision is None
-                and direction == "LEFT"
-                and distance is not None
-                and distance < side_threshold
-            ):
-                best_decision = "Obstacle on left. Move right."
-                best_context = {
-                    "label": label,
-                    "bbox": bbox,
-                    "distance": distance,
-                    "direction": direction,
-                    "motion": motion,
-                }
-
-            elif (
-                best_decision is None
-                and direction == "RIGHT"
-                and distance is not None
-                and distance < side_threshold
-            ):
-                best_decision = "Obstacle on right. Move left."
-                best_context = {
-                    "label": label,
-                    "bbox": bbox,
-                    "distance": distance,
-                    "direction": direction,
-                    "motion": motion,
-                }
+        rule, idx = self.rules.evaluate(
+            batch, distances, directions, motions,
+            {"center": center_threshold, "side": side_threshold},
+            context,
+        )
 
         # ---------- Final handling ----------
-        if best_decision:
-            # Determine severity first
-            severity = self.alert_manager.classify(best_decision)
+        if rule is not None:
+            label = batch.labels[idx]
+            bbox = tuple(batch.boxes[idx].tolist())
+            distance = float(distances[idx])
+            decision = rule.decide(
+                label,
+                DIRECTIONS[directions[idx]],
+                None if np.isnan(distance) else distance,
+                MOTIONS[motions[idx]],
+            )
+
+            # Severity comes straight from the matched rule
+            severity = decision.severity
 
             # Suppress repeated alerts ONLY if not CRITICAL
-            if severity != 4:
-                if self.memory.is_recent(
-                    best_context.get("label"),
-                    best_context.get("bbox")
-                ):
+            if severity != CRITICAL:
+                if self.memory.is_recent(label, bbox):
                     return None
 
             # Adaptive learning (only for spoken alerts)
-            self.adaptive.update(best_decision)
+            self.adaptive.update(decision)
 
             # Metrics
-            self.metrics.record(best_context.get("label"))
+            self.metrics.record(label)
 
-            # Logging
+            # Logging (text is rendered by the log writer)
             self.logger.log(
-                label=best_context.get("label"),
-                distance=best_context.get("distance"),
-                direction=best_context.get("direction"),
-                motion=best_context.get("motion"),
-                decision=best_decision,
+                label=label,
+                distance=decision.distance,
+                direction=decision.direction,
+                motion=decision.motion,
+                decision=decision,
+                timestamp=current_time,
             )
 
             # Update short-term memory
-            self.memory.update(
-                best_context.get("label"),
-                best_context.get("bbox")
-            )
+            self.memory.update(label, bbox)
 
             # ---------- Phase 5.2: Safety Escalation ----------
             # Repeat faster for high severity
             if self.alert_manager.should_repeat(severity):
-                self.last_spoken_time = time.time() - self.cooldown_seconds
-
-            if self.user_profile.verbosity() == "low" and severity != 4:
-                best_decision = best_decision.split(".")[0]
+                self.last_spoken_time = self.clock() - self.cooldown_seconds
 
+            if self.user_profile.verbosity() == "low" and severity != CRITICAL:
+                decision.brief = True
 
             # Bypass cooldown for critical alerts
             if self.alert_manager.should_bypass_cooldown(severity):
-                self.last_spoken_time = time.time()
-                return best_decision
+                self.last_spoken_time = self.clock()
+                return decision
 
             # Normal cooldown
             if current_time - self.last_spoken_time >= self.cooldown_seconds:
-                self.last_spoken_time = time.time()
-                return best_decision
+                self.last_spoken_time = self.clock()
+                return decision
 
         return None
@@ -5,6 +5,13 @@ Determines whether a detected object lies on the
 left, center, or right region of the frame.
 """
 
+import numpy as np
+
+
+# Direction codes used by the batch estimator
+DIRECTIONS = ("LEFT", "CENTER", "RIGHT")
+LEFT, CENTER, RIGHT = 0, 1, 2
+
 
 class DirectionEstimator:
     def __init__(self, frame_width: int):
@@ -37,3 +44,21 @@ class DirectionEstimator:
             return "RIGHT"
         else:
             return "CENTER"
+
+    def estimate_batch(self, boxes):
+        """
+        Estimate direction codes for all boxes of a frame.
+
+        :param boxes: (N, 4) array of x1, y1, x2, y2
+        :return: int8 array of LEFT / CENTER / RIGHT codes
+                 (index into DIRECTIONS)
+        """
+        centers = (boxes[:, 0].astype(np.float64) + boxes[:, 2]) / 2
+
+        left_boundary = self.frame_width / 3
+        right_boundary = 2 * self.frame_width / 3
+
+        codes = np.full(len(centers), CENTER, dtype=np.int8)
+        codes[centers < left_boundary] = LEFT
+        codes[centers > right_boundary] = RIGHT
+        return codes
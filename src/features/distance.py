@@ -5,6 +5,9 @@ Estimates relative distance of detected objects using
 bounding box dimensions from a monocular camera.
 """
 
+import numpy as np
+
+
 class DistanceEstimator:
     def __init__(self, reference_height: float = 170.0):
         """
@@ -34,3 +37,16 @@ class DistanceEstimator:
         # Simple inverse relationship for relative distance
         distance = self.reference_height / box_height
         return distance
+
+    def estimate_batch(self, boxes):
+        """
+        Estimate relative distance for all boxes of a frame.
+
+        :param boxes: (N, 4) array of x1, y1, x2, y2
+        :return: float64 array, NaN where the box height is not positive
+        """
+        heights = boxes[:, 3].astype(np.float64) - boxes[:, 1]
+        distances = np.full(len(heights), np.nan)
+        valid = heights > 0
+        np.divide(self.reference_height, heights, out=distances, where=valid)
+        return distances
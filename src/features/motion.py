@@ -3,9 +3,17 @@ Motion estimation module for Vision I.
 
 Determines whether a detected object is approaching,
 moving away, or stationary based on bounding box size
-changes across frames.
+changes across frames, either keyed by caller-supplied IDs
+or driven by a tracker's state arrays.
 """
 
+import numpy as np
+
+
+# Motion codes used by the batch estimator (index into MOTIONS)
+MOTIONS = (None, "STATIONARY", "APPROACHING", "MOVING_AWAY")
+UNKNOWN, STATIONARY, APPROACHING, MOVING_AWAY = 0, 1, 2, 3
+
 
 class MotionEstimator:
     def __init__(self, threshold: float = 0.05):
@@ -47,3 +55,38 @@ class MotionEstimator:
             return "APPROACHING"
         elif change_ratio < -self.threshold:
             return "MOVING_AWAY"
+
+    def estimate_batch(self, tracker, track_ids):
+        """
+        Estimate motion codes for all tracked objects of a frame.
+
+        Compares each track's last two boxes (the same rule as
+        estimate()), computed from the tracker's state arrays in
+        one pass.
+
+        :param tracker: MultiObjectTracker updated for this frame
+        :param track_ids: Track ID per detection
+        :return: int8 array of motion codes (index into MOTIONS)
+        """
+        rows = np.searchsorted(tracker.ids, track_ids)
+
+        current = tracker.boxes[rows].astype(np.float64)
+        previous = tracker.previous_boxes[rows].astype(np.float64)
+        has_previous = tracker.hits[rows] > 1
+
+        current_size = (current[:, 2] - current[:, 0]) * (current[:, 3] - current[:, 1])
+        previous_size = (previous[:, 2] - previous[:, 0]) * (previous[:, 3] - previous[:, 1])
+
+        comparable = has_previous & (previous_size > 0)
+        change_ratio = np.zeros(len(rows))
+        np.divide(
+            current_size - previous_size, previous_size,
+            out=change_ratio, where=comparable,
+        )
+
+        codes = np.full(len(rows), UNKNOWN, dtype=np.int8)
+        codes[~comparable] = STATIONARY
+        codes[comparable & (change_ratio > self.threshold)] = APPROACHING
+        codes[comparable & (change_ratio < -self.threshold)] = MOVING_AWAY
+        codes[current_size <= 0] = UNKNOWN
+        return codes
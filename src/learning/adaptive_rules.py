@@ -6,6 +6,9 @@ observed alert frequency.
 """
 
 
+SIDES = frozenset({"LEFT", "RIGHT"})
+
+
 class AdaptiveThresholds:
     def __init__(
         self,
@@ -23,17 +26,18 @@ class AdaptiveThresholds:
         self.center_alert_count = 0
         self.side_alert_count = 0
 
-    def update(self, decision: str):
+    def update(self, decision):
         """
         Update alert counters based on the decision.
+
+        :param decision: Decision (counted by the direction of its object)
         """
         if not decision:
             return
 
-        if "ahead" in decision.lower():
+        if decision.direction == "CENTER":
             self.center_alert_count += 1
-
-        if "left" in decision.lower() or "right" in decision.lower():
+        elif decision.direction in SIDES:
             self.side_alert_count += 1
 
         self._adapt_thresholds()
@@ -7,10 +7,340 @@ It initializes all modules and manages the execution flow.
 
 from src.vision.camera import Camera
 from src.vision.detector import ObjectDetector
+from src.vision.regions import DEFAULT_ROI, DEFAULT_TILES, RegionDetector
+from src.vision.scheduler import KeyframeScheduler
+from src.vision.motion_gate import MotionGate
+from src.vision.detection_cache import DetectionCache
 from src.decision.rules import DecisionEngine
 from src.audio.tts import VoiceAssistant
+from src.audio.phrase_cache import PhraseCache, alert_vocabulary
+from src.audio.sinks import create_sink
 from src.utils.config_loader import Config
-import cv2 
+from src.utils.logger import DecisionLogger
+from src.utils.metrics_exporter import MetricsExporter
+from src.runtime.pipeline import Pipeline
+from src.runtime.display import create_display
+from src.runtime.worker_pool import DetectorPool
+from src.runtime.startup import StartupTimer
+from src.runtime.governor import DEFAULT_LEVELS, LatencyGovernor
+from src.replay.trace import TraceRecorder
+from src.server.inference_server import InferenceServer
+import signal
+import threading
+import time
+from pathlib import Path
+
+
+def handle_decision(decision, detections, mode, voice):
+    """
+    Deliver a decision according to the configured output mode.
+    """
+    if not decision:
+        return
+
+    if mode == "voice":
+        voice.speak(decision)
+
+    elif mode == "silent":
+        print(f"[DECISION] {decision}")
+
+    elif mode == "debug":
+        print(f"[DEBUG] Decision: {decision}")
+        print(f"[DEBUG] Detections: {detections}")
+
+
+def record_frame(metrics, frame, camera, dropped=0, governor=None, startup=None):
+    """
+    Record end-to-end latency and frame counters for a processed frame.
+
+    :param governor: Optional LatencyGovernor fed with the latency
+    :param startup: Optional StartupTimer noting the first frame
+    """
+    latency = time.time() - frame.timestamp
+    metrics.observe("end_to_end", latency)
+    if governor is not None:
+        governor.observe(latency)
+    metrics.increment("frames")
+    if startup is not None:
+        startup.first_frame()
+    metrics.set_counter("dropped_frames", camera.dropped_frames() + dropped)
+
+
+def run_sequential(camera, detect, decision_engine, voice, mode, display, stop_event,
+                   governor=None, startup=None):
+    """
+    Run capture, detection, decision and speech one after another.
+
+    :param detect: Callable mapping a frame to detections
+    :param display: Display presenting frames and reporting the exit key
+    :param stop_event: Set to end the loop (e.g. by a signal)
+    :param governor: Optional LatencyGovernor holding the latency budget
+    :param startup: Optional StartupTimer noting the first frame
+    """
+    metrics = decision_engine.metrics
+
+    while not stop_event.is_set():
+        start = time.perf_counter()
+        frame = camera.read()
+        if frame is None:
+            break
+        metrics.observe("capture", time.perf_counter() - start)
+
+        if display.show(frame.image):
+            print("[INFO] Exit key pressed. Shutting down...")
+            break
+
+        detections = detect(frame.image)
+        decision = decision_engine.evaluate(detections)
+        record_frame(metrics, frame, camera, governor=governor, startup=startup)
+
+        handle_decision(decision, detections, mode, voice)
+
+
+def run_pipelined(camera, detect, decision_engine, voice, mode, display, stop_event,
+                  queue_size=1, governor=None, startup=None):
+    """
+    Run each stage on its own thread, joined by latest-frame-wins queues.
+
+    The main thread only handles the display and exit key.
+
+    :param detect: Callable mapping a frame to detections
+    :param display: Display presenting frames and reporting the exit key
+    :param stop_event: Set to end the run (e.g. by a signal)
+    :param governor: Optional LatencyGovernor holding the latency budget
+    :param startup: Optional StartupTimer noting the first frame
+    """
+    metrics = decision_engine.metrics
+    latest = {"frame": None}
+    pipeline = None
+
+    def capture():
+        start = time.perf_counter()
+        frame = camera.read()
+        if frame is None:
+            return StopIteration
+        metrics.observe("capture", time.perf_counter() - start)
+        latest["frame"] = frame.image
+        return frame
+
+    def detect_stage(frame):
+        return frame, detect(frame.image)
+
+    def decide(item):
+        frame, detections = item
+        decision = decision_engine.evaluate(detections)
+        dropped = sum(queue.dropped for queue in pipeline.queues.values())
+        record_frame(metrics, frame, camera, dropped, governor, startup)
+        if decision:
+            return decision, detections
+        return None
+
+    def speak(item):
+        decision, detections = item
+        handle_decision(decision, detections, mode, voice)
+
+    pipeline = Pipeline(capture, detect_stage, decide, speak, queue_size=queue_size)
+    pipeline.start()
+
+    try:
+        while pipeline.running() and not stop_event.is_set():
+            frame = latest["frame"]
+            if frame is not None and display.show(frame):
+                print("[INFO] Exit key pressed. Shutting down...")
+                break
+
+            pipeline.wait(0.01)
+    finally:
+        pipeline.stop()
+        pipeline.report()
+
+
+def create_logger(config, log_file=None):
+    """
+    Build a decision logger from the logging config.
+
+    :param log_file: Override the configured log file
+    """
+    return DecisionLogger(
+        log_file=log_file or config.get("logging", "file", default="logs/decisions.jsonl"),
+        binary=config.get("logging", "binary", default=False), # type: ignore
+        batch_size=config.get("logging", "batch_size", default=64), # type: ignore
+        flush_interval=config.get("logging", "flush_interval", default=1.0), # type: ignore
+        max_queue=config.get("logging", "max_queue", default=4096), # type: ignore
+        overflow=config.get("logging", "overflow", default="drop_oldest"), # type: ignore
+        rotate_bytes=int(config.get("logging", "rotate_mb", default=0) * 1024 * 1024), # type: ignore
+        rotate_daily=config.get("logging", "rotate_daily", default=False), # type: ignore
+        compress=config.get("logging", "compress", default=False), # type: ignore
+    )
+
+
+def run_server(config, detector, mode, frame_width, cooldown, startup=None):
+    """
+    Serve several streams with one shared detector.
+
+    Every stream gets its own DecisionEngine and decision log.
+
+    :param startup: Optional StartupTimer, reported once serving starts
+    """
+    log_dir = Path(config.get("server", "log_dir", default="logs/streams")) # type: ignore
+
+    def create_engine(stream_id):
+        return DecisionEngine(
+            frame_width=frame_width, # type: ignore
+            cooldown_seconds=cooldown, # type: ignore
+            logger=create_logger(config, str(log_dir / f"{stream_id}.jsonl")),
+            thresholds=config.get("thresholds"), # type: ignore
+        )
+
+    def on_decision(stream_id, decision, detections):
+        if mode == "debug":
+            print(f"[DEBUG][{stream_id}] Decision: {decision}")
+            print(f"[DEBUG][{stream_id}] Detections: {detections}")
+        else:
+            print(f"[DECISION][{stream_id}] {decision}")
+
+    server = InferenceServer(
+        detector,
+        create_engine,
+        max_batch=config.get("server", "max_batch", default=8), # type: ignore
+        max_delay=config.get("server", "max_delay_ms", default=10) / 1000, # type: ignore
+        max_streams=config.get("server", "max_streams", default=16), # type: ignore
+        idle_timeout=config.get("server", "idle_timeout", default=300), # type: ignore
+        on_decision=on_decision,
+    ).start()
+
+    exporter = None
+    if config.get("metrics", "port") or config.get("metrics", "file"):
+        exporter = MetricsExporter(
+            server.metrics,
+            port=config.get("metrics", "port"), # type: ignore
+            path=config.get("metrics", "file"), # type: ignore
+            host=config.get("metrics", "host", default="127.0.0.1"), # type: ignore
+            interval=config.get("metrics", "interval", default=5.0), # type: ignore
+        ).start()
+
+    for index, source in enumerate(config.get("server", "streams", default=[])): # type: ignore
+        server.add_source(
+            f"local{index}", source,
+            buffer_size=config.get("camera", "buffer_size", default=8), # type: ignore
+            width=config.get("camera", "raw_width"), # type: ignore
+            height=config.get("camera", "raw_height"), # type: ignore
+        )
+
+    port = config.get("server", "port")
+    if port:
+        server.serve_http(config.get("server", "host", default="127.0.0.1"), port) # type: ignore
+
+    print("[INFO] Vision I inference server started. Send SIGINT/SIGTERM to stop.")
+    if startup is not None:
+        startup.ready()
+        for line in startup.report():
+            print(line)
+
+    stop_event = threading.Event()
+    install_signal_handlers(stop_event)
+
+    try:
+        while server.running() and not stop_event.wait(0.5):
+            pass
+    finally:
+        server.stop()
+        if exporter is not None:
+            exporter.stop()
+        server.report()
+        print("[INFO] Vision I inference server stopped safely.")
+
+
+def run_workers(camera, pool, decision_engine, voice, mode, display, stop_event,
+                startup=None):
+    """
+    Detect on a pool of worker processes, evaluating results in frame order.
+
+    Several frames are in flight at once; submit() blocks when every
+    shared-memory slot is busy, so capture never runs ahead of detection.
+
+    :param pool: Started DetectorPool
+    :param startup: Optional StartupTimer noting the first frame
+    """
+    metrics = decision_engine.metrics
+    in_flight = {}
+
+    def deliver(results):
+        for seq, detections in results:
+            frame = in_flight.pop(seq)
+            decision = decision_engine.evaluate(detections)
+            record_frame(metrics, frame, camera, startup=startup)
+            handle_decision(decision, detections, mode, voice)
+
+    try:
+        while not stop_event.is_set():
+            start = time.perf_counter()
+            frame = camera.read()
+            if frame is None:
+                break
+            metrics.observe("capture", time.perf_counter() - start)
+
+            if display.show(frame.image):
+                print("[INFO] Exit key pressed. Shutting down...")
+                break
+
+            in_flight[pool.submit(frame.image)] = frame
+            deliver(pool.collect())
+
+        deliver(pool.drain())
+    finally:
+        pool.close()
+
+
+def install_signal_handlers(stop_event):
+    """
+    Turn SIGINT/SIGTERM into a clean shutdown request.
+
+    A second signal aborts immediately.
+    """
+    def handle(signum, frame):
+        if stop_event.is_set():
+            raise KeyboardInterrupt
+        print(f"[INFO] {signal.Signals(signum).name} received. Shutting down...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, handle)
+    signal.signal(signal.SIGTERM, handle)
+
+
+def create_voice(config, decision_engine, names):
+    """
+    Build the voice assistant, with the phrase cache when enabled.
+
+    :param names: Callable returning the detector's class names; it is
+                  resolved on the speech worker after engine init, so
+                  TTS init does not wait for the model
+    """
+    rate = config.get("audio", "rate", default=160)
+    phrase_cache = None
+    phrases = ()
+    sink = None
+
+    if config.get("audio", "phrase_cache", default=False):
+        try:
+            sink = create_sink(config.get("audio", "sink", default="simpleaudio")) # type: ignore
+            phrase_cache = PhraseCache(
+                config.get("audio", "cache_dir", default="cache/phrases"), rate # type: ignore
+            )
+            def phrases():
+                return alert_vocabulary(decision_engine.rules, names().values())
+        except ImportError as e:
+            print(f"[WARN] Phrase cache disabled: {e}")
+
+    return VoiceAssistant(
+        rate=rate, # type: ignore
+        max_age=config.get("audio", "max_age", default=2.0), # type: ignore
+        max_queue=config.get("audio", "max_queue", default=4), # type: ignore
+        phrase_cache=phrase_cache,
+        phrases=phrases,
+        sink=sink,
+        metrics=decision_engine.metrics,
+    )
 
 
 def main():
@@ -18,22 +348,114 @@ def main():
     Main execution loop for Vision I.
     """
 
+    # Heavy libraries (torch, cv2, pyttsx3) are imported lazily, so this
+    # is effectively process start
+    startup = StartupTimer()
+
     # Load configuration
-    config = Config()
+    config = startup.measure("config", Config)
 
     frame_width = config.get("system", "frame_width", default=640)
     cooldown = config.get("system", "cooldown_seconds", default=3.0)
     confidence = config.get("detection", "confidence_threshold", default=0.5)
     mode = config.get("modes", "mode", default="voice")
+    runtime = config.get("system", "runtime", default="sequential")
+    queue_size = config.get("system", "queue_size", default=1)
+    headless = config.get("display", "headless", default=False)
+    preview = config.get("display", "preview")
 
     # Initialize system components
-    camera = Camera()
-    detector = ObjectDetector(confidence_threshold=confidence) # type: ignore
-    decision_engine = DecisionEngine(
-        frame_width=frame_width, # type: ignore
-        cooldown_seconds=cooldown # type: ignore
+    backend = config.get("detection", "backend", default="torch")
+    imgsz = config.get("detection", "imgsz", default=640)
+    warmup = config.get("detection", "warmup", default=True)
+    detector_options = dict(
+        model_path=config.get("detection", "model", default="yolov8n.pt"), # type: ignore
+        confidence_threshold=confidence, # type: ignore
+        backend=backend, # type: ignore
+        imgsz=imgsz, # type: ignore
+        int8=config.get("detection", "int8", default=False), # type: ignore
+        warmup=False,
+    )
+
+    def load_detector():
+        detector = startup.measure("model load", ObjectDetector, **detector_options)
+        if warmup:
+            # Explicit warm-up so the first real frame runs at full speed
+            detector.warmup_time = startup.measure("warm-up", detector.backend.warmup)
+        return detector
+
+    if runtime == "server":
+        run_server(config, load_detector(), mode, frame_width, cooldown, startup)
+        return
+
+    # Model load, camera open and TTS init run concurrently
+    if runtime == "workers":
+        # Detection runs in worker processes; the model is loaded there
+        pool = DetectorPool(
+            detector_options,
+            workers=config.get("workers", "count", default=2), # type: ignore
+            slots=config.get("workers", "slots"), # type: ignore
+            restart=config.get("workers", "restart", default=False), # type: ignore
+            max_restarts=config.get("workers", "max_restarts", default=3), # type: ignore
+        )
+        model = startup.submit("model load", pool.wait_ready)
+    else:
+        model = startup.submit(None, load_detector)
+
+    camera_future = startup.submit(
+        "camera open",
+        Camera,
+        source=config.get("camera", "source", default=0),
+        buffer_size=config.get("camera", "buffer_size", default=8), # type: ignore
+        loop=config.get("camera", "loop", default=False), # type: ignore
+        width=config.get("camera", "raw_width"), # type: ignore
+        height=config.get("camera", "raw_height"), # type: ignore
     )
-    voice = VoiceAssistant()
+
+    def build_engine():
+        return DecisionEngine(
+            frame_width=frame_width, # type: ignore
+            cooldown_seconds=cooldown, # type: ignore
+            logger=create_logger(config),
+            thresholds=config.get("thresholds"), # type: ignore
+        )
+
+    decision_engine = startup.measure("rules", build_engine)
+
+    def model_names():
+        result = model.result()
+        return result if runtime == "workers" else result.backend.names
+
+    # The speech engine is only started when alerts are spoken
+    voice = tts = None
+    if mode == "voice":
+        voice = create_voice(config, decision_engine, model_names)
+        tts = startup.submit("tts init", voice.wait_ready)
+
+    detector = None if runtime == "workers" else model.result()
+    camera = camera_future.result()
+    if tts is not None:
+        tts.result()
+    startup.ready()
+
+    if detector is not None:
+        detector.metrics = decision_engine.metrics
+
+    # Detection cache: skip inference on frames seen in earlier runs
+    cache = None
+    if config.get("detection", "cache", "enabled", default=False):
+        if runtime == "workers":
+            print("[WARN] Detection cache is not used with detector workers")
+        else:
+            cache = DetectionCache(
+                detector,
+                cache_dir=config.get("detection", "cache", "dir", default="cache/detections"), # type: ignore
+                max_mb=config.get("detection", "cache", "max_mb", default=256), # type: ignore
+                max_detections=config.get("detection", "cache", "max_detections", default=64), # type: ignore
+                hash_stride=config.get("detection", "cache", "hash_stride", default=2), # type: ignore
+                metrics=decision_engine.metrics,
+            )
+            detector = cache
 
     print("[INFO] Vision I system started.")
 
@@ -43,40 +465,170 @@ def main():
     print(f"Frame Width   : {frame_width}")
     print(f"Cooldown (s)  : {cooldown}")
     print(f"Confidence    : {confidence}")
-    print("Press 'q' to safely exit")
+    print(f"Backend       : {backend} @ {imgsz}px")
+    print(f"Runtime       : {runtime}")
+    print(f"Display       : {'headless' if headless else 'window'}"
+          f"{f' (preview: {preview})' if headless and preview else ''}")
+    for line in startup.report():
+        print(line)
+    print("Press 'q' or Ctrl+C to safely exit" if not headless else "Send SIGINT/SIGTERM to safely exit")
     print("=" * 50)
 
-    # Main loop
-    while True:
-        frame = camera.get_frame()
-        if frame is None:
-            break
+    exporter = None
+    if config.get("metrics", "port") or config.get("metrics", "file"):
+        exporter = MetricsExporter(
+            decision_engine.metrics,
+            port=config.get("metrics", "port"), # type: ignore
+            path=config.get("metrics", "file"), # type: ignore
+            host=config.get("metrics", "host", default="127.0.0.1"), # type: ignore
+            interval=config.get("metrics", "interval", default=5.0), # type: ignore
+        ).start()
 
-        # SHOW frame (required for key events)
-        cv2.imshow("Vision I - Live Feed", frame)
+    # Region of interest: crop/tile the frame, inference size from scene context
+    regions = None
+    if config.get("detection", "regions", "enabled", default=False):
+        if runtime == "workers":
+            print("[WARN] Region detection is not used with detector workers")
+        else:
+            regions = RegionDetector(
+                detector,
+                context=decision_engine.context,
+                mode=config.get("detection", "regions", "mode", default="roi"), # type: ignore
+                roi=config.get("detection", "regions", "roi", default=DEFAULT_ROI), # type: ignore
+                tiles=config.get("detection", "regions", "tiles", default=DEFAULT_TILES), # type: ignore
+                context_imgsz=config.get("detection", "regions", "context_imgsz"), # type: ignore
+                full_frame_contexts=config.get(
+                    "detection", "regions", "full_frame_contexts", default=("OUTDOOR", "CROWDED")
+                ), # type: ignore
+            )
+            detector = regions
 
-        if cv2.waitKey(1) & 0xFF == ord('q'):
-            print("[INFO] Exit key pressed. Shutting down...")
-            break
+    # Keyframe scheduling: full detection every N frames, tracking between
+    scheduler = None
+    detect = None
+    if runtime == "workers":
+        if config.get("detection", "scheduler", "enabled", default=False):
+            print("[WARN] Keyframe scheduler is not used with detector workers")
+    elif config.get("detection", "scheduler", "enabled", default=False):
+        scheduler = KeyframeScheduler(
+            detector,
+            min_interval=config.get("detection", "scheduler", "min_interval", default=1), # type: ignore
+            max_interval=config.get("detection", "scheduler", "max_interval", default=8), # type: ignore
+            context_intervals=config.get("detection", "scheduler", "context_intervals"),
+        )
 
-        detections = detector.detect(frame)
-        decision = decision_engine.evaluate(detections)
+        def detect(frame):
+            return scheduler.detect_batch(frame, decision_engine.context.get())
+    else:
+        detect = detector.detect_batch
 
-        if decision:
-            if mode == "voice":
-                voice.speak(decision)
+    # Motion gate: reuse detections while the scene is static
+    gate = None
+    if config.get("detection", "motion_gate", "enabled", default=False):
+        if runtime == "workers":
+            print("[WARN] Motion gate is not used with detector workers")
+        else:
+            gate = MotionGate(
+                threshold=config.get("detection", "motion_gate", "threshold", default=0.02), # type: ignore
+                pixel_delta=config.get("detection", "motion_gate", "pixel_delta", default=12), # type: ignore
+                size=config.get("detection", "motion_gate", "size", default=(64, 48)), # type: ignore
+                max_age=config.get("detection", "motion_gate", "max_age", default=0.5), # type: ignore
+                metrics=decision_engine.metrics,
+            )
+            detect = gate.wrap(detect)
+
+    # Latency governor: trade detection quality for a per-frame deadline
+    governor = None
+    if config.get("detection", "governor", "enabled", default=False):
+        if runtime == "workers":
+            print("[WARN] Latency governor is not used with detector workers")
+        else:
+            def load_variant(model_path):
+                options = dict(detector_options, model_path=model_path, warmup=True)
+                return ObjectDetector(**options).backend
+
+            governor = LatencyGovernor(
+                model.result(),
+                budget_ms=config.get("detection", "governor", "budget_ms", default=150), # type: ignore
+                levels=config.get("detection", "governor", "levels", default=DEFAULT_LEVELS), # type: ignore
+                percentile=config.get("detection", "governor", "percentile", default=90), # type: ignore
+                window=config.get("detection", "governor", "window", default=30), # type: ignore
+                upgrade_ratio=config.get("detection", "governor", "upgrade_ratio", default=0.6), # type: ignore
+                load_model=load_variant,
+                metrics=decision_engine.metrics,
+            )
+            detect = governor.wrap(detect)
 
-            elif mode == "silent":
-                print(f"[DECISION] {decision}")
+    # Detection trace for offline replay (python -m src.replay.runner)
+    recorder = None
+    if config.get("logging", "trace_file"):
+        if runtime == "workers":
+            print("[WARN] Detection traces are not recorded with detector workers")
+        else:
+            recorder = TraceRecorder(config.get("logging", "trace_file"))
+            detect = recorder.wrap(detect)
 
-            elif mode == "debug":
-                print(f"[DEBUG] Decision: {decision}")
-                print(f"[DEBUG] Detections: {detections}")
+    display = create_display(
+        headless=headless, # type: ignore
+        preview=preview, # type: ignore
+        fps=config.get("display", "preview_fps", default=2.0), # type: ignore
+        scale=config.get("display", "preview_scale", default=0.25), # type: ignore
+        path=config.get("display", "preview_file", default="logs/preview.jpg"), # type: ignore
+    )
+
+    stop_event = threading.Event()
+    install_signal_handlers(stop_event)
+
+    try:
+        if runtime == "workers":
+            run_workers(camera, pool, decision_engine, voice, mode,
+                        display, stop_event, startup)
+        elif runtime == "pipelined":
+            run_pipelined(camera, detect, decision_engine, voice, mode,
+                          display, stop_event, queue_size, governor, startup)
+        else:
+            run_sequential(camera, detect, decision_engine, voice, mode,
+                           display, stop_event, governor, startup)
+    finally:
+        shutdown(camera, display, voice, exporter, decision_engine, scheduler,
+                 regions, governor, gate, recorder, cache)
+
+
+def shutdown(camera, display, voice, exporter, decision_engine, scheduler,
+             regions=None, governor=None, gate=None, recorder=None, cache=None):
+    """
+    Report and release all resources, however the run ended.
+    """
+    if cache is not None:
+        cache.close()
+        print(f"[INFO] Detection cache: {cache.hits} hits, {cache.misses} misses "
+              f"({cache.hit_rate():.0%}), {cache.evictions} evictions")
+    if recorder is not None:
+        recorder.close()
+        print(f"[INFO] Trace: {recorder.frames} frames recorded to {recorder.path}")
+    if gate is not None:
+        print(f"[INFO] Motion gate: {gate.skipped}/{gate.inferred + gate.skipped} "
+              f"detections skipped ({gate.skip_rate():.0%})")
+    if governor is not None:
+        print(f"[INFO] Governor: {governor.adjustments} adjustments, "
+              f"final level {governor.level} ({governor.describe()})")
+    if regions is not None:
+        print(f"[INFO] Region detection: {regions.full_frames}/{regions.frames} full frames, "
+              f"{regions.pixel_fraction():.0%} of pixels per frame")
+    if scheduler is not None:
+        print(f"[INFO] Keyframes: {scheduler.keyframes}, "
+              f"frames per detection: {scheduler.load_reduction():.1f}")
 
+    if voice is not None:
+        voice.close()
+    if exporter is not None:
+        exporter.stop()
     decision_engine.final_report()
+    if voice is not None:
+        voice.report()
 
     camera.release()
-    cv2.destroyAllWindows()
+    display.close()
     print("[INFO] Vision I system stopped safely.")
 
 
@@ -3,40 +3,95 @@ Short-term memory for Vision I.
 
 Remembers recently alerted objects to prevent
 repeated alerts for the same obstacle.
+
+Entries are indexed by label and a uniform spatial grid
+(cell size = distance threshold), so a lookup only checks
+the 3x3 neighbouring cells. Expiry runs off a time-ordered
+deque and the total number of entries is capped.
 """
 
-import time
-import math
+from collections import deque
+
+from src.utils.clock import wall_clock
 
 
 class ShortTermMemory:
-    def __init__(self, ttl_seconds=3.0, distance_threshold=50):
+    def __init__(self, ttl_seconds=3.0, distance_threshold=50, capacity=256, clock=None):
         """
         :param ttl_seconds: How long to remember objects
         :param distance_threshold: Pixel distance to consider same object
+        :param capacity: Maximum number of remembered alerts
+        :param clock: Callable returning the current time (default: wall clock)
         """
+        self.clock = clock or wall_clock
         self.ttl = ttl_seconds
         self.dist_thresh = distance_threshold
-        self.memory = []
+        self.capacity = capacity
+
+        self.cell_size = max(distance_threshold, 1)
+        self.grid = {}          # (label, cell_x, cell_y) -> deque of entries
+        self.order = deque()    # (label, cell_x, cell_y) in insertion order
 
     def _center(self, bbox):
         x1, y1, x2, y2 = bbox
         return ((x1 + x2) // 2, (y1 + y2) // 2)
 
-    def _distance(self, c1, c2):
-        return math.sqrt((c1[0] - c2[0]) ** 2 + (c1[1] - c2[1]) ** 2)
+    def _cell(self, center):
+        return (int(center[0] // self.cell_size), int(center[1] // self.cell_size))
+
+    def _evict_oldest(self):
+        """
+        Remove the globally oldest entry.
+
+        Entries are inserted in time order, so the oldest entry
+        overall is also the oldest entry of its cell.
+        """
+        key = self.order.popleft()
+        cell = self.grid[key]
+        cell.popleft()
+        if not cell:
+            del self.grid[key]
+
+    def _expire(self, now):
+        while self.order:
+            key = self.order[0]
+            if now - self.grid[key][0][1] < self.ttl:
+                break
+            self._evict_oldest()
+
+    @property
+    def memory(self):
+        """
+        Remembered alerts as a list of dicts, oldest first.
+        """
+        entries = [
+            {"label": key[0], "center": center, "time": t}
+            for key, cell in self.grid.items()
+            for center, t in cell
+        ]
+        return sorted(entries, key=lambda obj: obj["time"])
+
+    def __len__(self):
+        return len(self.order)
 
     def is_recent(self, label, bbox):
         """
         Check if object was recently alerted.
         """
-        now = time.time()
+        now = self.clock()
+        self._expire(now)
+
         center = self._center(bbox)
+        cx, cy = self._cell(center)
+        limit = self.dist_thresh * self.dist_thresh
 
-        for obj in self.memory:
-            if obj["label"] == label:
-                if self._distance(center, obj["center"]) < self.dist_thresh:
-                    if now - obj["time"] < self.ttl:
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                cell = self.grid.get((label, cx + dx, cy + dy))
+                if not cell:
+                    continue
+                for (ox, oy), _ in cell:
+                    if (center[0] - ox) ** 2 + (center[1] - oy) ** 2 < limit:
                         return True
         return False
 
@@ -44,17 +99,14 @@ class ShortTermMemory:
         """
         Update memory with new alert.
         """
-        now = time.time()
+        now = self.clock()
+        self._expire(now)
+
         center = self._center(bbox)
+        key = (label,) + self._cell(center)
 
-        # Remove expired memory
-        self.memory = [
-            obj for obj in self.memory
-            if now - obj["time"] < self.ttl
-        ]
+        self.grid.setdefault(key, deque()).append((center, now))
+        self.order.append(key)
 
-        self.memory.append({
-            "label": label,
-            "center": center,
-            "time": now
-        })
+        while len(self.order) > self.capacity:
+            self._evict_oldest()
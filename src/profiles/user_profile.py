@@ -2,20 +2,24 @@
 User profile management for Vision I.
 """
 
-import yaml
 from pathlib import Path
 
+from src.utils.config_loader import load_yaml
+
 
 class UserProfile:
-    def __init__(self, config_path="config/user_profile.yaml"):
+    def __init__(self, config_path="config/user_profile.yaml", profile=None):
+        """
+        :param config_path: Profile config
+        :param profile: Profile name overriding the configured selection
+        """
         path = Path(config_path)
         if not path.exists():
             raise FileNotFoundError(f"User profile config not found: {config_path}")
 
-        with open(path, "r") as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(path)
 
-        profile_name = data.get("profile", "normal")
+        profile_name = profile or data.get("profile", "normal")
         profiles = data.get("profiles", {})
 
         self.profile = profiles.get(profile_name, profiles.get("normal", {}))
@@ -0,0 +1,251 @@
+"""
+Offline replay and parameter sweeps for Vision I.
+
+Feeds a recorded trace through the decision stack with a
+ManualClock driven by the recorded timestamps, so a session
+replays at full CPU speed and gives the same alerts every
+time. A grid of threshold, cooldown and profile settings can
+be fanned out over a process pool, reporting alert counts and
+alert-fatigue statistics per configuration.
+
+Usage:
+    python -m src.replay.runner logs/trace.jsonl
+    python -m src.replay.runner logs/trace.jsonl --center 1.2 1.5 2.0 \\
+        --cooldown 2 3 4 --profile normal cautious --workers 4
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing as mp
+import statistics
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from src.decision.rules import DecisionEngine
+from src.replay.trace import read_trace
+from src.utils.clock import ManualClock
+
+
+# Settings a sweep can vary, in report order
+SETTINGS = ("center_distance", "side_distance", "cooldown", "profile")
+
+
+class _EventLogger:
+    """
+    In-memory stand-in for DecisionLogger (no files, no thread).
+    """
+
+    dropped = 0
+
+    def __init__(self):
+        self.events = 0
+
+    def log(self, label, distance, direction, motion, decision, timestamp=None):
+        self.events += 1
+
+    def flush(self, timeout: float = 2.0):
+        pass
+
+    def close(self):
+        pass
+
+
+def fatigue_stats(alerts, duration, repeat_window: float = 10.0):
+    """
+    Alert-fatigue statistics for one replay.
+
+    :param alerts: List of (timestamp, message key) for spoken alerts
+    :param duration: Replayed session length in seconds
+    :param repeat_window: Same message within this many seconds
+                          counts as a repeat
+    """
+    times = [t for t, _ in alerts]
+    gaps = [b - a for a, b in zip(times, times[1:])]
+
+    repeats = 0
+    last_said = {}
+    for t, message in alerts:
+        if t - last_said.get(message, float("-inf")) <= repeat_window:
+            repeats += 1
+        last_said[message] = t
+
+    # Busiest minute of the session
+    window = deque()
+    peak = 0
+    for t in times:
+        window.append(t)
+        while t - window[0] >= 60.0:
+            window.popleft()
+        peak = max(peak, len(window))
+
+    minutes = duration / 60 if duration > 0 else 0.0
+    return {
+        "alerts": len(alerts),
+        "alerts_per_min": len(alerts) / minutes if minutes else float(len(alerts)),
+        "peak_per_min": peak,
+        "repeat_rate": repeats / len(alerts) if alerts else 0.0,
+        "median_gap_s": statistics.median(gaps) if gaps else None,
+        "distinct_messages": len({message for _, message in alerts}),
+    }
+
+
+def replay(frames, settings=None, frame_width: int = 640, rules_path: str = "config/rules.yaml"):
+    """
+    Run one trace through a fresh decision engine.
+
+    :param frames: List of (timestamp, DetectionBatch) from read_trace()
+    :param settings: Optional dict with 'center_distance', 'side_distance',
+                     'cooldown' (overrides the profile) and 'profile'
+    :return: Dict of settings, alert counts and fatigue statistics
+    """
+    settings = dict(settings or {})
+    clock = ManualClock(frames[0][0] if frames else 0.0)
+    logger = _EventLogger()
+
+    thresholds = {
+        key: settings[key] for key in ("center_distance", "side_distance") if key in settings
+    }
+    engine = DecisionEngine(
+        frame_width=frame_width,
+        rules_path=rules_path,
+        logger=logger,
+        clock=clock,
+        profile=settings.get("profile"),
+        thresholds=thresholds,
+    )
+    if settings.get("cooldown") is not None:
+        engine.cooldown_seconds = settings["cooldown"]
+
+    alerts = []
+    labels = Counter()
+    start = time.perf_counter()
+
+    for timestamp, batch in frames:
+        clock.set(timestamp)
+        decision = engine.evaluate(batch)
+        if decision:
+            alerts.append((timestamp, (decision.template_id, decision.label, decision.direction)))
+
+    elapsed = time.perf_counter() - start
+    labels.update(engine.metrics.object_counter)
+    duration = frames[-1][0] - frames[0][0] if frames else 0.0
+
+    return {
+        "settings": settings,
+        "frames": len(frames),
+        "duration_s": duration,
+        "replay_s": elapsed,
+        "speedup": duration / elapsed if elapsed > 0 else 0.0,
+        "matched": logger.events,
+        **fatigue_stats(alerts, duration),
+        "top_labels": labels.most_common(3),
+    }
+
+
+# --------------------------------------------------
+
+def expand_grid(grid):
+    """
+    Every combination of the given setting values.
+
+    :param grid: Dict setting -> list of values (empty lists are ignored)
+    :return: List of settings dicts
+    """
+    keys = [key for key in SETTINGS if grid.get(key)]
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+_worker_frames = None
+
+
+def _init_worker(path, frame_width):
+    # Each worker parses the trace once, not once per configuration
+    global _worker_frames
+    _worker_frames = read_trace(path, frame_width)
+
+
+def _replay_in_worker(settings, frame_width, rules_path):
+    return replay(_worker_frames, settings, frame_width, rules_path)
+
+
+def sweep(path, grid, workers: int = None, frame_width: int = 640,
+          rules_path: str = "config/rules.yaml"):
+    """
+    Replay a trace under every configuration of a settings grid.
+
+    :param path: Trace or decision log to replay
+    :param grid: Dict setting -> list of values (see expand_grid)
+    :param workers: Worker processes (default: CPU count)
+    :return: List of replay() results, in grid order
+    """
+    configurations = expand_grid(grid) or [{}]
+
+    if workers == 1 or len(configurations) == 1:
+        frames = read_trace(path, frame_width)
+        return [replay(frames, settings, frame_width, rules_path) for settings in configurations]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(str(path), frame_width),
+    ) as executor:
+        futures = [
+            executor.submit(_replay_in_worker, settings, frame_width, rules_path)
+            for settings in configurations
+        ]
+        return [future.result() for future in futures]
+
+
+def print_results(results):
+    keys = [key for key in SETTINGS if any(key in r["settings"] for r in results)]
+    header = "".join(f"{key:>16}" for key in keys)
+    print(f"{header}  {'alerts':>7} {'per min':>8} {'peak/min':>9} {'repeat':>7} {'median gap':>11}")
+
+    for result in results:
+        values = "".join(f"{str(result['settings'].get(key, '-')):>16}" for key in keys)
+        gap = result["median_gap_s"]
+        print(
+            f"{values}  {result['alerts']:>7} {result['alerts_per_min']:>8.2f} "
+            f"{result['peak_per_min']:>9} {result['repeat_rate']:>7.0%} "
+            f"{'-' if gap is None else f'{gap:.1f}s':>11}"
+        )
+
+    if results:
+        first = results[0]
+        print(f"[INFO] {first['frames']} frames, {first['duration_s']:.1f}s of session per "
+              f"configuration, replayed at {first['speedup']:.0f}x real time")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a Vision I trace offline")
+    parser.add_argument("trace", help="Detection trace or decision log")
+    parser.add_argument("--center", type=float, nargs="+", help="Center distance thresholds")
+    parser.add_argument("--side", type=float, nargs="+", help="Side distance thresholds")
+    parser.add_argument("--cooldown", type=float, nargs="+", help="Cooldowns in seconds")
+    parser.add_argument("--profile", nargs="+", help="User profile names")
+    parser.add_argument("--frame-width", type=int, default=640)
+    parser.add_argument("--rules", default="config/rules.yaml")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--json", help="Also write results to this file")
+    args = parser.parse_args()
+
+    grid = {
+        "center_distance": args.center,
+        "side_distance": args.side,
+        "cooldown": args.cooldown,
+        "profile": args.profile,
+    }
+    results = sweep(args.trace, grid, args.workers, args.frame_width, args.rules)
+    print_results(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"[INFO] Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Detection traces for Vision I.
+
+A trace is a JSONL file (optionally gzip-compressed) with one
+line per processed frame:
+
+    {"t": 1718000000.12, "detections": [{"label": "person",
+     "confidence": 0.91, "bbox": [x1, y1, x2, y2]}, ...]}
+
+Traces are recorded during live runs and replayed offline
+through the decision stack. Decision logs (logs/decisions.jsonl
+and binary .bin logs) can be replayed too: each logged event is
+turned back into one synthetic detection from its label,
+distance and direction. Those only contain frames that produced
+an alert, so they suit cooldown and fatigue studies rather than
+threshold tuning.
+"""
+
+import gzip
+import json
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from src.utils.clock import wall_clock
+from src.utils.logger import read_binary_log
+from src.vision.detections import DetectionBatch
+
+
+DIRECTION_CENTERS = {"LEFT": 1 / 6, "CENTER": 1 / 2, "RIGHT": 5 / 6}
+
+
+def _open(path, mode):
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class TraceRecorder:
+    def __init__(self, path, clock=None):
+        """
+        :param path: Trace file (.jsonl or .jsonl.gz)
+        :param clock: Callable returning the current time (default: wall clock)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.clock = clock or wall_clock
+        self.file = _open(self.path, "a")
+        self.lock = threading.Lock()
+        self.frames = 0
+
+    def record(self, detections):
+        """
+        Append one frame's detections.
+
+        :param detections: DetectionBatch or list of detection dicts
+        """
+        if isinstance(detections, DetectionBatch):
+            detections = detections.to_dicts()
+
+        line = json.dumps({
+            "t": round(self.clock(), 4),
+            "detections": [
+                {
+                    "label": obj["label"],
+                    "confidence": round(float(obj.get("confidence", 1.0)), 3),
+                    "bbox": [round(float(v), 1) for v in obj["bbox"]],
+                }
+                for obj in detections
+            ],
+        })
+
+        with self.lock:
+            self.file.write(line + "\n")
+            self.frames += 1
+
+    def wrap(self, detect):
+        """
+        Record the output of a detect callable.
+        """
+
+        def recorded(frame):
+            detections = detect(frame)
+            self.record(detections)
+            return detections
+
+        return recorded
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+
+# --------------------------------------------------
+
+class _LabelTable:
+    """
+    Stable label -> class id mapping shared by all frames of a trace,
+    so the tracker sees consistent class ids.
+    """
+
+    def __init__(self):
+        self.ids = {}
+        self.names = {}
+
+    def batch(self, detections):
+        if not detections:
+            return DetectionBatch.empty(self.names)
+
+        class_ids = []
+        for obj in detections:
+            label = obj["label"]
+            if label not in self.ids:
+                self.ids[label] = len(self.ids)
+                self.names[self.ids[label]] = label
+            class_ids.append(self.ids[label])
+
+        return DetectionBatch(
+            np.array([obj["bbox"] for obj in detections], dtype=np.float64).reshape(-1, 4),
+            np.array([obj.get("confidence", 1.0) for obj in detections], dtype=np.float32),
+            np.array(class_ids, dtype=np.int16),
+            self.names,
+        )
+
+
+def _synthetic_detection(event, frame_width, reference_height=170.0):
+    """
+    Detection box reproducing a logged event's distance and direction.
+    """
+    distance = event.get("distance")
+    height = reference_height / distance if distance else 100.0
+    center_x = DIRECTION_CENTERS.get(event.get("direction"), 0.5) * frame_width
+    bottom = frame_width * 0.75
+
+    return {
+        "label": event.get("label") or "object",
+        "confidence": 1.0,
+        "bbox": [center_x - height / 4, bottom - height, center_x + height / 4, bottom],
+    }
+
+
+def read_trace(path, frame_width: int = 640):
+    """
+    Load a detection trace or decision log.
+
+    :param path: Trace (.jsonl[.gz]) or decision log (.jsonl[.gz], .bin[.gz])
+    :param frame_width: Frame width used to place synthetic boxes
+    :return: List of (timestamp, DetectionBatch), in time order
+    """
+    path = Path(path)
+    table = _LabelTable()
+
+    if ".bin" in path.suffixes:
+        events = list(read_binary_log(path))
+    else:
+        with _open(path, "r") as f:
+            events = [json.loads(line) for line in f if line.strip()]
+
+    frames = []
+    for event in events:
+        if "detections" in event:
+            frames.append((event["t"], table.batch(event["detections"])))
+        else:
+            detection = _synthetic_detection(event, frame_width)
+            frames.append((event["timestamp"], table.batch([detection])))
+
+    frames.sort(key=lambda item: item[0])
+    return frames
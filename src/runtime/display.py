@@ -0,0 +1,121 @@
+"""
+Frame display for Vision I.
+
+The live window shows every frame and polls the keyboard for
+the exit key. Headless units skip all GUI work; they can
+optionally publish a downscaled preview at a low fixed rate,
+either to a window or to an image file.
+"""
+
+import os
+import time
+from pathlib import Path
+
+
+WINDOW_NAME = "Vision I - Live Feed"
+
+
+class Display:
+    """
+    Headless display: shows nothing.
+    """
+
+    def show(self, image):
+        """
+        Present a frame.
+
+        :return: True if the user asked to exit
+        """
+        return False
+
+    def close(self):
+        pass
+
+
+class LiveDisplay(Display):
+    def __init__(self):
+        import cv2
+
+        self.cv2 = cv2
+
+    def show(self, image):
+        cv2 = self.cv2
+
+        # waitKey is required for the window to refresh and for key events
+        cv2.imshow(WINDOW_NAME, image)
+        return cv2.waitKey(1) & 0xFF == ord('q')
+
+    def close(self):
+        self.cv2.destroyAllWindows()
+
+
+class PreviewDisplay(Display):
+    def __init__(self, target: str = "window", fps: float = 2.0, scale: float = 0.25,
+                 path: str = "logs/preview.jpg", quality: int = 70):
+        """
+        Throttled, downscaled preview.
+
+        :param target: 'window' or 'file'
+        :param fps: Preview updates per second
+        :param scale: Downscale factor applied before publishing
+        :param path: Image file rewritten on each update (file target)
+        :param quality: JPEG quality for the file target
+        """
+        if target not in ("window", "file"):
+            raise ValueError(f"Unknown preview target: {target}")
+
+        import cv2
+
+        self.cv2 = cv2
+        self.target = target
+        self.interval = 1.0 / fps if fps > 0 else 0.0
+        self.scale = scale
+        self.path = Path(path)
+        self.quality = quality
+        self.last_update = 0.0
+        self.published = 0
+
+        if target == "file":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def show(self, image):
+        now = time.time()
+        if now - self.last_update < self.interval:
+            return False
+        self.last_update = now
+        cv2 = self.cv2
+
+        if self.scale != 1.0:
+            image = cv2.resize(
+                image, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA
+            )
+        self.published += 1
+
+        if self.target == "window":
+            cv2.imshow(WINDOW_NAME, image)
+            return cv2.waitKey(1) & 0xFF == ord('q')
+
+        # Write then rename so readers never see a partial image
+        tmp = self.path.with_name(self.path.stem + ".tmp" + self.path.suffix)
+        if cv2.imwrite(str(tmp), image, [cv2.IMWRITE_JPEG_QUALITY, self.quality]):
+            os.replace(tmp, self.path)
+        return False
+
+    def close(self):
+        if self.target == "window":
+            self.cv2.destroyAllWindows()
+
+
+def create_display(headless: bool = False, preview: str = None, fps: float = 2.0,
+                   scale: float = 0.25, path: str = "logs/preview.jpg"):
+    """
+    Build the display for the configured run mode.
+
+    :param headless: Skip the full-rate live window
+    :param preview: None, 'window' or 'file' (headless only)
+    """
+    if not headless:
+        return LiveDisplay()
+    if preview in ("window", "file"):
+        return PreviewDisplay(preview, fps, scale, path)
+    return Display()
@@ -0,0 +1,223 @@
+"""
+Latency-budget governor for Vision I.
+
+Watches end-to-end latency (capture to decision) per frame and
+moves along a quality ladder to hold a configured budget:
+lower inference resolution, skipped detection frames, a higher
+confidence threshold (fewer boxes to post-process and track)
+and, optionally, a lighter model variant.
+
+Hysteresis keeps it from oscillating: quality drops when the
+windowed latency percentile exceeds the budget, and is only
+restored once latency stays well below it. Every change waits
+for a fresh window measured at the new level.
+
+Backends with a fixed input shape (exported ONNX / OpenVINO
+models) cannot change resolution per call, so 'imgsz' is dropped
+from the ladder for them and levels left identical are merged.
+"""
+
+import threading
+from collections import deque
+
+import numpy as np
+
+
+DEFAULT_LEVELS = (
+    {},
+    {"imgsz": 480},
+    {"imgsz": 416, "skip": 1},
+    {"imgsz": 320, "skip": 2, "confidence": 0.6},
+)
+
+
+class LatencyGovernor:
+    def __init__(
+        self,
+        detector,
+        budget_ms: float = 150.0,
+        levels=DEFAULT_LEVELS,
+        percentile: float = 90,
+        window: int = 30,
+        upgrade_ratio: float = 0.6,
+        load_model=None,
+        metrics=None,
+    ):
+        """
+        :param detector: ObjectDetector whose settings are adjusted
+        :param budget_ms: End-to-end latency budget per frame
+        :param levels: Quality ladder, best first. Each level may set
+                       'imgsz', 'skip' (frames between detections),
+                       'confidence' and 'model'; missing keys keep the
+                       detector's configured value
+        :param percentile: Latency percentile compared to the budget
+        :param window: Frames measured before each decision
+        :param upgrade_ratio: Restore quality only below this fraction
+                              of the budget
+        :param load_model: Callable mapping a model path to a loaded
+                           backend (needed for 'model' levels)
+        :param metrics: Optional MetricsCollector for governor counters
+        """
+        self.detector = detector
+        self.budget = budget_ms / 1000
+        self.levels = self._usable_levels(levels, detector.backend)
+        self.percentile = percentile
+        self.window = max(1, int(window))
+        self.upgrade_ratio = upgrade_ratio
+        self.load_model = load_model
+        self.metrics = metrics
+
+        # Configured settings, restored by keys a level leaves unset
+        self.base = {
+            "imgsz": None,
+            "skip": 0,
+            "confidence": detector.confidence_threshold,
+            "model": None,
+        }
+        self.backends = {None: detector.backend}
+        self.loading = set()
+        self.lock = threading.Lock()
+
+        self.latencies = deque(maxlen=self.window)
+        self.level = 0
+        self.skip = 0
+        self.frame_index = 0
+        self.last_batch = None
+        self.adjustments = 0
+
+    # --------------------------------------------------
+
+    @staticmethod
+    def _usable_levels(levels, backend):
+        """
+        Quality ladder with the settings the backend cannot apply removed.
+        """
+        levels = [dict(level or {}) for level in levels] or [{}]
+        if getattr(backend, "dynamic_imgsz", True):
+            return levels
+
+        if any("imgsz" in level for level in levels):
+            print(f"[GOVERNOR] {backend.name} backend has a fixed input size "
+                  f"({backend.imgsz}px); imgsz levels ignored")
+
+        usable = []
+        for level in levels:
+            level.pop("imgsz", None)
+            if not usable or level != usable[-1]:
+                usable.append(level)
+        return usable
+
+    def setting(self, key, level=None):
+        level = self.levels[self.level if level is None else level]
+        return level.get(key, self.base[key])
+
+    def observe(self, latency):
+        """
+        Record one frame's end-to-end latency and adjust if needed.
+
+        :param latency: Seconds from capture to decision
+        :return: New level if an adjustment was made, else None
+        """
+        self.latencies.append(latency)
+        if len(self.latencies) < self.window:
+            return None
+
+        measured = float(np.percentile(self.latencies, self.percentile))
+
+        if measured > self.budget and self.level < len(self.levels) - 1:
+            return self._set_level(self.level + 1, measured)
+        if measured < self.budget * self.upgrade_ratio and self.level > 0:
+            return self._set_level(self.level - 1, measured)
+        return None
+
+    def _set_level(self, level, measured):
+        previous = self.level
+        self.level = level
+        self.latencies.clear()
+        self.adjustments += 1
+        self.apply()
+
+        direction = "down" if level > previous else "up"
+        print(
+            f"[GOVERNOR] Quality {direction}: level {previous} -> {level} "
+            f"(p{self.percentile:g} {measured * 1000:.0f} ms, budget {self.budget * 1000:.0f} ms) "
+            f"{self.describe()}"
+        )
+
+        if self.metrics is not None:
+            self.metrics.increment("governor_adjustments")
+            self.metrics.set_gauge("governor_level", level)
+        return level
+
+    def describe(self):
+        imgsz = self.setting("imgsz") or self.detector.backend.imgsz
+        model = self.setting("model") or "configured"
+        return (
+            f"imgsz={imgsz} skip={self.setting('skip')} "
+            f"confidence={self.setting('confidence'):.2f} model={model}"
+        )
+
+    # --------------------------------------------------
+
+    def apply(self):
+        """
+        Push the current level's settings to the detector.
+        """
+        detector = self.detector
+        detector.max_imgsz = self.setting("imgsz")
+        detector.confidence_threshold = self.setting("confidence")
+        self.skip = max(0, int(self.setting("skip")))
+
+        backend = self._backend(self.setting("model"))
+        if backend is not None and backend is not detector.backend:
+            detector.backend = backend
+            detector.model = backend.model
+
+    def _backend(self, model):
+        """
+        Backend for a model variant, loaded in the background on first use.
+
+        :return: Loaded backend, or None while it is still loading
+        """
+        with self.lock:
+            if model in self.backends:
+                return self.backends[model]
+            if self.load_model is None or model in self.loading:
+                return None
+            self.loading.add(model)
+
+        def load():
+            try:
+                backend = self.load_model(model)
+            except Exception as e:
+                print(f"[WARN] Governor could not load model variant {model}: {e}")
+                backend = self.backends[None]
+            with self.lock:
+                self.backends[model] = backend
+                self.loading.discard(model)
+            print(f"[GOVERNOR] Model variant ready: {model}")
+            # Switch now if the governor is still at a level using it
+            if self.setting("model") == model:
+                self.apply()
+
+        threading.Thread(target=load, name="vision-governor-load", daemon=True).start()
+        return None
+
+    # --------------------------------------------------
+
+    def wrap(self, detect):
+        """
+        Apply the frame-skip setting around a detect callable.
+
+        Skipped frames reuse the last detections.
+        """
+
+        def governed(image):
+            index = self.frame_index
+            self.frame_index += 1
+            if self.last_batch is not None and index % (self.skip + 1):
+                return self.last_batch
+            self.last_batch = detect(image)
+            return self.last_batch
+
+        return governed
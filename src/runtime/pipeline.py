@@ -0,0 +1,202 @@
+"""
+Pipelined runtime for Vision I.
+
+Runs capture, detection, decision and speech as separate
+stages joined by bounded queues. Each queue keeps only the
+newest items (latest-frame-wins), so throughput is set by the
+slowest stage instead of the sum of all stages.
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class LatestQueue:
+    def __init__(self, maxsize: int = 1):
+        """
+        Bounded queue that drops the oldest item when full.
+
+        :param maxsize: Maximum number of queued items
+        """
+        self.maxsize = max(1, int(maxsize))
+        self.items = deque()
+        self.dropped = 0
+        self.condition = threading.Condition()
+
+    def put(self, item):
+        """
+        Add an item, discarding the oldest one if the queue is full.
+        """
+        with self.condition:
+            if len(self.items) >= self.maxsize:
+                self.items.popleft()
+                self.dropped += 1
+            self.items.append(item)
+            self.condition.notify()
+
+    def get(self, timeout: float = 0.1):
+        """
+        Remove and return the oldest queued item.
+
+        :param timeout: Seconds to wait for an item
+        :return: Item, or None if the wait timed out
+        """
+        with self.condition:
+            if not self.items:
+                self.condition.wait(timeout)
+            if not self.items:
+                return None
+            return self.items.popleft()
+
+    def depth(self):
+        return len(self.items)
+
+
+class PipelineStage(threading.Thread):
+    def __init__(self, name, func, stop_event, inbox=None, outbox=None):
+        """
+        A single pipeline stage running on its own thread.
+
+        :param name: Stage name used in reports
+        :param func: Callable applied to each item; a source stage
+                     (no inbox) calls it without arguments
+        :param stop_event: Shared event used to stop the pipeline
+        :param inbox: Queue to read items from (None for sources)
+        :param outbox: Queue to forward results to (None for sinks)
+        """
+        super().__init__(name=f"vision-{name}", daemon=True)
+        self.stage_name = name
+        self.func = func
+        self.stop_event = stop_event
+        self.inbox = inbox
+        self.outbox = outbox
+
+        self.processed = 0
+        self.busy_time = 0.0
+        self.error = None
+
+    def run(self):
+        try:
+            while not self.stop_event.is_set():
+                if self.inbox is None:
+                    item = None
+                else:
+                    item = self.inbox.get()
+                    if item is None:
+                        continue
+
+                start = time.perf_counter()
+                result = self.func() if self.inbox is None else self.func(item)
+                self.busy_time += time.perf_counter() - start
+                self.processed += 1
+
+                if result is StopIteration:
+                    self.stop_event.set()
+                    break
+
+                if result is not None and self.outbox is not None:
+                    self.outbox.put(result)
+
+        except Exception as e:
+            self.error = e
+            print(f"[PIPELINE ERROR] {self.stage_name}: {e}")
+            self.stop_event.set()
+
+
+class Pipeline:
+    def __init__(self, capture, detect, decide, speak, queue_size: int = 1):
+        """
+        Wire the four Vision I stages together.
+
+        Each stage callable returns the item for the next stage,
+        None to forward nothing, or StopIteration to end the run.
+
+        :param capture: Callable returning the next frame
+        :param detect: Callable mapping a frame to detections
+        :param decide: Callable mapping detections to a decision
+        :param speak: Callable consuming a decision
+        :param queue_size: Capacity of each inter-stage queue
+        """
+        self.stop_event = threading.Event()
+
+        self.queues = {
+            "detect": LatestQueue(queue_size),
+            "decide": LatestQueue(queue_size),
+            "speak": LatestQueue(queue_size),
+        }
+
+        self.stages = [
+            PipelineStage("capture", capture, self.stop_event,
+                          outbox=self.queues["detect"]),
+            PipelineStage("detect", detect, self.stop_event,
+                          inbox=self.queues["detect"],
+                          outbox=self.queues["decide"]),
+            PipelineStage("decide", decide, self.stop_event,
+                          inbox=self.queues["decide"],
+                          outbox=self.queues["speak"]),
+            PipelineStage("speak", speak, self.stop_event,
+                          inbox=self.queues["speak"]),
+        ]
+
+        self.start_time = None
+
+    def start(self):
+        self.start_time = time.time()
+        for stage in self.stages:
+            stage.start()
+
+    def stop(self, timeout: float = 2.0):
+        """
+        Signal all stages to stop and wait for them to finish.
+        """
+        self.stop_event.set()
+        for stage in self.stages:
+            if stage.is_alive():
+                stage.join(timeout)
+
+    def running(self):
+        return not self.stop_event.is_set()
+
+    def wait(self, timeout: float = None):
+        """
+        Block until the pipeline is stopped.
+
+        :return: True if the pipeline has stopped
+        """
+        return self.stop_event.wait(timeout)
+
+    def stats(self):
+        """
+        Per-stage throughput, queue depth and dropped-item counts.
+
+        :return: Dict keyed by stage name
+        """
+        elapsed = max(time.time() - (self.start_time or time.time()), 1e-6)
+        report = {}
+
+        for stage in self.stages:
+            queue = self.queues.get(stage.stage_name)
+            report[stage.stage_name] = {
+                "processed": stage.processed,
+                "fps": stage.processed / elapsed,
+                "busy_ms": (stage.busy_time / stage.processed * 1000)
+                if stage.processed else 0.0,
+                "queue_depth": queue.depth() if queue else 0,
+                "dropped": queue.dropped if queue else 0,
+            }
+
+        return report
+
+    def report(self):
+        """
+        Print per-stage pipeline statistics.
+        """
+        print("\n----------- PIPELINE STAGES -----------")
+        print(f"{'Stage':<10}{'Items':>8}{'FPS':>8}{'Busy ms':>10}{'Queue':>7}{'Dropped':>9}")
+        for name, s in self.stats().items():
+            print(
+                f"{name:<10}{s['processed']:>8}{s['fps']:>8.1f}"
+                f"{s['busy_ms']:>10.1f}{s['queue_depth']:>7}{s['dropped']:>9}"
+            )
+        print("---------------------------------------")
@@ -0,0 +1,75 @@
+"""
+Start-up timing for Vision I.
+
+Runs independent initialization steps (model load, camera
+open, TTS init) concurrently and records how long each took,
+so the banner can show where time-to-first-guidance goes.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class StartupTimer:
+    def __init__(self, max_workers: int = 4):
+        """
+        :param max_workers: Initialization steps run in parallel
+        """
+        self.origin = time.perf_counter()
+        self.steps = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="vision-init")
+        self.ready_at = None
+        self.first_frame_at = None
+
+    def measure(self, name, func, *args, **kwargs):
+        """
+        Run one step on the calling thread and record its duration.
+        """
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self.lock:
+                self.steps[name] = time.perf_counter() - start
+
+    def submit(self, name, func, *args, **kwargs):
+        """
+        Run a step on the init pool.
+
+        :param name: Step name to record, or None for a step that
+                     records its own sub-steps
+        :return: Future with the step's result
+        """
+        if name is None:
+            return self.executor.submit(func, *args, **kwargs)
+        return self.executor.submit(self.measure, name, func, *args, **kwargs)
+
+    def ready(self):
+        """
+        Mark initialization as finished.
+
+        :return: Seconds since start
+        """
+        self.executor.shutdown(wait=True)
+        self.ready_at = time.perf_counter() - self.origin
+        return self.ready_at
+
+    def first_frame(self):
+        """
+        Record the first processed frame (only the first call counts).
+        """
+        if self.first_frame_at is None:
+            self.first_frame_at = time.perf_counter() - self.origin
+            print(f"[INFO] First frame processed {self.first_frame_at:.2f}s after start")
+
+    def report(self):
+        """
+        Banner lines: total, then each step (steps ran concurrently,
+        so they add up to more than the total).
+        """
+        lines = [f"Startup (s)   : {self.ready_at or 0.0:.2f} to ready"]
+        for name, seconds in self.steps.items():
+            lines.append(f"  {name:<12}: {seconds:.2f}")
+        return lines
@@ -0,0 +1,358 @@
+"""
+Process-pool detection for Vision I.
+
+Runs several ObjectDetector instances in worker processes so
+inference and postprocessing use more than one core. Frames
+are written once into a multiprocessing.shared_memory ring and
+workers read them in place; only small task tuples and the
+columnar detection arrays cross the process boundary.
+Results are handed back in submission order.
+
+Every spawned worker process gets a new generation number that
+tags its messages, so a late result from a crashed worker is
+never mistaken for one from its replacement.
+"""
+
+import multiprocessing as mp
+import queue
+import time
+from collections import deque
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.vision.detections import DetectionBatch
+
+
+class SharedFrameRing:
+    def __init__(self, slots: int, shape, dtype=np.uint8, name: str = None):
+        """
+        Fixed-size frame slots in shared memory.
+
+        :param slots: Number of frame slots
+        :param shape: Frame shape (height, width, channels)
+        :param name: Attach to an existing ring instead of creating one
+        """
+        self.shape = (slots,) + tuple(shape)
+        self.dtype = np.dtype(dtype)
+        size = int(np.prod(self.shape)) * self.dtype.itemsize
+
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+
+        self.name = self.shm.name
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self.shm.buf)
+
+    def write(self, slot, frame):
+        """
+        Copy a frame into a slot.
+
+        :return: (height, width) of the stored frame
+        """
+        height, width = frame.shape[:2]
+        if height > self.shape[1] or width > self.shape[2]:
+            raise ValueError(
+                f"Frame {frame.shape} does not fit the shared ring {self.shape[1:]}"
+            )
+        np.copyto(self.array[slot, :height, :width], frame)
+        return height, width
+
+    def view(self, slot, height, width):
+        return self.array[slot, :height, :width]
+
+    def close(self):
+        self.array = None
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+
+def _worker_main(index, generation, detector_options, tasks, results):
+    """
+    Worker process: load the model once, then detect frames from the ring.
+    """
+    from src.vision.detector import ObjectDetector
+
+    try:
+        detector = ObjectDetector(**detector_options)
+    except Exception as e:
+        results.put(("error", index, generation, repr(e)))
+        return
+
+    results.put(("ready", index, generation, dict(detector.backend.names)))
+    ring = None
+
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+
+            seq, slot, height, width, ring_name, ring_shape, dtype = task
+            if ring is None or ring.name != ring_name:
+                if ring is not None:
+                    ring.close()
+                ring = SharedFrameRing(ring_shape[0], ring_shape[1:], dtype, name=ring_name)
+
+            batch = detector.detect_batch(ring.view(slot, height, width))
+            results.put(
+                ("result", index, generation, seq,
+                 batch.boxes, batch.confidences, batch.class_ids)
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if ring is not None:
+            ring.close()
+
+
+class _Worker:
+    __slots__ = ("process", "tasks", "generation", "inflight", "exited")
+
+    def __init__(self, process, tasks, generation):
+        self.process = process
+        self.tasks = tasks
+        self.generation = generation
+        self.inflight = {}      # seq -> (slot, height, width, attempts)
+        self.exited = False
+
+
+class DetectorPool:
+    def __init__(
+        self,
+        detector_options,
+        workers: int = 2,
+        slots: int = None,
+        restart: bool = True,
+        max_restarts: int = 3,
+    ):
+        """
+        :param detector_options: ObjectDetector keyword arguments
+        :param workers: Number of worker processes
+        :param slots: Frames in flight (default: 2 per worker)
+        :param restart: Replace crashed workers
+        :param max_restarts: Restarts allowed over the pool's lifetime
+        """
+        self.detector_options = dict(detector_options, warmup=True)
+        self.slots = slots or 2 * workers
+        self.restart = restart
+        self.max_restarts = max_restarts
+
+        self.context = mp.get_context("spawn")
+        self.results = self.context.Queue()
+        self.generations = 0
+        self.workers = [self._spawn(i) for i in range(max(1, int(workers)))]
+
+        self.ring = None
+        self.free_slots = deque(range(self.slots))
+        self.next_seq = 0
+        self.next_out = 0
+        self.done = {}          # seq -> DetectionBatch waiting for its turn
+        self.names = None
+
+        self.restarts = 0
+        self.failed = 0
+        self.closed = False
+
+    def _spawn(self, index):
+        generation = self.generations
+        self.generations += 1
+
+        tasks = self.context.Queue()
+        process = self.context.Process(
+            target=_worker_main,
+            args=(index, generation, self.detector_options, tasks, self.results),
+            name=f"vision-detector-{index}",
+            daemon=True,
+        )
+        process.start()
+        return _Worker(process, tasks, generation)
+
+    # --------------------------------------------------
+
+    def wait_ready(self, timeout: float = 120.0):
+        """
+        Block until at least one worker has loaded the model.
+
+        :return: Class id -> label mapping
+        """
+        deadline = time.time() + timeout
+        while self.names is None:
+            if time.time() > deadline:
+                raise TimeoutError("Detector workers did not start in time")
+            self._poll(0.1)
+        return self.names
+
+    def submit(self, frame, timeout: float = None):
+        """
+        Queue a frame for detection, waiting for a free ring slot.
+
+        :return: Sequence number of the frame
+        """
+        if self.ring is None:
+            self.ring = SharedFrameRing(self.slots, frame.shape, frame.dtype)
+
+        deadline = None if timeout is None else time.time() + timeout
+        while not self.free_slots:
+            if deadline is not None and time.time() > deadline:
+                raise TimeoutError("No free frame slot")
+            self._poll(0.05)
+
+        slot = self.free_slots.popleft()
+        height, width = self.ring.write(slot, frame)
+
+        seq = self.next_seq
+        self.next_seq += 1
+        self._dispatch(seq, slot, height, width, 0)
+        return seq
+
+    def _dispatch(self, seq, slot, height, width, attempts):
+        alive = [w for w in self.workers if w.process.is_alive()]
+        if not alive:
+            raise RuntimeError("All detector workers have exited")
+
+        worker = min(alive, key=lambda w: len(w.inflight))
+        worker.inflight[seq] = (slot, height, width, attempts)
+        worker.tasks.put(
+            (seq, slot, height, width, self.ring.name, self.ring.shape, self.ring.dtype.str)
+        )
+
+    def pending(self):
+        return self.next_seq - self.next_out
+
+    def collect(self, timeout: float = 0.0):
+        """
+        Return finished results in sequence order.
+
+        :param timeout: Seconds to wait for the next result in order
+        :return: List of (seq, DetectionBatch)
+        """
+        deadline = time.time() + timeout
+        while self.next_out not in self.done and self.next_out < self.next_seq:
+            remaining = deadline - time.time()
+            if remaining > 0:
+                self._poll(remaining)
+            elif not self._poll(0):
+                break
+
+        ready = []
+        while self.next_out in self.done:
+            ready.append((self.next_out, self.done.pop(self.next_out)))
+            self.next_out += 1
+        return ready
+
+    def drain(self, timeout: float = 10.0):
+        """
+        Wait for every submitted frame.
+
+        :return: List of (seq, DetectionBatch)
+        """
+        ready = []
+        deadline = time.time() + timeout
+        while self.pending() and time.time() < deadline:
+            ready.extend(self.collect(0.1))
+        return ready
+
+    # --------------------------------------------------
+
+    def _poll(self, timeout):
+        """
+        Handle one message from the workers, then check for crashes.
+
+        :return: True if a message was handled
+        """
+        try:
+            message = self.results.get(timeout=timeout) if timeout else self.results.get_nowait()
+        except queue.Empty:
+            message = None
+
+        if message is not None:
+            kind, index, generation = message[:3]
+            worker = self.workers[index]
+            if kind == "ready":
+                self.names = message[3]
+            elif generation != worker.generation:
+                # From a worker that has since been replaced
+                pass
+            elif kind == "error":
+                if generation < len(self.workers):
+                    raise RuntimeError(f"Detector worker {index} failed to start: {message[3]}")
+                # A replacement that cannot load the model is one more
+                # dead worker; _check_workers handles it once it exits
+                print(f"[X ERROR] Restarted detector worker {index} failed to start: "
+                      f"{message[3]}")
+            elif kind == "result":
+                self._complete(worker, *message[3:])
+
+        self._check_workers()
+        return message is not None
+
+    def _complete(self, worker, seq, boxes, confidences, class_ids):
+        task = worker.inflight.pop(seq, None)
+        if task is None:
+            return
+
+        self.free_slots.append(task[0])
+        self.done[seq] = DetectionBatch(boxes, confidences, class_ids, self.names or {})
+
+    def _check_workers(self):
+        if self.closed:
+            return
+
+        for index, worker in enumerate(self.workers):
+            if worker.exited or worker.process.is_alive():
+                continue
+
+            worker.exited = True
+            lost = worker.inflight
+            worker.inflight = {}
+            print(f"[X ERROR] Detector worker {index} exited "
+                  f"(code {worker.process.exitcode}) with {len(lost)} frames in flight")
+
+            if self.restart and self.restarts < self.max_restarts:
+                self.restarts += 1
+                self.workers[index] = self._spawn(index)
+
+            # Retry lost frames once; a frame that crashes twice is skipped
+            for seq, (slot, height, width, attempts) in lost.items():
+                if attempts < 1 and any(w.process.is_alive() for w in self.workers):
+                    self._dispatch(seq, slot, height, width, attempts + 1)
+                else:
+                    self.failed += 1
+                    self.free_slots.append(slot)
+                    self.done[seq] = DetectionBatch.empty(self.names)
+
+        if not any(worker.process.is_alive() for worker in self.workers):
+            raise RuntimeError("All detector workers have exited")
+
+    # --------------------------------------------------
+
+    def close(self, timeout: float = 5.0):
+        """
+        Stop all workers and release the shared ring.
+        """
+        if self.closed:
+            return
+        self.closed = True
+
+        for worker in self.workers:
+            if worker.process.is_alive():
+                worker.tasks.put(None)
+
+        deadline = time.time() + timeout
+        for worker in self.workers:
+            worker.process.join(max(deadline - time.time(), 0.1))
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join(1.0)
+
+        if self.ring is not None:
+            self.ring.close()
+            self.ring.unlink()
+            self.ring = None
+
+        print(f"[INFO] Detector pool stopped ({self.restarts} restarts, "
+              f"{self.failed} frames skipped)")
@@ -1,14 +1,25 @@
 """
 Alert escalation manager for Vision I.
 
-Determines severity and handling rules for alerts
-based on decision content.
+Determines severity and handling rules for alerts.
+Decisions carry their severity; free-text messages are
+classified by content.
 """
 
-LOW = 1
-MEDIUM = 2
-HIGH = 3
-CRITICAL = 4
+from enum import IntEnum
+
+
+class Severity(IntEnum):
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+
+LOW = Severity.LOW
+MEDIUM = Severity.MEDIUM
+HIGH = Severity.HIGH
+CRITICAL = Severity.CRITICAL
 
 
 class AlertManager:
@@ -20,13 +31,19 @@ class AlertManager:
             "Warning": CRITICAL,
         }
 
-    def classify(self, decision: str) -> int:
+    def classify(self, decision) -> Severity:
         """
         Determine severity level of a decision.
+
+        :param decision: Decision (severity read directly) or message text
         """
         if not decision:
             return LOW
 
+        severity = getattr(decision, "severity", None)
+        if severity is not None:
+            return severity
+
         for key, severity in self.severity_map.items():
             if key.lower() in decision.lower():
                 return severity
@@ -0,0 +1,137 @@
+"""
+Dynamic inference batching for Vision I.
+
+Frames submitted by many streams are collected into one
+batch until either the batch is full or the oldest frame has
+waited for the latency deadline, then run through the shared
+model in a single forward pass.
+"""
+
+import threading
+import time
+from collections import Counter, deque
+
+
+class InferenceRequest:
+    __slots__ = ("stream_id", "frame", "submitted", "done", "result", "error")
+
+    def __init__(self, stream_id, frame):
+        self.stream_id = stream_id
+        self.frame = frame
+        self.submitted = time.perf_counter()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self, timeout: float = None):
+        """
+        Block until the batch containing this frame has run.
+
+        :return: DetectionBatch for the frame
+        """
+        if not self.done.wait(timeout):
+            raise TimeoutError(f"Inference timed out for stream '{self.stream_id}'")
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class DynamicBatcher:
+    def __init__(self, detect_many, max_batch: int = 8, max_delay: float = 0.010):
+        """
+        :param detect_many: Callable mapping a list of frames to a list of results
+        :param max_batch: Largest batch sent to the model
+        :param max_delay: Seconds the oldest frame may wait for a batch to fill
+        """
+        self.detect_many = detect_many
+        self.max_batch = max(1, int(max_batch))
+        self.max_delay = max_delay
+
+        self.pending = deque()
+        self.condition = threading.Condition()
+        self.stop_event = threading.Event()
+        self.worker = None
+
+        # Stats
+        self.batches = 0
+        self.frames = 0
+        self.batch_sizes = Counter()
+        self.busy_time = 0.0
+
+    def start(self):
+        self.worker = threading.Thread(
+            target=self._run, name="vision-batcher", daemon=True
+        )
+        self.worker.start()
+        return self
+
+    def submit(self, stream_id, frame):
+        """
+        Queue a frame for the next batch.
+
+        :return: InferenceRequest to wait on
+        """
+        request = InferenceRequest(stream_id, frame)
+        with self.condition:
+            if self.stop_event.is_set():
+                raise RuntimeError("Batcher is stopped")
+            self.pending.append(request)
+            self.condition.notify()
+        return request
+
+    def _next_batch(self):
+        with self.condition:
+            while not self.pending and not self.stop_event.is_set():
+                self.condition.wait(0.1)
+
+            if not self.pending:
+                return []
+
+            # Wait for more frames until full or the oldest hits its deadline
+            deadline = self.pending[0].submitted + self.max_delay
+            while len(self.pending) < self.max_batch and not self.stop_event.is_set():
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self.condition.wait(remaining)
+
+            count = min(len(self.pending), self.max_batch)
+            return [self.pending.popleft() for _ in range(count)]
+
+    def _run(self):
+        while not self.stop_event.is_set() or self.pending:
+            batch = self._next_batch()
+            if not batch:
+                continue
+
+            start = time.perf_counter()
+            try:
+                results = self.detect_many([request.frame for request in batch])
+            except Exception as e:
+                print(f"[BATCHER ERROR] {e}")
+                for request in batch:
+                    request.error = e
+                    request.done.set()
+                continue
+
+            self.busy_time += time.perf_counter() - start
+            self.batches += 1
+            self.frames += len(batch)
+            self.batch_sizes[len(batch)] += 1
+
+            for request, result in zip(batch, results):
+                request.result = result
+                request.done.set()
+
+    def stop(self, timeout: float = 2.0):
+        """
+        Finish pending batches and stop the worker.
+        """
+        with self.condition:
+            self.stop_event.set()
+            self.condition.notify_all()
+        if self.worker is not None:
+            self.worker.join(timeout)
+
+    def average_batch_size(self):
+        return self.frames / self.batches if self.batches else 0.0
@@ -0,0 +1,351 @@
+"""
+Multi-stream inference server for Vision I.
+
+Serves several cameras or remote client devices from one
+process: frames from all streams share one detector through
+dynamic batching, while every stream keeps its own
+DecisionEngine (memory, motion, thresholds, profile) and
+receives its own decisions.
+
+Streams are either local frame sources read on their own
+thread, or remote clients posting encoded frames over HTTP.
+A stream that sends nothing for idle_timeout seconds is
+dropped (and its decision log closed) to make room for new
+ones:
+
+    POST /streams/<stream_id>/frames   (body: JPEG/PNG bytes)
+    GET  /streams                      (per-stream stats)
+"""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from src.server.batcher import DynamicBatcher
+from src.utils.metrics import MetricsCollector
+from src.vision.camera import Camera
+
+
+STREAM_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+FRAMES_PATH = re.compile(r"^/streams/([^/]+)/frames/?$")
+
+
+class StreamSession:
+    def __init__(self, stream_id, engine):
+        """
+        Per-stream decision state.
+
+        :param stream_id: Stream name
+        :param engine: DecisionEngine owned by this stream
+        """
+        self.stream_id = stream_id
+        self.engine = engine
+        self.lock = threading.Lock()
+
+        self.frames = 0
+        self.decisions = 0
+        self.last_decision = None
+        self.last_seen = time.time()
+
+    def evaluate(self, detections):
+        # Frames of one stream must reach its engine in order
+        with self.lock:
+            decision = self.engine.evaluate(detections)
+            self.engine.metrics.increment("frames")
+            self.frames += 1
+            self.last_seen = time.time()
+            if decision:
+                self.decisions += 1
+                self.last_decision = decision
+            return decision
+
+    def idle(self, now=None):
+        return (now or time.time()) - self.last_seen
+
+    def close(self):
+        """
+        Flush and close the stream's decision log.
+        """
+        with self.lock:
+            self.engine.logger.close()
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "decisions": self.decisions,
+            "last_decision": str(self.last_decision) if self.last_decision else None,
+            "context": self.engine.context.get(),
+            "idle_seconds": round(self.idle(), 1),
+        }
+
+
+class InferenceServer:
+    def __init__(
+        self,
+        detector,
+        engine_factory,
+        max_batch: int = 8,
+        max_delay: float = 0.010,
+        max_streams: int = 16,
+        idle_timeout: float = 300.0,
+        on_decision=None,
+    ):
+        """
+        :param detector: Shared ObjectDetector (needs detect_many)
+        :param engine_factory: Callable stream_id -> DecisionEngine
+        :param max_batch: Largest inference batch
+        :param max_delay: Seconds a frame may wait for its batch to fill
+        :param max_streams: Maximum number of concurrent streams
+        :param idle_timeout: Seconds without frames after which a stream's
+                             session is dropped (0 or None = never)
+        :param on_decision: Optional callback(stream_id, decision, detections)
+        """
+        self.detector = detector
+        self.engine_factory = engine_factory
+        self.max_streams = max_streams
+        self.idle_timeout = idle_timeout
+        self.on_decision = on_decision
+
+        self.batcher = DynamicBatcher(detector.detect_many, max_batch, max_delay)
+        self.metrics = MetricsCollector()
+        detector.metrics = self.metrics
+        self.sessions = {}
+        self.sessions_lock = threading.Lock()
+
+        self.stop_event = threading.Event()
+        self.threads = []
+        self.http = None
+        self.start_time = None
+
+    # --------------------------------------------------
+
+    def start(self):
+        self.start_time = time.time()
+        self.batcher.start()
+        return self
+
+    def session(self, stream_id):
+        """
+        Get or create the session for a stream.
+        """
+        expired = []
+        try:
+            with self.sessions_lock:
+                session = self.sessions.get(stream_id)
+                if session is None:
+                    expired = self._expire()
+                    if len(self.sessions) >= self.max_streams:
+                        raise RuntimeError(f"Stream limit reached ({self.max_streams})")
+                    session = StreamSession(stream_id, self.engine_factory(stream_id))
+                    self.sessions[stream_id] = session
+                    print(f"[SERVER] Stream '{stream_id}' connected")
+                return session
+        finally:
+            # Closing flushes the log, so it happens outside the lock
+            for old in expired:
+                old.close()
+
+    def _expire(self):
+        """
+        Remove idle sessions (caller holds sessions_lock).
+
+        :return: Removed sessions, still to be closed
+        """
+        if not self.idle_timeout:
+            return []
+
+        now = time.time()
+        expired = [s for s in self.sessions.values() if s.idle(now) >= self.idle_timeout]
+        for session in expired:
+            del self.sessions[session.stream_id]
+            print(f"[SERVER] Stream '{session.stream_id}' idle for "
+                  f"{session.idle(now):.0f}s; dropped after {session.frames} frames, "
+                  f"{session.decisions} decisions")
+        return expired
+
+    def process(self, stream_id, frame, timeout: float = 5.0):
+        """
+        Run one frame of a stream through detection and its decision engine.
+
+        :return: (decision or None, DetectionBatch)
+        """
+        session = self.session(stream_id)
+        start = time.perf_counter()
+        detections = self.batcher.submit(stream_id, frame).wait(timeout)
+        decision = session.evaluate(detections)
+        self.metrics.observe("end_to_end", time.perf_counter() - start)
+        self.metrics.increment("frames")
+
+        if decision and self.on_decision is not None:
+            self.on_decision(stream_id, decision, detections)
+
+        return decision, detections
+
+    # --------------------------------------------------
+    # Local sources
+    # --------------------------------------------------
+
+    def add_source(self, stream_id, source, **camera_options):
+        """
+        Serve a local frame source (device, video, image directory, raw dump).
+
+        :param camera_options: Passed to Camera
+        """
+        camera = Camera(source, **camera_options)
+        self.session(stream_id)
+
+        thread = threading.Thread(
+            target=self._source_loop, args=(stream_id, camera),
+            name=f"vision-stream-{stream_id}", daemon=True,
+        )
+        thread.start()
+        self.threads.append(thread)
+
+    def _source_loop(self, stream_id, camera):
+        try:
+            while not self.stop_event.is_set():
+                frame = camera.read(timeout=1.0)
+                if frame is None:
+                    if not camera.threaded or camera.finished:
+                        break
+                    continue
+                self.process(stream_id, frame.image)
+        except Exception as e:
+            print(f"[SERVER ERROR] Stream '{stream_id}': {e}")
+        finally:
+            camera.release()
+            print(f"[SERVER] Stream '{stream_id}' ended")
+
+    # --------------------------------------------------
+    # Remote clients
+    # --------------------------------------------------
+
+    def serve_http(self, host: str = "127.0.0.1", port: int = 8090):
+        """
+        Accept frames from remote clients over HTTP.
+        """
+        self.http = ThreadingHTTPServer((host, port), self._handler())
+        self.http.daemon_threads = True
+
+        thread = threading.Thread(
+            target=self.http.serve_forever, name="vision-server-http", daemon=True
+        )
+        thread.start()
+        self.threads.append(thread)
+        print(f"[INFO] Inference server at http://{host}:{port}/streams")
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, status, payload):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path.rstrip("/") != "/streams":
+                    self._reply(404, {"error": "not found"})
+                    return
+                self._reply(200, server.stats())
+
+            def do_POST(self):
+                match = FRAMES_PATH.match(self.path)
+                if not match:
+                    self._reply(404, {"error": "not found"})
+                    return
+
+                stream_id = match.group(1)
+                if not STREAM_ID.match(stream_id):
+                    self._reply(400, {"error": "invalid stream id"})
+                    return
+
+                import cv2
+
+                length = int(self.headers.get("Content-Length") or 0)
+                data = np.frombuffer(self.rfile.read(length), dtype=np.uint8)
+                frame = cv2.imdecode(data, cv2.IMREAD_COLOR) if length else None
+                if frame is None:
+                    self._reply(400, {"error": "body must be an encoded image"})
+                    return
+
+                try:
+                    decision, detections = server.process(stream_id, frame)
+                except RuntimeError as e:
+                    self._reply(503, {"error": str(e)})
+                    return
+                except TimeoutError as e:
+                    self._reply(504, {"error": str(e)})
+                    return
+
+                self._reply(200, {
+                    "stream": stream_id,
+                    "decision": str(decision) if decision else None,
+                    "detections": detections.to_dicts(),
+                })
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    # --------------------------------------------------
+
+    def running(self):
+        """
+        True while the HTTP endpoint or any local source is active.
+        """
+        if self.stop_event.is_set():
+            return False
+        return self.http is not None or any(t.is_alive() for t in self.threads)
+
+    def wait(self, timeout: float = None):
+        return self.stop_event.wait(timeout)
+
+    def stop(self, timeout: float = 2.0):
+        self.stop_event.set()
+        if self.http is not None:
+            self.http.shutdown()
+            self.http.server_close()
+        for thread in self.threads:
+            thread.join(timeout)
+        self.batcher.stop(timeout)
+
+    def stats(self):
+        with self.sessions_lock:
+            sessions = dict(self.sessions)
+
+        elapsed = max(time.time() - (self.start_time or time.time()), 1e-6)
+        return {
+            "uptime_seconds": round(elapsed, 1),
+            "frames": self.batcher.frames,
+            "fps": round(self.batcher.frames / elapsed, 2),
+            "batches": self.batcher.batches,
+            "average_batch_size": round(self.batcher.average_batch_size(), 2),
+            "streams": {stream_id: s.stats() for stream_id, s in sessions.items()},
+        }
+
+    def report(self):
+        """
+        Print server throughput and each stream's final report.
+        """
+        stats = self.stats()
+        print("\n----------- INFERENCE SERVER -----------")
+        print(f"Frames                 : {stats['frames']} ({stats['fps']:.1f} FPS)")
+        print(f"Batches                : {stats['batches']} "
+              f"(avg size {stats['average_batch_size']:.2f})")
+
+        for stage, latency in self.metrics.latency_summary().items():
+            print(f"  {stage:<21}: p50 {latency['p50']:6.1f} ms  p99 {latency['p99']:6.1f} ms")
+
+        for stream_id, session in self.sessions.items():
+            print(f"\n[Stream '{stream_id}'] frames: {session.frames}, "
+                  f"decisions: {session.decisions}")
+            session.engine.final_report()
@@ -0,0 +1,274 @@
+"""
+Multi-object tracker for Vision I.
+
+Associates detections across frames so each object keeps a
+persistent track ID, a bounded box history and a velocity.
+Association uses a vectorized IoU cost matrix with greedy
+assignment; tracks are born from unmatched detections and
+die after missing too many frames.
+"""
+
+from collections import deque
+
+import numpy as np
+
+
+def iou_matrix(a, b):
+    """
+    Pairwise IoU between two (N, 4) and (M, 4) box arrays.
+    """
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros((len(a), len(b)), dtype=np.float32)
+
+    a = a.astype(np.float32, copy=False)
+    b = b.astype(np.float32, copy=False)
+
+    # Intersection width/height, computed in place to limit temporaries
+    w = np.minimum(a[:, None, 2], b[None, :, 2])
+    w -= np.maximum(a[:, None, 0], b[None, :, 0])
+    np.maximum(w, 0, out=w)
+
+    h = np.minimum(a[:, None, 3], b[None, :, 3])
+    h -= np.maximum(a[:, None, 1], b[None, :, 1])
+    np.maximum(h, 0, out=h)
+
+    inter = w
+    inter *= h
+
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+
+    union = h
+    np.add(area_a[:, None], area_b[None, :], out=union)
+    union -= inter
+    np.maximum(union, 1e-9, out=union)
+
+    inter /= union
+    return inter
+
+
+class Track:
+    __slots__ = ("track_id", "label", "history")
+
+    def __init__(self, track_id, label, bbox, history_size):
+        """
+        Per-track record kept alongside the tracker's state arrays.
+
+        :param track_id: Persistent track ID
+        :param label: Object label
+        :param bbox: First (x1, y1, x2, y2) box
+        :param history_size: Maximum number of boxes kept
+        """
+        self.track_id = track_id
+        self.label = label
+        self.history = deque([bbox], maxlen=history_size)
+
+    @property
+    def bbox(self):
+        return self.history[-1]
+
+
+class MultiObjectTracker:
+    def __init__(
+        self,
+        iou_threshold: float = 0.3,
+        max_misses: int = 5,
+        history_size: int = 16,
+        velocity_smoothing: float = 0.5,
+    ):
+        """
+        :param iou_threshold: Minimum IoU to associate a detection with a track
+        :param max_misses: Updates a track may go unmatched before it dies
+        :param history_size: Boxes kept per track
+        :param velocity_smoothing: Weight of the newest velocity sample (0-1)
+        """
+        self.iou_threshold = iou_threshold
+        self.max_misses = max_misses
+        self.history_size = history_size
+        self.velocity_smoothing = velocity_smoothing
+
+        self.tracks = {}
+        self.removed = []
+        self.next_id = 1
+        self.frame = 0
+
+        # Track state, one row per live track
+        self.ids = np.empty(0, dtype=np.int64)
+        self.codes = np.empty(0, dtype=np.int32)
+        self.boxes = np.empty((0, 4), dtype=np.float64)
+        self.previous_boxes = np.empty((0, 4), dtype=np.float64)
+        self.velocities = np.empty((0, 4), dtype=np.float64)
+        self.last_frame = np.empty(0, dtype=np.int64)
+        self.hits = np.empty(0, dtype=np.int32)
+        self.misses = np.empty(0, dtype=np.int32)
+        self.ages = np.empty(0, dtype=np.int32)
+
+        self.label_codes = {}
+        self._names = None
+        self._lut = None
+
+    # --------------------------------------------------
+
+    def _label_codes(self, batch):
+        """
+        Stable integer code per label, independent of the batch's class ids.
+        """
+        if batch.names is not self._names:
+            size = max(batch.names, default=-1) + 1
+            lut = np.full(size, -1, dtype=np.int32)
+            for class_id, name in batch.names.items():
+                lut[class_id] = self.label_codes.setdefault(name, len(self.label_codes))
+            self._names = batch.names
+            self._lut = lut
+        return self._lut[batch.class_ids]
+
+    def _assign(self, iou):
+        """
+        Greedy assignment on an IoU matrix, best pairs first.
+
+        :return: (detection indices, track indices) of matched pairs
+        """
+        rows, cols = np.nonzero(iou >= self.iou_threshold)
+
+        # Common case: every candidate pair is unambiguous
+        if len(np.unique(rows)) == len(rows) and len(np.unique(cols)) == len(cols):
+            return rows, cols
+
+        order = np.argsort(-iou[rows, cols], kind="stable")
+        matched_r, matched_c = [], []
+        used_r, used_c = set(), set()
+        for r, c in zip(rows[order].tolist(), cols[order].tolist()):
+            if r in used_r or c in used_c:
+                continue
+            used_r.add(r)
+            used_c.add(c)
+            matched_r.append(r)
+            matched_c.append(c)
+
+        return np.array(matched_r, dtype=np.intp), np.array(matched_c, dtype=np.intp)
+
+    # --------------------------------------------------
+
+    def update(self, batch, frames: int = 1):
+        """
+        Associate a frame's detections with existing tracks.
+
+        :param batch: DetectionBatch for the current frame
+        :param frames: Frames elapsed since the previous update
+        :return: Array of track IDs, one per detection
+        """
+        self.frame += frames
+
+        boxes = batch.boxes
+        codes = self._label_codes(batch)
+        track_ids = np.zeros(len(batch), dtype=np.int64)
+
+        if len(self.ids) and len(batch):
+            elapsed = (self.frame - self.last_frame)[:, None]
+            predicted = self.boxes + self.velocities * elapsed
+
+            iou = iou_matrix(boxes, predicted)
+            iou[codes[:, None] != self.codes[None, :]] = 0.0
+            det_idx, trk_idx = self._assign(iou)
+        else:
+            det_idx = trk_idx = np.empty(0, dtype=np.intp)
+
+        # ---------- Matched tracks ----------
+        if len(det_idx):
+            gap = np.maximum(self.frame - self.last_frame[trk_idx], 1)[:, None]
+            sample = (boxes[det_idx] - self.boxes[trk_idx]) / gap
+
+            alpha = self.velocity_smoothing
+            first = (self.hits[trk_idx] == 1)[:, None]
+            self.velocities[trk_idx] = np.where(
+                first, sample, alpha * sample + (1 - alpha) * self.velocities[trk_idx]
+            )
+            self.previous_boxes[trk_idx] = self.boxes[trk_idx]
+            self.boxes[trk_idx] = boxes[det_idx]
+            self.last_frame[trk_idx] = self.frame
+            self.hits[trk_idx] += 1
+
+            track_ids[det_idx] = self.ids[trk_idx]
+
+            box_list = boxes.tolist()
+            tracks = self.tracks
+            for d, track_id in zip(det_idx.tolist(), self.ids[trk_idx].tolist()):
+                tracks[track_id].history.append(tuple(box_list[d]))
+
+        # ---------- Aging and death ----------
+        matched = np.zeros(len(self.ids), dtype=bool)
+        matched[trk_idx] = True
+        self.misses = np.where(matched, 0, self.misses + 1).astype(np.int32)
+        self.ages += 1
+
+        alive = self.misses <= self.max_misses
+        self.removed = self.ids[~alive].tolist()
+        if self.removed:
+            for track_id in self.removed:
+                del self.tracks[track_id]
+            self._keep(alive)
+
+        # ---------- Birth ----------
+        unmatched = np.ones(len(batch), dtype=bool)
+        unmatched[det_idx] = False
+        new_idx = np.nonzero(unmatched)[0]
+
+        if len(new_idx):
+            new_ids = np.arange(self.next_id, self.next_id + len(new_idx), dtype=np.int64)
+            self.next_id += len(new_idx)
+            track_ids[new_idx] = new_ids
+
+            labels = batch.labels
+            box_list = boxes.tolist()
+            for d, track_id in zip(new_idx.tolist(), new_ids.tolist()):
+                self.tracks[track_id] = Track(
+                    track_id, labels[d], tuple(box_list[d]), self.history_size
+                )
+
+            count = len(new_idx)
+            self.ids = np.concatenate([self.ids, new_ids])
+            self.codes = np.concatenate([self.codes, codes[new_idx]])
+            self.boxes = np.concatenate([self.boxes, boxes[new_idx]])
+            self.previous_boxes = np.concatenate([self.previous_boxes, boxes[new_idx]])
+            self.velocities = np.concatenate(
+                [self.velocities, np.zeros((count, 4), dtype=np.float64)]
+            )
+            self.last_frame = np.concatenate(
+                [self.last_frame, np.full(count, self.frame, dtype=np.int64)]
+            )
+            self.hits = np.concatenate([self.hits, np.ones(count, dtype=np.int32)])
+            self.misses = np.concatenate([self.misses, np.zeros(count, dtype=np.int32)])
+            self.ages = np.concatenate([self.ages, np.zeros(count, dtype=np.int32)])
+
+        return track_ids
+
+    def _keep(self, mask):
+        self.ids = self.ids[mask]
+        self.codes = self.codes[mask]
+        self.boxes = self.boxes[mask]
+        self.previous_boxes = self.previous_boxes[mask]
+        self.velocities = self.velocities[mask]
+        self.last_frame = self.last_frame[mask]
+        self.hits = self.hits[mask]
+        self.misses = self.misses[mask]
+        self.ages = self.ages[mask]
+
+    # --------------------------------------------------
+
+    def velocity(self, track_ids):
+        """
+        Velocities (pixels/frame) for the given track IDs.
+
+        :param track_ids: Array of live track IDs
+        :return: (N, 4) float64 array
+        """
+        rows = np.searchsorted(self.ids, track_ids)
+        return self.velocities[rows]
+
+    def get(self, track_id):
+        return self.tracks.get(track_id)
+
+    def reset(self):
+        self.removed = list(self.tracks)
+        self.tracks = {}
+        self._keep(np.zeros(len(self.ids), dtype=bool))
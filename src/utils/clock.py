@@ -0,0 +1,38 @@
+"""
+Clock sources for Vision I.
+
+Components that reason about elapsed time (cooldowns, memory
+expiry, alert rates) take a clock callable instead of calling
+time.time() directly. Live runs use the wall clock; offline
+replay drives a ManualClock from recorded timestamps, so a
+session can run faster than real time and give the same result
+every time.
+"""
+
+import time
+
+
+def wall_clock():
+    """
+    Current wall-clock time in seconds.
+    """
+    return time.time()
+
+
+class ManualClock:
+    def __init__(self, start: float = 0.0):
+        """
+        Clock that only moves when told to.
+
+        :param start: Initial time in seconds
+        """
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def set(self, timestamp: float):
+        self.now = timestamp
+
+    def advance(self, seconds: float):
+        self.now += seconds
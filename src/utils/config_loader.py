@@ -1,10 +1,44 @@
 """
 Configuration loader for Vision I.
+
+YAML files are parsed with the libyaml C loader when it is
+available and cached per file, so components that share a file
+(e.g. one DecisionEngine per stream) parse it only once.
 """
 
 import yaml
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+_yaml_cache = {}
+
+
+def load_yaml(path):
+    """
+    Parse a YAML file, reusing the result until the file changes.
+
+    The returned data is shared between callers and must not be modified.
+
+    :param path: YAML file path
+    :return: Parsed data (empty dict for an empty file)
+    """
+    path = Path(path)
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    data = _yaml_cache.get(key)
+    if data is None:
+        with open(path, "r") as f:
+            data = yaml.load(f, Loader=SafeLoader) or {}
+        _yaml_cache[key] = data
+
+    return data
+
 
 class Config:
     def __init__(self, path="config/config.yaml"):
@@ -13,8 +47,7 @@ class Config:
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
-        with open(config_path, "r") as f:
-            self.data = yaml.safe_load(f)
+        self.data = load_yaml(config_path)
 
     def get(self, *keys, default=None):
         value = self.data
@@ -0,0 +1,84 @@
+"""
+Streaming latency histogram for Vision I.
+
+HDR-style log-linear buckets over integer microseconds:
+exact below 32 us, then 16 sub-buckets per power of two
+(about 6% relative precision). Memory is constant no matter
+how many samples are recorded.
+"""
+
+SUB_BITS = 5
+LINEAR_LIMIT = 1 << SUB_BITS            # values below this are exact
+HALF = LINEAR_LIMIT >> 1                # sub-buckets per power of two
+MAX_SHIFT = 40                          # ~12 days in microseconds
+
+
+class LatencyHistogram:
+    __slots__ = ("counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self):
+        self.counts = [0] * (LINEAR_LIMIT + MAX_SHIFT * HALF)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    @staticmethod
+    def _index(micros):
+        if micros < LINEAR_LIMIT:
+            return micros
+        shift = micros.bit_length() - SUB_BITS
+        if shift > MAX_SHIFT:
+            return LINEAR_LIMIT + MAX_SHIFT * HALF - 1
+        return LINEAR_LIMIT + (shift - 1) * HALF + ((micros >> shift) - HALF)
+
+    @staticmethod
+    def _value(index):
+        """
+        Representative value (bucket midpoint) in microseconds.
+        """
+        if index < LINEAR_LIMIT:
+            return float(index)
+        shift = (index - LINEAR_LIMIT) // HALF + 1
+        mantissa = (index - LINEAR_LIMIT) % HALF + HALF
+        return ((mantissa << shift) + ((mantissa + 1) << shift)) / 2.0
+
+    def record(self, seconds):
+        """
+        Record one latency sample.
+
+        :param seconds: Latency in seconds
+        """
+        if seconds < 0:
+            seconds = 0.0
+
+        self.counts[self._index(int(seconds * 1e6))] += 1
+        self.count += 1
+        self.total += seconds
+
+        if self.minimum is None or seconds < self.minimum:
+            self.minimum = seconds
+        if self.maximum is None or seconds > self.maximum:
+            self.maximum = seconds
+
+    def percentile(self, p):
+        """
+        Approximate p-th percentile (0-100) in seconds.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = max(1, int(round(p / 100.0 * self.count)))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            if not bucket:
+                continue
+            seen += bucket
+            if seen >= rank:
+                value = self._value(index) / 1e6
+                return min(max(value, self.minimum), self.maximum)
+
+        return self.maximum
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
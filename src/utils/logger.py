@@ -2,21 +2,159 @@
 Logging utility for Vision I.
 
 Stores decision events for adaptive learning and evaluation.
+
+Events are queued in memory and written by a background
+thread in batches, so logging never blocks the decision path.
+Logs rotate by size or day (optionally gzip-compressed) and
+can be written as JSONL or as a compact binary record format.
 """
 
-import time
+import gzip
 import json
+import shutil
+import struct
+import threading
+import time
+from collections import deque
 from pathlib import Path
 
 
+BINARY_MAGIC = b"VIDL\x01"
+
+# timestamp, distance (NaN if unknown), direction code, motion code,
+# label length, decision length
+BINARY_HEADER = struct.Struct("<dfBBBH")
+
+DIRECTION_CODES = {None: 0, "LEFT": 1, "CENTER": 2, "RIGHT": 3}
+MOTION_CODES = {None: 0, "STATIONARY": 1, "APPROACHING": 2, "MOVING_AWAY": 3}
+DIRECTION_NAMES = {code: name for name, code in DIRECTION_CODES.items()}
+MOTION_NAMES = {code: name for name, code in MOTION_CODES.items()}
+
+
+def encode_binary(event):
+    """
+    Encode one decision event as a binary record.
+    """
+    label = (event["label"] or "").encode("utf-8")[:255]
+    decision = (event["decision"] or "").encode("utf-8")[:65535]
+    distance = event["distance"]
+
+    return BINARY_HEADER.pack(
+        event["timestamp"],
+        float("nan") if distance is None else distance,
+        DIRECTION_CODES.get(event["direction"], 0),
+        MOTION_CODES.get(event["motion"], 0),
+        len(label),
+        len(decision),
+    ) + label + decision
+
+
+def read_binary_log(path):
+    """
+    Decode a binary decision log (plain or gzip-compressed).
+
+    :param path: Path to a .bin or .bin.gz log
+    :return: Generator of event dicts
+    """
+    path = Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+
+    with opener(path, "rb") as f:
+        data = f.read()
+
+    if not data.startswith(BINARY_MAGIC):
+        raise ValueError(f"Not a Vision I binary log: {path}")
+
+    offset = len(BINARY_MAGIC)
+    while offset < len(data):
+        timestamp, distance, direction, motion, label_len, decision_len = \
+            BINARY_HEADER.unpack_from(data, offset)
+        offset += BINARY_HEADER.size
+
+        label = data[offset:offset + label_len].decode("utf-8")
+        offset += label_len
+        decision = data[offset:offset + decision_len].decode("utf-8")
+        offset += decision_len
+
+        yield {
+            "timestamp": timestamp,
+            "label": label or None,
+            "distance": None if distance != distance else distance,
+            "direction": DIRECTION_NAMES.get(direction),
+            "motion": MOTION_NAMES.get(motion),
+            "decision": decision,
+        }
+
+
 class DecisionLogger:
-    def __init__(self, log_file="logs/decisions.jsonl"):
+    def __init__(
+        self,
+        log_file="logs/decisions.jsonl",
+        binary: bool = False,
+        batch_size: int = 64,
+        flush_interval: float = 1.0,
+        max_queue: int = 4096,
+        overflow: str = "drop_oldest",
+        rotate_bytes: int = 10 * 1024 * 1024,
+        rotate_daily: bool = True,
+        compress: bool = True,
+    ):
+        """
+        :param log_file: Log path (binary logs use the .bin suffix)
+        :param binary: Write compact binary records instead of JSONL
+        :param batch_size: Queued events that trigger a write
+        :param flush_interval: Maximum seconds between writes
+        :param max_queue: Maximum queued events before overflow
+        :param overflow: 'drop_oldest' or 'drop_newest' when the queue is full
+        :param rotate_bytes: Rotate once the log reaches this size (0 = never)
+        :param rotate_daily: Rotate when the day changes
+        :param compress: Gzip rotated logs
+        """
         self.log_path = Path(log_file)
-        self.log_path.parent.mkdir(exist_ok=True)
+        if binary:
+            self.log_path = self.log_path.with_suffix(".bin")
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.binary = binary
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.rotate_bytes = rotate_bytes
+        self.rotate_daily = rotate_daily
+        self.compress = compress
 
-    def log(self, label, distance, direction, motion, decision):
+        # deque append/popleft are atomic, so producers never take a lock
+        self.queue = deque()
+        self.dropped = 0
+        self.written = 0
+
+        self.file = None
+        self.file_size = 0
+        self.file_day = None
+
+        # flush() waits for a write pass that started after its request
+        self.wakeup = threading.Event()
+        self.flush_condition = threading.Condition()
+        self.flush_requests = 0
+        self.flushed_requests = 0
+        self.stopping = False
+        self.writer = threading.Thread(
+            target=self._run, name="vision-logger", daemon=True
+        )
+        self.writer.start()
+
+    # --------------------------------------------------
+
+    def log(self, label, distance, direction, motion, decision, timestamp=None):
+        """
+        Queue a decision event. Never blocks.
+
+        :param timestamp: Event time from the caller's clock
+                          (default: wall clock)
+        """
         event = {
-            "timestamp": time.time(),
+            "timestamp": time.time() if timestamp is None else timestamp,
             "label": label,
             "distance": distance,
             "direction": direction,
@@ -24,5 +162,156 @@ class DecisionLogger:
             "decision": decision
         }
 
-        with open(self.log_path, "a") as f:
-            f.write(json.dumps(event) + "\n")
+        if len(self.queue) >= self.max_queue:
+            self.dropped += 1
+            if self.overflow != "drop_oldest":
+                return
+            try:
+                self.queue.popleft()
+            except IndexError:
+                pass
+
+        self.queue.append(event)
+
+        if len(self.queue) >= self.batch_size:
+            self.wakeup.set()
+
+    def flush(self, timeout: float = 2.0):
+        """
+        Ask the writer to write everything queued and wait for it.
+
+        :return: True if everything queued before the call was written
+        """
+        with self.flush_condition:
+            self.flush_requests += 1
+            request = self.flush_requests
+            self.wakeup.set()
+            return self.flush_condition.wait_for(
+                lambda: self.flushed_requests >= request, timeout
+            )
+
+    def close(self):
+        """
+        Flush remaining events and stop the writer thread.
+        """
+        if self.stopping:
+            return
+        self.stopping = True
+        self.wakeup.set()
+        self.writer.join(timeout=5.0)
+
+    # --------------------------------------------------
+
+    def _run(self):
+        while True:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+
+            # Requests made before this pass starts are covered by it
+            with self.flush_condition:
+                requests = self.flush_requests
+
+            try:
+                self._write_pending()
+            except Exception as e:
+                print(f"[LOGGER ERROR] {e}")
+
+            with self.flush_condition:
+                self.flushed_requests = requests
+                self.flush_condition.notify_all()
+
+            if self.stopping and not self.queue:
+                break
+
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def _write_pending(self):
+        events = []
+        while True:
+            try:
+                events.append(self.queue.popleft())
+            except IndexError:
+                break
+
+        if not events:
+            return
+
+        # Decisions are rendered here, off the decision path, at full verbosity
+        for event in events:
+            decision = event["decision"]
+            if decision is not None and not isinstance(decision, str):
+                event["decision"] = decision.render(brief=False)
+
+        if self.binary:
+            payload = b"".join(encode_binary(event) for event in events)
+        else:
+            payload = "".join(json.dumps(event) + "\n" for event in events).encode("utf-8")
+
+        self._open_for_write()
+        self.file.write(payload)
+        self.file.flush()
+        self.file_size += len(payload)
+        self.written += len(events)
+
+    def _open_for_write(self):
+        today = time.strftime("%Y%m%d")
+
+        if self.file is not None:
+            too_big = self.rotate_bytes and self.file_size >= self.rotate_bytes
+            new_day = self.rotate_daily and today != self.file_day
+            if not (too_big or new_day):
+                return
+            self._rotate()
+        elif self.rotate_daily:
+            # A log left over from a run on an earlier day is rotated
+            # under that day's stamp before anything is appended
+            modified = self._modified()
+            if modified is not None and time.strftime("%Y%m%d", modified) < today:
+                self._rotate(time.strftime("%Y%m%d-%H%M%S", modified))
+
+        self.file = open(self.log_path, "ab")
+        self.file_size = self.file.tell()
+        self.file_day = today
+
+        if self.binary and self.file_size == 0:
+            self.file.write(BINARY_MAGIC)
+            self.file_size = len(BINARY_MAGIC)
+
+    def _modified(self):
+        """
+        Local modification time of an existing, non-empty log, or None.
+        """
+        try:
+            stat = self.log_path.stat()
+        except FileNotFoundError:
+            return None
+        return time.localtime(stat.st_mtime) if stat.st_size else None
+
+    def _rotate(self, stamp=None):
+        """
+        Move the current log aside (compressed) and start a new one.
+
+        :param stamp: Suffix for the rotated file (default: now)
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+        stamp = stamp or time.strftime("%Y%m%d-%H%M%S")
+        rotated = self.log_path.with_name(
+            f"{self.log_path.stem}-{stamp}{self.log_path.suffix}"
+        )
+        index = 1
+        while rotated.exists() or Path(f"{rotated}.gz").exists():
+            rotated = self.log_path.with_name(
+                f"{self.log_path.stem}-{stamp}-{index}{self.log_path.suffix}"
+            )
+            index += 1
+        self.log_path.rename(rotated)
+
+        if self.compress:
+            with open(rotated, "rb") as src, gzip.open(f"{rotated}.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            rotated.unlink()
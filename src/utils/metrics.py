@@ -1,25 +1,56 @@
 """
 Runtime metrics collection for Vision I (polished).
+
+Tracks alert events, per-stage latency histograms, frame
+counters and gauges, and renders them in Prometheus text format.
 """
 
-import time
+import threading
 from collections import Counter, deque
 
+from src.utils.clock import wall_clock
+from src.utils.histogram import LatencyHistogram
+
+
+# Pipeline stages with latency histograms, in report order
+STAGES = (
+    "capture",
+    "preprocess",
+    "inference",
+    "postprocess",
+    "evaluate",
+    "tts_queue",
+    "end_to_end",
+)
+
+QUANTILES = (50, 95, 99)
+
 
 class MetricsCollector:
-    def __init__(self, window_seconds=60):
-        self.start_time = time.time()
+    def __init__(self, window_seconds=60, clock=None):
+        """
+        :param window_seconds: Rolling window for alert rates
+        :param clock: Callable returning the current time (default: wall clock)
+        """
+        self.clock = clock or wall_clock
+        self.start_time = self.clock()
         self.window_seconds = window_seconds
 
         self.alert_times = deque()
         self.object_counter = Counter()
 
+        self.latency = {stage: LatencyHistogram() for stage in STAGES}
+        self.counters = Counter()
+        self.gauges = {}
+        self.lock = threading.Lock()
+
     def record(self, label):
         """
         Record a new alert event.
         """
-        now = time.time()
+        now = self.clock()
         self.alert_times.append(now)
+        self.counters["alerts"] += 1
 
         if label:
             self.object_counter[label] += 1
@@ -30,7 +61,7 @@ class MetricsCollector:
         """
         Remove events outside the rolling window.
         """
-        cutoff = time.time() - self.window_seconds
+        cutoff = self.clock() - self.window_seconds
         while self.alert_times and self.alert_times[0] < cutoff:
             self.alert_times.popleft()
 
@@ -43,13 +74,108 @@ class MetricsCollector:
         if len(self.alert_times) < 2:
             return 0.0
 
-        intervals = [
-            self.alert_times[i] - self.alert_times[i - 1]
-            for i in range(1, len(self.alert_times))
-        ]
-        return sum(intervals) / len(intervals)
+        # Mean of consecutive intervals telescopes to (last - first) / (n - 1)
+        return (self.alert_times[-1] - self.alert_times[0]) / (len(self.alert_times) - 1)
 
     def most_common_object(self):
         if not self.object_counter:
             return None
         return self.object_counter.most_common(1)[0]
+
+    # --------------------------------------------------
+
+    def observe(self, stage, seconds):
+        """
+        Record a latency sample for a pipeline stage.
+        """
+        with self.lock:
+            histogram = self.latency.get(stage)
+            if histogram is None:
+                histogram = self.latency[stage] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def increment(self, name, amount=1):
+        """
+        Increase a named counter.
+        """
+        with self.lock:
+            self.counters[name] += amount
+
+    def set_counter(self, name, value):
+        """
+        Set a counter maintained elsewhere (e.g. camera drops).
+        """
+        self.counters[name] = value
+
+    def set_gauge(self, name, value):
+        """
+        Set a value that can go up and down (e.g. governor level).
+        """
+        with self.lock:
+            self.gauges[name] = value
+
+    def fps(self):
+        """
+        Average processed frames per second since start.
+        """
+        elapsed = self.clock() - self.start_time
+        return self.counters["frames"] / elapsed if elapsed > 0 else 0.0
+
+    def latency_summary(self):
+        """
+        Percentiles per stage in milliseconds.
+
+        :return: Dict stage -> {'count', 'p50', 'p95', 'p99'}
+        """
+        with self.lock:
+            return {
+                stage: {
+                    "count": histogram.count,
+                    **{f"p{q}": histogram.percentile(q) * 1000 for q in QUANTILES},
+                }
+                for stage, histogram in self.latency.items()
+                if histogram.count
+            }
+
+    def render_prometheus(self):
+        """
+        Render all metrics in Prometheus text exposition format.
+        """
+        lines = [
+            "# HELP vision_stage_latency_seconds Per-stage latency.",
+            "# TYPE vision_stage_latency_seconds summary",
+        ]
+
+        with self.lock:
+            for stage, histogram in self.latency.items():
+                for q in QUANTILES:
+                    lines.append(
+                        f'vision_stage_latency_seconds{{stage="{stage}",quantile="{q / 100}"}} '
+                        f"{histogram.percentile(q):.6f}"
+                    )
+                lines.append(
+                    f'vision_stage_latency_seconds_sum{{stage="{stage}"}} {histogram.total:.6f}'
+                )
+                lines.append(
+                    f'vision_stage_latency_seconds_count{{stage="{stage}"}} {histogram.count}'
+                )
+
+            counters = dict(self.counters)
+            gauges = dict(self.gauges)
+
+        for name, value in sorted(counters.items()):
+            lines.append(f"# TYPE vision_{name}_total counter")
+            lines.append(f"vision_{name}_total {value}")
+
+        for name, value in sorted(gauges.items()):
+            lines.append(f"# TYPE vision_{name} gauge")
+            lines.append(f"vision_{name} {value}")
+
+        lines.append("# TYPE vision_fps gauge")
+        lines.append(f"vision_fps {self.fps():.3f}")
+        lines.append("# TYPE vision_alerts_per_minute gauge")
+        lines.append(f"vision_alerts_per_minute {self.alerts_per_minute():.3f}")
+        lines.append("# TYPE vision_uptime_seconds gauge")
+        lines.append(f"vision_uptime_seconds {self.clock() - self.start_time:.1f}")
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,95 @@
+"""
+Metrics exposition for Vision I.
+
+Publishes MetricsCollector output in Prometheus text format,
+either on a local HTTP endpoint (pull) or by periodically
+rewriting a file (node-exporter textfile style).
+"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+class MetricsExporter:
+    def __init__(self, metrics, port: int = None, path: str = None,
+                 host: str = "127.0.0.1", interval: float = 5.0):
+        """
+        :param metrics: MetricsCollector to expose
+        :param port: Serve GET /metrics on this port (None to disable)
+        :param path: Periodically write metrics to this file (None to disable)
+        :param host: Interface for the HTTP endpoint
+        :param interval: Seconds between file writes
+        """
+        self.metrics = metrics
+        self.port = port
+        self.path = Path(path) if path else None
+        self.host = host
+        self.interval = interval
+
+        self.server = None
+        self.stop_event = threading.Event()
+        self.threads = []
+
+    def start(self):
+        if self.port:
+            self.server = ThreadingHTTPServer((self.host, self.port), self._handler())
+            self.server.daemon_threads = True
+            self._spawn(self.server.serve_forever, "vision-metrics-http")
+            print(f"[INFO] Metrics at http://{self.host}:{self.port}/metrics")
+
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._spawn(self._write_loop, "vision-metrics-file")
+
+        return self
+
+    def _spawn(self, target, name):
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self.threads.append(thread)
+
+    def _handler(self):
+        metrics = self.metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") != "/metrics":
+                    self.send_error(404)
+                    return
+
+                body = metrics.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def write(self):
+        """
+        Atomically rewrite the metrics file.
+        """
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(self.metrics.render_prometheus())
+        os.replace(tmp, self.path)
+
+    def _write_loop(self):
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.write()
+            except OSError as e:
+                print(f"[METRICS ERROR] {e}")
+
+    def stop(self):
+        self.stop_event.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        if self.path:
+            self.write()
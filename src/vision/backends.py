@@ -0,0 +1,116 @@
+"""
+Inference backends for Vision I.
+
+Every backend runs through the same ultralytics predictor, so
+preprocessing (letterbox), NMS and postprocessing are shared and
+all backends produce the same DetectionBatch output. Only the
+model runtime differs, which makes backends directly comparable
+in benchmarks.
+"""
+
+import time
+
+import numpy as np
+
+from src.vision.export import export_model
+
+
+class DetectorBackend:
+    name = "base"
+    dynamic_imgsz = False   # accepts a different input size per call
+
+    def __init__(self, model_path: str = "yolov8n.pt", imgsz: int = 640, int8: bool = False):
+        """
+        :param model_path: Source PyTorch weights
+        :param imgsz: Inference resolution
+        :param int8: Use an int8-quantized model where supported
+        """
+        self.model_path = model_path
+        self.imgsz = imgsz
+        self.int8 = int8
+        self.model = None
+
+    def resolve_weights(self):
+        """
+        Path of the model file this backend loads.
+        """
+        return self.model_path
+
+    def load(self):
+        # Deferred: importing ultralytics/torch dominates start-up time
+        from ultralytics import YOLO
+
+        self.model = YOLO(str(self.resolve_weights()), task="detect")
+        return self
+
+    @property
+    def names(self):
+        return self.model.names
+
+    def predict(self, frame, imgsz: int = None):
+        """
+        Run inference on a frame or a list of frames.
+
+        :param imgsz: Input size for this call (dynamic backends only)
+        :return: List of ultralytics Results
+        """
+        if imgsz is None or not self.dynamic_imgsz:
+            imgsz = self.imgsz
+        return self.model(frame, imgsz=imgsz, verbose=False)
+
+    def warmup(self, runs: int = 2):
+        """
+        Run dummy inferences so first-frame latency is paid at startup.
+
+        :return: Seconds spent warming up
+        """
+        start = time.perf_counter()
+        dummy = np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8)
+        for _ in range(runs):
+            self.predict(dummy)
+        return time.perf_counter() - start
+
+
+class TorchBackend(DetectorBackend):
+    name = "torch"
+    dynamic_imgsz = True
+
+
+class OnnxBackend(DetectorBackend):
+    name = "onnx"
+
+    def resolve_weights(self):
+        return export_model(self.model_path, "onnx", self.imgsz, self.int8)
+
+
+class OpenVinoBackend(DetectorBackend):
+    name = "openvino"
+
+    def resolve_weights(self):
+        return export_model(self.model_path, "openvino", self.imgsz, self.int8)
+
+
+BACKENDS = {
+    TorchBackend.name: TorchBackend,
+    OnnxBackend.name: OnnxBackend,
+    OpenVinoBackend.name: OpenVinoBackend,
+}
+
+
+def create_backend(name: str = "torch", model_path: str = "yolov8n.pt",
+                   imgsz: int = 640, int8: bool = False):
+    """
+    Create and load an inference backend by name.
+
+    :param name: 'torch', 'onnx' or 'openvino'
+    """
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown detection backend '{name}'. Choose from: {', '.join(BACKENDS)}"
+        )
+
+    if name == "torch" and int8:
+        print("[WARN] int8 is not supported by the torch backend; using fp32")
+        int8 = False
+
+    return BACKENDS[name](model_path, imgsz, int8).load()
@@ -1,24 +1,167 @@
 """
 Camera module for Vision I.
 
-Handles video capture and frame retrieval.
+Handles video capture and frame retrieval. Live sources are
+read continuously by a background grabber thread into a ring
+of preallocated frame buffers, so callers always get the
+freshest frame without paying decode latency.
 """
 
-import cv2
+import threading
+import time
+
+import numpy as np
+
+from src.vision.sources import open_source
+
+
+class Frame:
+    __slots__ = ("image", "timestamp", "seq")
+
+    def __init__(self, image, timestamp, seq):
+        """
+        A captured frame.
+
+        :param image: Frame array
+        :param timestamp: Capture time (time.time())
+        :param seq: Monotonic sequence number, starting at 0
+        """
+        self.image = image
+        self.timestamp = timestamp
+        self.seq = seq
 
 
 class Camera:
-    def __init__(self, source: int = 0):
+    def __init__(
+        self,
+        source=0,
+        buffer_size: int = 4,
+        threaded=None,
+        loop: bool = False,
+        width: int = None,
+        height: int = None,
+    ):
         """
         Initialize the camera.
 
-        :param source: Camera source index (default is 0)
+        :param source: Camera index (default 0), video file,
+                       image directory or raw frame dump
+        :param buffer_size: Number of preallocated ring buffer slots
+        :param threaded: Grab frames on a background thread
+                         (default: only for live cameras)
+        :param loop: Loop recorded sources
+        :param width: Frame width (raw dumps only)
+        :param height: Frame height (raw dumps only)
         """
         self.source = source
-        self.cap = cv2.VideoCapture(self.source)
+        self.reader = open_source(source, loop=loop, width=width, height=height)
+
+        self.buffer_size = max(2, int(buffer_size))
+        self.threaded = self.reader.live if threaded is None else bool(threaded)
+
+        self.ring = None
+        self.next_seq = 0
+        self.latest = None
+        self.last_returned = -1
+        self.returned = 0
+        self.finished = False
+
+        self.condition = threading.Condition()
+        self.stop_event = threading.Event()
+        self.grabber = None
+
+        if self.threaded:
+            self.grabber = threading.Thread(
+                target=self._grab_loop, name="vision-grabber", daemon=True
+            )
+            self.grabber.start()
+
+    # --------------------------------------------------
+
+    def _grab(self):
+        """
+        Read one frame from the source into the next ring slot.
+
+        :return: Frame, or None if the source is exhausted
+        """
+        if self.ring is None:
+            first = self.reader.read()
+            if first is None:
+                return None
+            self.ring = np.empty((self.buffer_size,) + first.shape, dtype=first.dtype)
+            slot = self.ring[0]
+            np.copyto(slot, first)
+        else:
+            slot = self.ring[self.next_seq % self.buffer_size]
+            image = self.reader.read(slot)
+            if image is None:
+                return None
+            if image is not slot:
+                if image.shape != slot.shape:
+                    raise RuntimeError("Frame size changed during capture")
+                np.copyto(slot, image)
+
+        frame = Frame(slot, time.time(), self.next_seq)
+        self.next_seq += 1
+        return frame
+
+    def _grab_loop(self):
+        while not self.stop_event.is_set():
+            try:
+                frame = self._grab()
+            except Exception as e:
+                print(f"[CAMERA ERROR] {e}")
+                frame = None
+
+            with self.condition:
+                if frame is None:
+                    self.finished = True
+                else:
+                    self.latest = frame
+                self.condition.notify_all()
+
+            if frame is None:
+                break
+
+    # --------------------------------------------------
+
+    def read(self, timeout: float = None):
+        """
+        Return the newest frame not yet returned.
+
+        The image is copied out of the ring buffer, so callers may
+        keep it (detection queues, display) while the grabber reuses
+        the slot.
+
+        :param timeout: Seconds to wait for a new frame in threaded
+                        mode (default: wait until one arrives)
+        :return: Frame, or None if no frame is available
+        """
+        if not self.threaded:
+            return self._detach(self._grab())
+
+        deadline = None if timeout is None else time.time() + timeout
+        with self.condition:
+            while self.latest is None or self.latest.seq <= self.last_returned:
+                if self.finished:
+                    return None
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self.condition.wait(remaining)
+
+            frame = self.latest
+            self.last_returned = frame.seq
+            self.returned += 1
 
-        if not self.cap.isOpened():
-            raise RuntimeError("Unable to access the camera")
+        # The slot is only rewritten buffer_size - 1 grabs from now
+        return self._detach(frame)
+
+    @staticmethod
+    def _detach(frame):
+        if frame is None:
+            return None
+        return Frame(frame.image.copy(), frame.timestamp, frame.seq)
 
     def get_frame(self):
         """
@@ -26,13 +169,24 @@ class Camera:
 
         :return: Frame if successful, else None
         """
-        ret, frame = self.cap.read()
-        if not ret:
+        frame = self.read()
+        if frame is None:
             return None
-        return frame
+        return frame.image
+
+    def dropped_frames(self):
+        """
+        Number of grabbed frames that were never returned to a caller.
+        """
+        if not self.threaded:
+            return 0
+        return max(self.last_returned + 1 - self.returned, 0)
 
     def release(self):
         """
         Release the camera resource.
         """
-        self.cap.release()
+        self.stop_event.set()
+        if self.grabber is not None:
+            self.grabber.join(timeout=1.0)
+        self.reader.release()
@@ -0,0 +1,263 @@
+"""
+Persistent detection cache for Vision I.
+
+Recorded walking routes are replayed many times while tuning
+rules and profiles, and every run used to repeat identical
+inference on every frame. The cache wraps ObjectDetector and
+stores each frame's detections on disk, keyed by a fast frame
+hash; a hit skips inference entirely.
+
+Storage is columnar and memory-mapped: one file per column
+(boxes, confidences, class ids) with a fixed number of detection
+slots per entry, plus key / count / last-used index columns.
+The number of entries is bounded by a size budget and the least
+recently used entry is evicted when the cache is full; recency
+is kept in an ordered index, so eviction is O(1).
+
+The cache directory carries a fingerprint of the weights the
+backend actually loads (the exported ONNX / OpenVINO / int8 model,
+not just the source .pt), backend, precision, input size and
+confidence threshold. Opening it with a different fingerprint
+clears it.
+"""
+
+import hashlib
+import json
+import shutil
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from src.vision.detections import DetectionBatch
+
+
+# Format version, part of the fingerprint
+LAYOUT = 1
+
+
+class DetectionCache:
+    def __init__(
+        self,
+        detector,
+        cache_dir: str = "cache/detections",
+        max_mb: float = 256,
+        max_detections: int = 64,
+        hash_stride: int = 2,
+        metrics=None,
+    ):
+        """
+        :param detector: ObjectDetector to cache
+        :param cache_dir: Directory holding the cache files
+        :param max_mb: Size budget of the cache files
+        :param max_detections: Detections stored per frame (frames with
+                               more are not cached)
+        :param hash_stride: Pixel stride sampled by the frame hash
+        :param metrics: Optional MetricsCollector for hit/miss counters
+        """
+        self.detector = detector
+        self.cache_dir = Path(cache_dir)
+        self.max_detections = max(1, int(max_detections))
+        self.hash_stride = max(1, int(hash_stride))
+        self.metrics = metrics
+
+        # Index (8 + 2 + 8 bytes) plus detection slots (16 + 4 + 2 bytes each)
+        entry_bytes = 18 + self.max_detections * 22
+        self.capacity = max(1, int(max_mb * 1024 * 1024 // entry_bytes))
+
+        # Settings the cached detections are valid for
+        self.cached_backend = detector.backend
+        self.confidence = detector.confidence_threshold
+        self.fingerprint = self._fingerprint()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = 0
+
+        self._open()
+
+    # --------------------------------------------------
+
+    @staticmethod
+    def _weights_stat(weights):
+        """
+        (size, mtime) of a weights file, or summed over a model
+        directory (OpenVINO exports), or None if it does not exist.
+        """
+        if weights.is_dir():
+            files = [f.stat() for f in weights.rglob("*") if f.is_file()]
+            if not files:
+                return None
+            return sum(f.st_size for f in files), max(f.st_mtime_ns for f in files)
+        if weights.exists():
+            stat = weights.stat()
+            return stat.st_size, stat.st_mtime_ns
+        return None
+
+    def _fingerprint(self):
+        backend = self.cached_backend
+        # The file the backend loads (export is cached, so this is cheap)
+        weights = Path(str(backend.resolve_weights()))
+        stat = self._weights_stat(weights)
+
+        spec = {
+            "layout": LAYOUT,
+            "model": str(weights.resolve()) if stat else str(weights),
+            "model_size": stat[0] if stat else None,
+            "model_mtime": stat[1] if stat else None,
+            "backend": backend.name,
+            "precision": "int8" if backend.int8 else "fp32",
+            "imgsz": backend.imgsz,
+            "confidence": self.confidence,
+            "max_detections": self.max_detections,
+            "capacity": self.capacity,
+        }
+        digest = hashlib.sha1(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()
+        return digest, spec
+
+    def _open(self):
+        meta_path = self.cache_dir / "meta.json"
+        digest, spec = self.fingerprint
+
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("fingerprint") != digest:
+                print("[DETECTION CACHE] Model or detection settings changed; clearing cache")
+                shutil.rmtree(self.cache_dir)
+
+        fresh = not meta_path.exists()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        mode = "w+" if fresh else "r+"
+
+        def column(name, dtype, *shape):
+            return np.memmap(
+                self.cache_dir / name, dtype=dtype, mode=mode, shape=(self.capacity, *shape)
+            )
+
+        self.keys = column("keys.u64", np.uint64)
+        self.counts = column("counts.i16", np.int16)
+        self.used = column("used.u64", np.uint64)
+        self.boxes = column("boxes.f32", np.float32, self.max_detections, 4)
+        self.confidences = column("confidences.f32", np.float32, self.max_detections)
+        self.class_ids = column("class_ids.i16", np.int16, self.max_detections)
+
+        if fresh:
+            self.counts[:] = -1
+            meta_path.write_text(
+                json.dumps({"fingerprint": digest, **spec}, indent=2), encoding="utf-8"
+            )
+
+        # Key -> slot, least recently used first
+        occupied = np.flatnonzero(self.counts >= 0)
+        occupied = occupied[np.argsort(self.used[occupied], kind="stable")]
+        self.slots = OrderedDict((int(self.keys[slot]), int(slot)) for slot in occupied)
+        self.free = np.flatnonzero(self.counts < 0)[::-1].tolist()
+        self.tick = int(self.used.max()) if len(occupied) else 0
+
+        print(f"[DETECTION CACHE] {len(self.slots)}/{self.capacity} entries in {self.cache_dir}")
+
+    # --------------------------------------------------
+
+    def key(self, frame, imgsz=None):
+        """
+        64-bit hash of a subsampled frame and the inference size.
+        """
+        sample = np.ascontiguousarray(frame[::self.hash_stride, ::self.hash_stride])
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(repr((frame.shape, imgsz, self.detector.max_imgsz)).encode("ascii"))
+        digest.update(sample.data)
+        return int.from_bytes(digest.digest(), "little")
+
+    def _count(self, name):
+        if self.metrics is not None:
+            self.metrics.increment(name)
+
+    def _load(self, key, slot):
+        count = int(self.counts[slot])
+        self.tick += 1
+        self.used[slot] = self.tick
+        self.slots.move_to_end(key)
+
+        return DetectionBatch(
+            np.array(self.boxes[slot, :count]),
+            np.array(self.confidences[slot, :count]),
+            np.array(self.class_ids[slot, :count]),
+            self.cached_backend.names,
+        )
+
+    def _store(self, key, batch):
+        if self.free:
+            slot = self.free.pop()
+        else:
+            # Least recently used entry
+            _, slot = self.slots.popitem(last=False)
+            self.evictions += 1
+            self._count("cache_evictions")
+
+        count = len(batch)
+        self.keys[slot] = key
+        self.counts[slot] = count
+        self.boxes[slot, :count] = batch.boxes
+        self.confidences[slot, :count] = batch.confidences
+        self.class_ids[slot, :count] = batch.class_ids
+
+        self.tick += 1
+        self.used[slot] = self.tick
+        self.slots[key] = slot
+
+    # --------------------------------------------------
+
+    @property
+    def backend(self):
+        return self.detector.backend
+
+    @property
+    def confidence_threshold(self):
+        return self.detector.confidence_threshold
+
+    def detect_batch(self, frame, imgsz: int = None):
+        """
+        Cached ObjectDetector.detect_batch().
+
+        :param frame: Input video frame
+        :param imgsz: Inference size for this frame (default: configured size)
+        :return: DetectionBatch
+        """
+        detector = self.detector
+
+        # Model or threshold changed at runtime (e.g. by the latency
+        # governor): cached entries do not apply
+        if (detector.backend is not self.cached_backend
+                or detector.confidence_threshold != self.confidence):
+            self.bypassed += 1
+            return detector.detect_batch(frame, imgsz)
+
+        key = self.key(frame, imgsz)
+        slot = self.slots.get(key)
+        if slot is not None:
+            self.hits += 1
+            self._count("cache_hits")
+            return self._load(key, slot)
+
+        self.misses += 1
+        self._count("cache_misses")
+        batch = detector.detect_batch(frame, imgsz)
+        if len(batch) <= self.max_detections:
+            self._store(key, batch)
+        return batch
+
+    def detect(self, frame):
+        return self.detect_batch(frame).to_dicts()
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def close(self):
+        """
+        Write cached entries back to disk.
+        """
+        for column in (self.keys, self.counts, self.used,
+                       self.boxes, self.confidences, self.class_ids):
+            column.flush()
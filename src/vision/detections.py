@@ -0,0 +1,179 @@
+"""
+Detection batch container for Vision I.
+
+Holds all detections of a frame as columnar NumPy arrays
+instead of one dict per box, so postprocessing cost stays
+flat as scenes get crowded.
+"""
+
+import numpy as np
+
+
+DETECTION_DTYPE = np.dtype([
+    ("x1", np.float32),
+    ("y1", np.float32),
+    ("x2", np.float32),
+    ("y2", np.float32),
+    ("confidence", np.float32),
+    ("class_id", np.int16),
+])
+
+
+class DetectionBatch:
+    __slots__ = ("boxes", "confidences", "class_ids", "names", "_labels")
+
+    def __init__(self, boxes, confidences, class_ids, names):
+        """
+        :param boxes: (N, 4) float array of x1, y1, x2, y2
+                      (float32 from the detector)
+        :param confidences: (N,) float32 array
+        :param class_ids: (N,) int array
+        :param names: Mapping of class id to label
+        """
+        self.boxes = boxes
+        self.confidences = confidences
+        self.class_ids = class_ids
+        self.names = names
+        self._labels = None
+
+    # --------------------------------------------------
+
+    @classmethod
+    def empty(cls, names=None):
+        return cls(
+            np.empty((0, 4), dtype=np.float32),
+            np.empty(0, dtype=np.float32),
+            np.empty(0, dtype=np.int16),
+            names or {},
+        )
+
+    @classmethod
+    def from_arrays(cls, data, names, confidence_threshold: float = 0.0):
+        """
+        Build a batch from an (N, 6) array of x1, y1, x2, y2, conf, cls.
+
+        :param data: Raw detector output rows
+        :param names: Mapping of class id to label
+        :param confidence_threshold: Minimum confidence to keep
+        """
+        data = np.asarray(data, dtype=np.float32).reshape(-1, 6)
+
+        # Compare in float64 to match per-box float() filtering exactly
+        mask = data[:, 4] >= np.float64(confidence_threshold)
+        if not mask.all():
+            data = data[mask]
+
+        return cls(
+            np.ascontiguousarray(data[:, :4]),
+            np.ascontiguousarray(data[:, 4]),
+            data[:, 5].astype(np.int16),
+            names,
+        )
+
+    @classmethod
+    def from_results(cls, results, names, confidence_threshold: float = 0.0):
+        """
+        Build a batch from ultralytics results with one bulk conversion.
+
+        :param results: Iterable of ultralytics Results
+        :param names: Mapping of class id to label
+        :param confidence_threshold: Minimum confidence to keep
+        """
+        chunks = [
+            result.boxes.data.cpu().numpy()
+            for result in results
+            if result.boxes is not None and len(result.boxes)
+        ]
+
+        if not chunks:
+            return cls.empty(names)
+
+        data = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+        return cls.from_arrays(data, names, confidence_threshold)
+
+    @classmethod
+    def from_dicts(cls, detections):
+        """
+        Build a batch from a list of detection dicts.
+
+        Boxes are kept in float64 so values round-trip exactly.
+        """
+        if isinstance(detections, cls):
+            return detections
+
+        if not detections:
+            return cls.empty()
+
+        ids = {}
+        class_ids = []
+        for obj in detections:
+            class_ids.append(ids.setdefault(obj.get("label"), len(ids)))
+
+        boxes = np.array([obj.get("bbox") for obj in detections], dtype=np.float64)
+        confidences = np.array(
+            [obj.get("confidence", 1.0) for obj in detections], dtype=np.float32
+        )
+
+        return cls(
+            boxes.reshape(-1, 4),
+            confidences,
+            np.array(class_ids, dtype=np.int16),
+            {idx: label for label, idx in ids.items()},
+        )
+
+    # --------------------------------------------------
+
+    def __len__(self):
+        return len(self.confidences)
+
+    @property
+    def labels(self):
+        """
+        Label of each detection, in order.
+        """
+        if self._labels is None:
+            names = self.names
+            self._labels = [names[c] for c in self.class_ids.tolist()]
+        return self._labels
+
+    def filter(self, mask):
+        """
+        Return a new batch containing only rows where mask is True.
+        """
+        return DetectionBatch(
+            self.boxes[mask],
+            self.confidences[mask],
+            self.class_ids[mask],
+            self.names,
+        )
+
+    def to_structured(self):
+        """
+        Return detections as a NumPy structured array (DETECTION_DTYPE).
+        """
+        out = np.empty(len(self), dtype=DETECTION_DTYPE)
+        out["x1"] = self.boxes[:, 0]
+        out["y1"] = self.boxes[:, 1]
+        out["x2"] = self.boxes[:, 2]
+        out["y2"] = self.boxes[:, 3]
+        out["confidence"] = self.confidences
+        out["class_id"] = self.class_ids
+        return out
+
+    def to_dicts(self):
+        """
+        Convert to the legacy list-of-dicts detection format.
+        """
+        return [
+            {
+                "label": label,
+                "confidence": confidence,
+                "bbox": tuple(box),
+            }
+            for label, confidence, box in zip(
+                self.labels, self.confidences.tolist(), self.boxes.tolist()
+            )
+        ]
+
+    def __repr__(self):
+        return f"DetectionBatch({len(self)} detections: {self.labels})"
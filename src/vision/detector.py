@@ -1,53 +1,114 @@
 """
 Object detection module for Vision I.
 
-Uses YOLOv8 for real-time object detection.
+Uses YOLOv8 for real-time object detection, running on a
+configurable CPU inference backend (PyTorch, ONNX Runtime
+or OpenVINO).
 """
 
-from ultralytics import YOLO
+import time
+
+from src.vision.backends import create_backend
+from src.vision.detections import DetectionBatch
 
 
 class ObjectDetector:
-    def __init__(self, model_path: str = "yolov8n.pt", confidence_threshold: float = 0.5):
+    def __init__(
+        self,
+        model_path: str = "yolov8n.pt",
+        confidence_threshold: float = 0.5,
+        backend="torch",
+        imgsz: int = 640,
+        int8: bool = False,
+        warmup: bool = True,
+        metrics=None,
+    ):
         """
         Initialize YOLO object detector.
 
         :param model_path: Path to YOLO model
         :param confidence_threshold: Minimum confidence threshold for detections
+        :param backend: Inference backend ('torch', 'onnx' or 'openvino'),
+                        or a ready DetectorBackend-like object (model_path,
+                        imgsz and int8 are then ignored)
+        :param imgsz: Inference input resolution
+        :param int8: Use an int8-quantized model (onnx/openvino)
+        :param warmup: Run a warm-up inference at startup
+        :param metrics: Optional MetricsCollector for stage latencies
         """
-        self.model = YOLO(model_path)
+        if isinstance(backend, str):
+            backend = create_backend(backend, model_path, imgsz, int8)
+        self.backend = backend
+        self.model = self.backend.model
         self.confidence_threshold = confidence_threshold
+        self.metrics = metrics
+        self.max_imgsz = None   # cap set by the latency governor
 
-    def detect(self, frame):
+        self.warmup_time = self.backend.warmup() if warmup else 0.0
+
+    def detect_batch(self, frame, imgsz: int = None):
         """
-        Perform object detection on a given frame.
+        Perform object detection and return columnar results.
 
         :param frame: Input video frame
-        :return: List of detected objects
+        :param imgsz: Inference size for this frame (default: configured size)
+        :return: DetectionBatch
         """
-        results = self.model(frame, verbose=False)
+        if self.max_imgsz:
+            imgsz = min(imgsz or self.backend.imgsz, self.max_imgsz)
+        results = self.backend.predict(frame, imgsz)
 
-        detections = []
+        start = time.perf_counter()
+        batch = DetectionBatch.from_results(
+            results, self.backend.names, self.confidence_threshold
+        )
 
-        for result in results:
-            boxes = result.boxes
-            if boxes is None:
-                continue
+        if self.metrics is not None and results:
+            # ultralytics reports its own stage timings in milliseconds
+            speed = results[0].speed
+            self.metrics.observe("preprocess", speed.get("preprocess", 0.0) / 1000)
+            self.metrics.observe("inference", speed.get("inference", 0.0) / 1000)
+            self.metrics.observe(
+                "postprocess",
+                speed.get("postprocess", 0.0) / 1000 + time.perf_counter() - start,
+            )
 
-            for box in boxes:
-                x1, y1, x2, y2 = box.xyxy[0].tolist()
-                
-                confidence = float(box.conf[0])
-                if confidence < self.confidence_threshold:
-                    continue
+        return batch
+
+    def detect_many(self, frames):
+        """
+        Detect objects on several frames in one inference batch.
+
+        :param frames: List of input frames (sizes may differ)
+        :return: List of DetectionBatch, one per frame
+        """
+        results = self.backend.predict(frames)
 
-                class_id = int(box.cls[0])
-                label = self.model.names[class_id]
+        start = time.perf_counter()
+        batches = [
+            DetectionBatch.from_results(
+                [result], self.backend.names, self.confidence_threshold
+            )
+            for result in results
+        ]
 
-                detections.append({
-                    "label": label,
-                    "confidence": confidence,
-                    "bbox": (x1, y1, x2, y2)
-                })
+        if self.metrics is not None and results:
+            # Per-image timings; the whole batch shares one forward pass
+            speed = results[0].speed
+            self.metrics.observe("preprocess", speed.get("preprocess", 0.0) / 1000)
+            self.metrics.observe("inference", speed.get("inference", 0.0) * len(frames) / 1000)
+            self.metrics.observe(
+                "postprocess",
+                speed.get("postprocess", 0.0) / 1000 + time.perf_counter() - start,
+            )
 
-        return detections
+        return batches
+
+    def detect(self, frame):
+        """
+        Perform object detection on a given frame.
+
+        :param frame: Input video frame
+        :return: List of detected objects
+        """
+        return self.detect_batch(frame).to_dicts()
@@ -0,0 +1,115 @@
+"""
+Model export for Vision I.
+
+One-time conversion of the YOLO PyTorch weights to faster
+CPU inference formats (ONNX, OpenVINO), with optional int8
+quantization. Exported models are cached under ``models/``
+and reused on later runs.
+
+Usage:
+    python -m src.vision.export --backend onnx --imgsz 480 --int8
+"""
+
+import argparse
+import shutil
+from pathlib import Path
+
+
+EXPORT_DIR = Path("models")
+
+
+def exported_path(model_path: str, backend: str, imgsz: int, int8: bool = False):
+    """
+    Location of the cached export for a model/backend/size combination.
+    """
+    stem = Path(model_path).stem
+    name = f"{stem}-{imgsz}" + ("-int8" if int8 else "")
+
+    if backend == "onnx":
+        return EXPORT_DIR / f"{name}.onnx"
+    if backend == "openvino":
+        # ultralytics recognises OpenVINO models by this directory suffix
+        return EXPORT_DIR / f"{name}_openvino_model"
+
+    raise ValueError(f"Unsupported export backend: {backend}")
+
+
+def _quantize_onnx(source: Path, target: Path):
+    """
+    Dynamic int8 weight quantization with ONNX Runtime.
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(str(source), str(target), weight_type=QuantType.QUInt8)
+
+
+def export_model(
+    model_path: str = "yolov8n.pt",
+    backend: str = "onnx",
+    imgsz: int = 640,
+    int8: bool = False,
+    calibration_data: str = "coco8.yaml",
+    force: bool = False,
+):
+    """
+    Export a YOLO model for the given backend, unless already cached.
+
+    :param model_path: Source PyTorch weights
+    :param backend: 'onnx' or 'openvino'
+    :param imgsz: Fixed inference resolution baked into the export
+    :param int8: Quantize weights to int8
+    :param calibration_data: Dataset YAML for OpenVINO int8 calibration
+    :param force: Re-export even if a cached model exists
+    :return: Path to the exported model
+    """
+    target = exported_path(model_path, backend, imgsz, int8)
+    if target.exists() and not force:
+        return target
+
+    from ultralytics import YOLO
+
+    EXPORT_DIR.mkdir(exist_ok=True)
+    model = YOLO(model_path)
+
+    print(f"[EXPORT] {model_path} -> {backend} (imgsz={imgsz}, int8={int8})")
+
+    if backend == "onnx":
+        exported = Path(model.export(format="onnx", imgsz=imgsz, simplify=True))
+        if int8:
+            _quantize_onnx(exported, target)
+            exported.unlink()
+        else:
+            shutil.move(str(exported), str(target))
+
+    elif backend == "openvino":
+        options = {"format": "openvino", "imgsz": imgsz, "int8": int8}
+        if int8:
+            options["data"] = calibration_data
+        exported = Path(model.export(**options))
+        if target.exists():
+            shutil.rmtree(target)
+        shutil.move(str(exported), str(target))
+
+    else:
+        raise ValueError(f"Unsupported export backend: {backend}")
+
+    print(f"[EXPORT] Saved {target}")
+    return target
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export Vision I detection model")
+    parser.add_argument("--model", default="yolov8n.pt")
+    parser.add_argument("--backend", default="onnx", choices=["onnx", "openvino"])
+    parser.add_argument("--imgsz", type=int, default=640)
+    parser.add_argument("--int8", action="store_true")
+    parser.add_argument("--data", default="coco8.yaml",
+                        help="Calibration dataset for OpenVINO int8")
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args()
+
+    export_model(args.model, args.backend, args.imgsz, args.int8, args.data, args.force)
+
+
+if __name__ == "__main__":
+    main()
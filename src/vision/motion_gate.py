@@ -0,0 +1,108 @@
+"""
+Motion-gated inference for Vision I.
+
+When the user stands still (at a crossing, at a desk) consecutive
+frames are nearly identical and a full detection adds nothing.
+The gate compares a small grayscale thumbnail of each frame with
+the thumbnail of the last frame that was actually detected, and
+reuses the previous detections while the change stays below a
+threshold and they are not older than a maximum age.
+"""
+
+import time
+
+import numpy as np
+
+
+class MotionGate:
+    def __init__(
+        self,
+        threshold: float = 0.02,
+        pixel_delta: int = 12,
+        size=(64, 48),
+        max_age: float = 0.5,
+        metrics=None,
+    ):
+        """
+        :param threshold: Share of thumbnail pixels that must change
+                          to run the detector again
+        :param pixel_delta: Gray-level difference counted as a change
+        :param size: Thumbnail (width, height) compared between frames
+        :param max_age: Seconds after which detections are refreshed
+                        even on a static scene
+        :param metrics: Optional MetricsCollector for gating counters
+        """
+        import cv2
+
+        self.cv2 = cv2
+        self.threshold = threshold
+        self.pixel_delta = pixel_delta
+        self.size = tuple(size)
+        self.max_age = max_age
+        self.metrics = metrics
+
+        self.reference = None
+        self.reference_time = 0.0
+        self.last_batch = None
+
+        self.inferred = 0
+        self.skipped = 0
+
+    # --------------------------------------------------
+
+    def thumbnail(self, frame):
+        cv2 = self.cv2
+        if frame.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+
+    def change(self, thumbnail):
+        """
+        Share of pixels that differ from the last detected frame.
+        """
+        diff = self.cv2.absdiff(thumbnail, self.reference)
+        return np.count_nonzero(diff > self.pixel_delta) / diff.size
+
+    def _count(self, name, start):
+        if self.metrics is not None:
+            self.metrics.increment(name)
+            self.metrics.observe("motion_gate", time.perf_counter() - start)
+
+    # --------------------------------------------------
+
+    def wrap(self, detect):
+        """
+        Gate a detect callable.
+
+        :param detect: Callable mapping a frame to detections
+        :return: Callable returning fresh or reused detections
+        """
+
+        def gated(frame):
+            start = time.perf_counter()
+            thumbnail = self.thumbnail(frame)
+
+            if (
+                self.last_batch is not None
+                and start - self.reference_time < self.max_age
+                and self.change(thumbnail) < self.threshold
+            ):
+                self.skipped += 1
+                self._count("gate_skipped", start)
+                return self.last_batch
+
+            self._count("gate_inferred", start)
+            self.inferred += 1
+            self.reference = thumbnail
+            self.reference_time = start
+            self.last_batch = detect(frame)
+            return self.last_batch
+
+        return gated
+
+    def skip_rate(self):
+        """
+        Share of frames served from the previous detections.
+        """
+        total = self.inferred + self.skipped
+        return self.skipped / total if total else 0.0
@@ -0,0 +1,188 @@
+"""
+Region-of-interest detection for Vision I.
+
+Navigation hazards sit mostly in the walking corridor (the
+CENTER band of DirectionEstimator) and the lower part of the
+frame. Instead of always running the full frame at the model's
+default size, detection can:
+
+- crop to one region of interest (mode 'roi'), or
+- run several tiles, each at its own resolution (mode 'tiles'),
+
+with the inference size chosen per frame from the scene
+context. Boxes are mapped back to full-frame coordinates, so
+feature estimators downstream are unaffected.
+"""
+
+import numpy as np
+
+from src.tracking.tracker import iou_matrix
+from src.vision.detections import DetectionBatch
+
+
+# Corridor: middle third of the width, lower 70% of the height
+DEFAULT_ROI = (1 / 3, 0.3, 2 / 3, 1.0)
+
+DEFAULT_CONTEXT_IMGSZ = {
+    "CLEAR": 320,
+    "INDOOR": 416,
+    "OUTDOOR": 640,
+    "CROWDED": 640,
+}
+
+DEFAULT_TILES = (
+    {"box": (0.25, 0.3, 0.75, 1.0), "imgsz": 640},
+    {"box": (0.0, 0.0, 1.0, 1.0), "imgsz": 320},
+)
+
+
+def round_imgsz(size, stride: int = 32):
+    """
+    Round an inference size to a multiple of the model stride.
+    """
+    return max(stride, int(round(size / stride)) * stride)
+
+
+class RegionDetector:
+    def __init__(
+        self,
+        detector,
+        context=None,
+        mode: str = "roi",
+        roi=DEFAULT_ROI,
+        tiles=DEFAULT_TILES,
+        context_imgsz=None,
+        full_frame_contexts=("OUTDOOR", "CROWDED"),
+        merge_iou: float = 0.5,
+    ):
+        """
+        :param detector: ObjectDetector
+        :param context: SceneContext read each frame (None: always default size)
+        :param mode: 'roi' (single crop) or 'tiles'
+        :param roi: (x1, y1, x2, y2) as fractions of the frame
+        :param tiles: Sequence of {'box': (x1, y1, x2, y2) fractions, 'imgsz': int}
+        :param context_imgsz: Full-frame inference size per scene context
+        :param full_frame_contexts: Contexts that always use the whole frame
+        :param merge_iou: IoU above which same-class boxes from
+                          overlapping tiles are merged
+        """
+        if mode not in ("roi", "tiles"):
+            raise ValueError(f"Unknown region mode: {mode}")
+
+        self.detector = detector
+        self.context = context
+        self.mode = mode
+        self.roi = tuple(roi)
+        self.tiles = [(tuple(tile["box"]), tile.get("imgsz")) for tile in tiles]
+        self.context_imgsz = dict(DEFAULT_CONTEXT_IMGSZ)
+        self.context_imgsz.update(context_imgsz or {})
+        self.full_frame_contexts = set(full_frame_contexts or ())
+        self.merge_iou = merge_iou
+
+        # Stats
+        self.frames = 0
+        self.full_frames = 0
+        self.pixel_share = 0.0
+
+    # --------------------------------------------------
+
+    def _context(self):
+        return self.context.get() if self.context is not None else None
+
+    def _frame_imgsz(self, context):
+        return self.context_imgsz.get(context, self.detector.backend.imgsz)
+
+    @staticmethod
+    def _window(box, width, height):
+        x1, y1, x2, y2 = box
+        return (
+            int(round(x1 * width)), int(round(y1 * height)),
+            int(round(x2 * width)), int(round(y2 * height)),
+        )
+
+    def _detect_window(self, frame, window, imgsz):
+        """
+        Detect inside a pixel window and remap boxes to the full frame.
+        """
+        x1, y1, x2, y2 = window
+        batch = self.detector.detect_batch(frame[y1:y2, x1:x2], imgsz)
+        self.pixel_share += (x2 - x1) * (y2 - y1) / (frame.shape[0] * frame.shape[1])
+
+        if len(batch) and (x1 or y1):
+            batch.boxes = batch.boxes + np.array([x1, y1, x1, y1], dtype=batch.boxes.dtype)
+        return batch
+
+    def _merge(self, batches, names):
+        """
+        Concatenate tile results, dropping same-class duplicates
+        from overlapping tiles (higher confidence wins).
+        """
+        batches = [b for b in batches if len(b)]
+        if not batches:
+            return DetectionBatch.empty(names)
+        if len(batches) == 1:
+            return batches[0]
+
+        boxes = np.concatenate([b.boxes for b in batches])
+        confidences = np.concatenate([b.confidences for b in batches])
+        class_ids = np.concatenate([b.class_ids for b in batches])
+
+        order = np.argsort(-confidences, kind="stable")
+        boxes, confidences, class_ids = boxes[order], confidences[order], class_ids[order]
+
+        overlap = iou_matrix(boxes, boxes) > self.merge_iou
+        overlap &= class_ids[:, None] == class_ids[None, :]
+
+        keep = np.ones(len(boxes), dtype=bool)
+        for i in range(len(boxes)):
+            if keep[i]:
+                suppressed = overlap[i]
+                suppressed[: i + 1] = False
+                keep &= ~suppressed
+
+        return DetectionBatch(boxes[keep], confidences[keep], class_ids[keep], names)
+
+    # --------------------------------------------------
+
+    def detect_batch(self, frame, imgsz: int = None):
+        """
+        Detect objects in the configured regions of a frame.
+
+        :param frame: Input video frame
+        :param imgsz: Full-frame inference size (default: from scene context)
+        :return: DetectionBatch in full-frame coordinates
+        """
+        height, width = frame.shape[:2]
+        context = self._context()
+        full_imgsz = imgsz or self._frame_imgsz(context)
+        self.frames += 1
+
+        if context in self.full_frame_contexts:
+            self.full_frames += 1
+            return self._detect_window(frame, (0, 0, width, height), round_imgsz(full_imgsz))
+
+        if self.mode == "roi":
+            # Keep the pixel density of the full-frame size inside the crop
+            x1, y1, x2, y2 = self.roi
+            crop_imgsz = round_imgsz(full_imgsz * max(x2 - x1, y2 - y1))
+            return self._detect_window(frame, self._window(self.roi, width, height), crop_imgsz)
+
+        batches = [
+            self._detect_window(
+                frame, self._window(box, width, height), round_imgsz(tile_imgsz or full_imgsz)
+            )
+            for box, tile_imgsz in self.tiles
+        ]
+        return self._merge(batches, self.detector.backend.names)
+
+    def detect(self, frame):
+        return self.detect_batch(frame).to_dicts()
+
+    def pixel_fraction(self):
+        """
+        Average share of frame pixels sent to the detector per frame
+        (above 1.0 when tiles overlap).
+        """
+        if not self.frames:
+            return 0.0
+        return self.pixel_share / self.frames
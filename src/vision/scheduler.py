@@ -0,0 +1,161 @@
+"""
+Keyframe detection scheduler for Vision I.
+
+Runs the full object detector only on keyframes (every N
+frames, or when a trigger fires) and propagates boxes between
+keyframes with constant-velocity prediction from a tracker
+run on the keyframes. N adapts to scene motion and to the
+current scene context.
+"""
+
+import numpy as np
+
+from src.tracking.tracker import MultiObjectTracker
+from src.vision.detections import DetectionBatch
+
+
+DEFAULT_CONTEXT_INTERVALS = {
+    "CLEAR": 6,
+    "INDOOR": 4,
+    "OUTDOOR": 2,
+    "CROWDED": 2,
+}
+
+
+class KeyframeScheduler:
+    def __init__(
+        self,
+        detector,
+        min_interval: int = 1,
+        max_interval: int = 8,
+        context_intervals=None,
+        motion_threshold: float = 0.025,
+        match_iou: float = 0.3,
+    ):
+        """
+        :param detector: ObjectDetector used on keyframes
+        :param min_interval: Smallest keyframe interval (frames)
+        :param max_interval: Largest keyframe interval (frames)
+        :param context_intervals: Keyframe interval per scene context
+        :param motion_threshold: Per-frame box growth or shift, relative
+                                 to box height, treated as fast motion
+        :param match_iou: Minimum IoU to link boxes across keyframes
+        """
+        self.detector = detector
+        self.min_interval = max(1, int(min_interval))
+        self.max_interval = max(self.min_interval, int(max_interval))
+        self.context_intervals = dict(DEFAULT_CONTEXT_INTERVALS)
+        self.context_intervals.update(context_intervals or {})
+        self.motion_threshold = motion_threshold
+        self.tracker = MultiObjectTracker(iou_threshold=match_iou, max_misses=2)
+
+        self.last_keyframe = None
+        self.current = None
+        self.velocities = None
+        self.frames_since_keyframe = 0
+        self.interval = self.min_interval
+        self.triggered = True
+        self.last_context = None
+
+        self.keyframes = 0
+        self.propagated = 0
+
+    # --------------------------------------------------
+
+    def trigger(self):
+        """
+        Force a full detection on the next frame.
+        """
+        self.triggered = True
+
+    def _is_keyframe(self, context):
+        if self.triggered or self.last_keyframe is None:
+            return True
+        if context is not None and context != self.last_context:
+            return True
+        return self.frames_since_keyframe >= self.interval
+
+    def _estimate_velocities(self, batch, frames):
+        """
+        Per-box velocity (pixels/frame), taken from the keyframe tracker.
+        """
+        track_ids = self.tracker.update(batch, frames=max(frames, 1))
+        return self.tracker.velocity(track_ids)
+
+    def _adapt_interval(self, context):
+        """
+        Choose the next keyframe interval from context and motion.
+        """
+        interval = self.context_intervals.get(context, self.max_interval)
+
+        boxes = self.current.boxes
+        if len(boxes):
+            sizes = np.maximum(boxes[:, 3] - boxes[:, 1], 1.0)
+            speed = np.abs(self.velocities).max(axis=1) / sizes
+            growth = (self.velocities[:, 3] - self.velocities[:, 1]) / sizes
+
+            # Approaching hazards and fast motion need fresh detections
+            if growth.max() > self.motion_threshold:
+                interval = self.min_interval
+            elif speed.max() > self.motion_threshold:
+                interval = max(self.min_interval, interval // 2)
+
+        self.interval = int(min(max(interval, self.min_interval), self.max_interval))
+
+    def _propagate(self, frame):
+        """
+        Advance the last boxes by one frame of constant velocity.
+        """
+        boxes = self.current.boxes + self.velocities
+        height, width = frame.shape[:2]
+        boxes[:, [0, 2]] = np.clip(boxes[:, [0, 2]], 0, width)
+        boxes[:, [1, 3]] = np.clip(boxes[:, [1, 3]], 0, height)
+
+        self.current = DetectionBatch(
+            boxes,
+            self.current.confidences,
+            self.current.class_ids,
+            self.current.names,
+        )
+
+    # --------------------------------------------------
+
+    def detect_batch(self, frame, context=None):
+        """
+        Return detections for a frame, running the detector only on keyframes.
+
+        :param frame: Input video frame
+        :param context: Current scene context string
+        :return: DetectionBatch
+        """
+        if self._is_keyframe(context):
+            batch = self.detector.detect_batch(frame)
+            self.velocities = self._estimate_velocities(
+                batch, self.frames_since_keyframe
+            )
+            self.last_keyframe = batch
+            self.current = batch
+            self.frames_since_keyframe = 0
+            self.triggered = False
+            self.last_context = context
+            self.keyframes += 1
+        else:
+            self._propagate(frame)
+            self.propagated += 1
+
+        self.frames_since_keyframe += 1
+        self._adapt_interval(context)
+        return self.current
+
+    def detect(self, frame, context=None):
+        """
+        Legacy list-of-dicts interface.
+        """
+        return self.detect_batch(frame, context).to_dicts()
+
+    def load_reduction(self):
+        """
+        Frames processed per detector call.
+        """
+        total = self.keyframes + self.propagated
+        return total / self.keyframes if self.keyframes else 0.0
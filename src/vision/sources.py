@@ -0,0 +1,204 @@
+"""
+Frame sources for Vision I.
+
+Provides a common interface over live cameras, video files,
+image directories and raw memory-mapped frame dumps so the
+whole system can run headless and reproducibly.
+
+OpenCV is imported when a source that needs it is opened,
+so it does not add to process start-up time.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+RAW_EXTENSIONS = (".raw", ".rgb", ".bgr", ".bin")
+
+
+class FrameSource:
+    """
+    Base class for all frame sources.
+
+    ``live`` sources produce frames in real time and should be
+    read by a background grabber; recorded sources are read
+    sequentially so every frame is delivered exactly once.
+    """
+
+    live = False
+
+    def read(self, out=None):
+        """
+        Read the next frame.
+
+        :param out: Optional preallocated array to read into
+        :return: Frame array, or None when the source is exhausted
+        """
+        raise NotImplementedError
+
+    def release(self):
+        pass
+
+
+class DeviceSource(FrameSource):
+    live = True
+
+    def __init__(self, index: int = 0):
+        """
+        :param index: Camera device index
+        """
+        import cv2
+
+        self.cap = cv2.VideoCapture(index)
+        if not self.cap.isOpened():
+            raise RuntimeError("Unable to access the camera")
+
+        # Keep OpenCV's internal queue short so frames stay fresh
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    def read(self, out=None):
+        ret, frame = self.cap.read(out) if out is not None else self.cap.read()
+        if not ret:
+            return None
+        return frame
+
+    def release(self):
+        self.cap.release()
+
+
+class VideoFileSource(FrameSource):
+    def __init__(self, path, loop: bool = False):
+        """
+        :param path: Path to a video file
+        :param loop: Restart from the first frame at end of file
+        """
+        import cv2
+
+        self.path = str(path)
+        self.loop = loop
+        self.cap = cv2.VideoCapture(self.path)
+        self.rewind_property = cv2.CAP_PROP_POS_FRAMES
+        if not self.cap.isOpened():
+            raise RuntimeError(f"Unable to open video file: {path}")
+
+    def read(self, out=None):
+        ret, frame = self.cap.read(out) if out is not None else self.cap.read()
+        if not ret and self.loop:
+            self.cap.set(self.rewind_property, 0)
+            ret, frame = self.cap.read(out) if out is not None else self.cap.read()
+        if not ret:
+            return None
+        return frame
+
+    def release(self):
+        self.cap.release()
+
+
+class ImageDirectorySource(FrameSource):
+    def __init__(self, path, loop: bool = False):
+        """
+        :param path: Directory of images, read in sorted name order
+        :param loop: Restart from the first image when exhausted
+        """
+        self.files = sorted(
+            p for p in Path(path).iterdir()
+            if p.suffix.lower() in IMAGE_EXTENSIONS
+        )
+        if not self.files:
+            raise RuntimeError(f"No images found in directory: {path}")
+
+        self.loop = loop
+        self.index = 0
+
+    def read(self, out=None):
+        import cv2
+
+        if self.index >= len(self.files):
+            if not self.loop:
+                return None
+            self.index = 0
+
+        frame = cv2.imread(str(self.files[self.index]))
+        self.index += 1
+
+        if frame is None:
+            return None
+        if out is not None and out.shape == frame.shape:
+            np.copyto(out, frame)
+            return out
+        return frame
+
+
+class RawFrameDumpSource(FrameSource):
+    def __init__(self, path, width: int, height: int, channels: int = 3, loop: bool = False):
+        """
+        Read frames from a raw uint8 dump of back-to-back BGR images.
+
+        :param path: Path to the dump file
+        :param width: Frame width in pixels
+        :param height: Frame height in pixels
+        :param channels: Channels per pixel
+        :param loop: Restart from the first frame when exhausted
+        """
+        if not width or not height:
+            raise ValueError("Raw frame dumps need an explicit width and height")
+
+        frame_shape = (height, width, channels)
+        data = np.memmap(path, dtype=np.uint8, mode="r")
+        frame_bytes = height * width * channels
+
+        count = data.size // frame_bytes
+        if count == 0:
+            raise RuntimeError(f"Raw frame dump is empty: {path}")
+
+        self.frames = data[:count * frame_bytes].reshape((count,) + frame_shape)
+        self.loop = loop
+        self.index = 0
+
+    def read(self, out=None):
+        if self.index >= len(self.frames):
+            if not self.loop:
+                return None
+            self.index = 0
+
+        frame = self.frames[self.index]
+        self.index += 1
+
+        if out is not None:
+            np.copyto(out, frame)
+            return out
+        return np.array(frame)
+
+    def release(self):
+        self.frames = None
+
+
+def open_source(source=0, loop: bool = False, width: int = None, height: int = None):
+    """
+    Create a frame source from a config value.
+
+    :param source: Camera index, video file, image directory or raw dump
+    :param loop: Loop recorded sources
+    :param width: Frame width (raw dumps only)
+    :param height: Frame height (raw dumps only)
+    :return: FrameSource instance
+    """
+    if isinstance(source, FrameSource):
+        return source
+
+    if isinstance(source, int) or (isinstance(source, str) and source.isdigit()):
+        return DeviceSource(int(source))
+
+    path = Path(source)
+    if path.is_dir():
+        return ImageDirectorySource(path, loop=loop)
+
+    if not path.exists():
+        raise FileNotFoundError(f"Frame source not found: {source}")
+
+    if path.suffix.lower() in RAW_EXTENSIONS:
+        return RawFrameDumpSource(path, width, height, loop=loop)
+
+    return VideoFileSource(path, loop=loop)
@@ -0,0 +1,139 @@
+"""
+DetectionCache: hits, LRU eviction, persistence and invalidation.
+"""
+
+import numpy as np
+import pytest
+
+from benchmarks.stub_detector import StubBackend
+from src.vision.detection_cache import DetectionCache
+from src.vision.detector import ObjectDetector
+
+
+NAMES = {0: "person", 1: "car"}
+
+# Bytes per cache entry with max_detections=2 (see DetectionCache)
+ENTRY_BYTES = 18 + 2 * 22
+
+
+class WeightsBackend(StubBackend):
+    """
+    Stub backend with a weights file on disk, as the cache fingerprints it.
+    """
+
+    int8 = False
+
+    def __init__(self, weights):
+        super().__init__([np.array([[10, 20, 60, 120, 0.9, 0]], dtype=np.float32)], NAMES)
+        self.weights = weights
+        self.calls = 0
+
+    def resolve_weights(self):
+        return self.weights
+
+    def predict(self, frame, imgsz: int = None):
+        self.calls += 1
+        return super().predict(frame, imgsz)
+
+
+@pytest.fixture
+def weights(tmp_path):
+    path = tmp_path / "model.onnx"
+    path.write_bytes(b"weights")
+    return path
+
+
+def make_cache(tmp_path, weights, entries=4):
+    detector = ObjectDetector(backend=WeightsBackend(weights), warmup=False)
+    return DetectionCache(
+        detector,
+        cache_dir=tmp_path / "cache",
+        max_mb=entries * ENTRY_BYTES / (1024 * 1024),
+        max_detections=2,
+    )
+
+
+def frame(value):
+    return np.full((48, 64, 3), value, dtype=np.uint8)
+
+
+def test_hit_skips_inference(tmp_path, weights):
+    cache = make_cache(tmp_path, weights)
+    backend = cache.backend
+
+    first = cache.detect_batch(frame(1))
+    second = cache.detect_batch(frame(1))
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert backend.calls == 1
+    np.testing.assert_array_equal(first.boxes, second.boxes)
+    assert second.labels == ["person"]
+
+    cache.detect_batch(frame(2))
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_evicts_least_recently_used(tmp_path, weights):
+    cache = make_cache(tmp_path, weights, entries=3)
+    assert cache.capacity == 3
+
+    for value in (1, 2, 3):
+        cache.detect_batch(frame(value))
+    cache.detect_batch(frame(1))        # 2 is now the oldest
+    cache.detect_batch(frame(4))
+
+    assert cache.evictions == 1
+    hits = cache.hits
+    for value in (1, 3, 4):
+        cache.detect_batch(frame(value))
+    assert cache.hits == hits + 3
+
+    cache.detect_batch(frame(2))
+    assert cache.hits == hits + 3
+
+
+def test_recency_survives_reopen(tmp_path, weights):
+    cache = make_cache(tmp_path, weights, entries=3)
+    for value in (1, 2, 3):
+        cache.detect_batch(frame(value))
+    cache.detect_batch(frame(1))        # order now 2, 3, 1
+    cache.close()
+
+    cache = make_cache(tmp_path, weights, entries=3)
+    assert len(cache.slots) == 3
+    cache.detect_batch(frame(4))        # evicts 2
+    cache.detect_batch(frame(5))        # evicts 3
+
+    for value in (1, 4, 5):
+        cache.detect_batch(frame(value))
+    assert cache.hits == 3
+
+    cache.detect_batch(frame(2))
+    cache.detect_batch(frame(3))
+    assert cache.hits == 3
+
+
+def test_changed_weights_clear_cache(tmp_path, weights):
+    cache = make_cache(tmp_path, weights)
+    cache.detect_batch(frame(1))
+    cache.close()
+
+    weights.write_bytes(b"re-exported weights")
+    cache = make_cache(tmp_path, weights)
+
+    assert len(cache.slots) == 0
+    cache.detect_batch(frame(1))
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_bypassed_when_confidence_changes(tmp_path, weights):
+    cache = make_cache(tmp_path, weights)
+    cache.detect_batch(frame(1))
+
+    cache.detector.confidence_threshold = 0.7
+    cache.detect_batch(frame(1))
+    cache.detect_batch(frame(2))
+
+    assert cache.bypassed == 2
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert len(cache.slots) == 1
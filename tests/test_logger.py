@@ -0,0 +1,134 @@
+"""
+DecisionLogger: binary records, flushing and rotation.
+"""
+
+import gzip
+import json
+import os
+import time
+
+import pytest
+
+from src.utils.logger import (
+    BINARY_MAGIC,
+    DecisionLogger,
+    encode_binary,
+    read_binary_log,
+)
+
+
+EVENTS = [
+    {"timestamp": 1718000000.25, "label": "person", "distance": 1.5,
+     "direction": "CENTER", "motion": "APPROACHING", "decision": "Warning. person approaching ahead."},
+    {"timestamp": 1718000001.5, "label": "chair", "distance": None,
+     "direction": "LEFT", "motion": None, "decision": "Obstacle on left. Move right."},
+    {"timestamp": 1718000002.0, "label": None, "distance": float("nan"),
+     "direction": None, "motion": "MOVING_AWAY", "decision": None},
+]
+
+
+@pytest.mark.parametrize("suffix", [".bin", ".bin.gz"])
+def test_binary_round_trip(tmp_path, suffix):
+    path = tmp_path / f"decisions{suffix}"
+    data = BINARY_MAGIC + b"".join(encode_binary(event) for event in EVENTS)
+    opener = gzip.open if suffix.endswith(".gz") else open
+    with opener(path, "wb") as f:
+        f.write(data)
+
+    decoded = list(read_binary_log(path))
+
+    assert len(decoded) == len(EVENTS)
+    for got, event in zip(decoded, EVENTS):
+        distance = event["distance"]
+        if distance is None or distance != distance:
+            assert got["distance"] is None
+        else:
+            # Stored as float32
+            assert got["distance"] == pytest.approx(distance)
+
+        assert got["timestamp"] == event["timestamp"]
+        assert got["label"] == event["label"]
+        assert got["direction"] == event["direction"]
+        assert got["motion"] == event["motion"]
+        assert got["decision"] == (event["decision"] or "")
+
+
+def test_binary_log_rejects_other_files(tmp_path):
+    path = tmp_path / "decisions.bin"
+    path.write_bytes(b"not a log")
+    with pytest.raises(ValueError):
+        list(read_binary_log(path))
+
+
+def test_binary_logger_writes_readable_log(tmp_path):
+    logger = DecisionLogger(tmp_path / "logs" / "decisions.jsonl", binary=True)
+    for event in EVENTS:
+        logger.log(event["label"], event["distance"], event["direction"],
+                   event["motion"], event["decision"], timestamp=event["timestamp"])
+    logger.close()
+
+    decoded = list(read_binary_log(tmp_path / "logs" / "decisions.bin"))
+    assert [e["timestamp"] for e in decoded] == [e["timestamp"] for e in EVENTS]
+    assert [e["label"] for e in decoded] == [e["label"] for e in EVENTS]
+
+
+def test_flush_writes_everything_queued(tmp_path):
+    path = tmp_path / "decisions.jsonl"
+    logger = DecisionLogger(path, batch_size=1, flush_interval=60)
+
+    for round_ in range(20):
+        for i in range(25):
+            logger.log("person", 1.0, "CENTER", None, f"{round_}-{i}")
+        assert logger.flush(timeout=5.0)
+        assert len(path.read_text().splitlines()) == (round_ + 1) * 25
+
+    logger.close()
+
+
+def test_rotates_by_size(tmp_path):
+    path = tmp_path / "decisions.jsonl"
+    logger = DecisionLogger(path, batch_size=1, rotate_bytes=200, compress=True)
+
+    for i in range(10):
+        logger.log("person", 1.0, "CENTER", None, f"message {i}")
+        logger.flush()
+    logger.close()
+
+    rotated = sorted(tmp_path.glob("decisions-*.jsonl.gz"))
+    assert rotated
+
+    lines = path.read_text().splitlines()
+    for archive in rotated:
+        with gzip.open(archive, "rt") as f:
+            lines += f.read().splitlines()
+    assert sorted(json.loads(line)["decision"] for line in lines) == \
+        sorted(f"message {i}" for i in range(10))
+
+
+def test_rotates_stale_log_on_first_open(tmp_path):
+    path = tmp_path / "decisions.jsonl"
+    path.write_text('{"decision": "yesterday"}\n')
+    two_days_ago = time.time() - 2 * 86400
+    os.utime(path, (two_days_ago, two_days_ago))
+
+    logger = DecisionLogger(path, compress=False)
+    logger.log("person", 1.0, "CENTER", None, "today")
+    logger.close()
+
+    stamp = time.strftime("%Y%m%d", time.localtime(two_days_ago))
+    rotated = list(tmp_path.glob(f"decisions-{stamp}-*.jsonl"))
+    assert len(rotated) == 1
+    assert "yesterday" in rotated[0].read_text()
+    assert [json.loads(line)["decision"] for line in path.read_text().splitlines()] == ["today"]
+
+
+def test_keeps_todays_log_on_first_open(tmp_path):
+    path = tmp_path / "decisions.jsonl"
+    path.write_text('{"decision": "earlier today"}\n')
+
+    logger = DecisionLogger(path)
+    logger.log("person", 1.0, "CENTER", None, "now")
+    logger.close()
+
+    assert list(tmp_path.iterdir()) == [path]
+    assert len(path.read_text().splitlines()) == 2
@@ -0,0 +1,76 @@
+"""
+MotionEstimator.estimate_batch against the per-track reference.
+"""
+
+import numpy as np
+
+from src.features.motion import MotionEstimator, MOTIONS
+from src.tracking.tracker import MultiObjectTracker
+from src.vision.detections import DetectionBatch
+
+
+NAMES = {0: "person", 1: "car", 2: "chair"}
+
+
+def estimate_track(track, threshold):
+    """
+    Scalar reference: compare the last two boxes of a track's history.
+    """
+    history = track.history
+    x1, y1, x2, y2 = history[-1]
+    current_size = (x2 - x1) * (y2 - y1)
+
+    if current_size <= 0:
+        return None
+
+    if len(history) < 2:
+        return "STATIONARY"
+
+    px1, py1, px2, py2 = history[-2]
+    previous_size = (px2 - px1) * (py2 - py1)
+
+    if previous_size <= 0:
+        return "STATIONARY"
+
+    change_ratio = (current_size - previous_size) / previous_size
+
+    if change_ratio > threshold:
+        return "APPROACHING"
+    elif change_ratio < -threshold:
+        return "MOVING_AWAY"
+
+
+def _frames(rng, count=200, objects=8):
+    boxes = rng.uniform(0, 400, size=(objects, 2))
+    sizes = rng.uniform(20, 120, size=(objects, 2))
+    class_ids = rng.integers(0, len(NAMES), size=objects)
+
+    for _ in range(count):
+        # Grow, shrink or hold each object; drop a few per frame
+        sizes *= rng.choice([0.9, 1.0, 1.02, 1.1], size=(objects, 1))
+        boxes += rng.normal(0, 3, size=boxes.shape)
+        visible = rng.random(objects) > 0.15
+
+        xyxy = np.hstack([boxes, boxes + sizes])[visible].astype(np.float32)
+        confidences = np.ones(len(xyxy), dtype=np.float32)
+        yield DetectionBatch(xyxy, confidences, class_ids[visible].astype(np.int16), NAMES)
+
+
+def test_estimate_batch_matches_per_track_reference():
+    rng = np.random.default_rng(7)
+    tracker = MultiObjectTracker()
+    estimator = MotionEstimator()
+    compared = 0
+
+    for batch in _frames(rng):
+        track_ids = tracker.update(batch)
+        codes = estimator.estimate_batch(tracker, track_ids)
+
+        expected = [
+            estimate_track(tracker.get(track_id), estimator.threshold)
+            for track_id in track_ids.tolist()
+        ]
+        assert [MOTIONS[code] for code in codes] == expected
+        compared += len(expected)
+
+    assert compared > 0
@@ -0,0 +1,100 @@
+"""
+Default rule table against the original if-chain.
+"""
+
+import numpy as np
+
+from src.decision.rule_table import RuleTable
+from src.features.direction import DIRECTIONS
+from src.features.motion import MOTIONS
+from src.vision.detections import DetectionBatch
+
+
+NAMES = {0: "person", 1: "car", 2: "chair", 3: "bicycle"}
+
+
+def if_chain(labels, distances, directions, motions, center_threshold, side_threshold):
+    """
+    Scalar reference: the per-detection rules the table replaced.
+
+    :return: (message, detection index), or (None, None)
+    """
+    best_decision = None
+    best_index = None
+
+    for idx, label in enumerate(labels):
+        distance = distances[idx]
+        direction = directions[idx]
+        motion = motions[idx]
+
+        # CRITICAL: Approaching object straight ahead
+        if motion == "APPROACHING" and direction == "CENTER":
+            return f"Warning. {label} approaching ahead.", idx
+
+        # HIGH: Obstacle close in center
+        if (
+            best_decision is None
+            and distance is not None
+            and distance < center_threshold
+            and direction == "CENTER"
+        ):
+            best_decision, best_index = "Obstacle ahead. Please stop.", idx
+
+        # LOW: Side obstacles
+        if (
+            best_decision is None
+            and direction == "LEFT"
+            and distance is not None
+            and distance < side_threshold
+        ):
+            best_decision, best_index = "Obstacle on left. Move right.", idx
+
+        if (
+            best_decision is None
+            and direction == "RIGHT"
+            and distance is not None
+            and distance < side_threshold
+        ):
+            best_decision, best_index = "Obstacle on right. Move left.", idx
+
+    return best_decision, best_index
+
+
+def test_default_table_matches_if_chain():
+    rng = np.random.default_rng(11)
+    table = RuleTable.load("config/rules.yaml")
+    outcomes = set()
+
+    for _ in range(2000):
+        n = int(rng.integers(0, 10))
+        class_ids = rng.integers(0, len(NAMES), size=n).astype(np.int16)
+        distances = rng.uniform(0.3, 4.0, size=n)
+        distances[rng.random(n) < 0.1] = np.nan
+        directions = rng.integers(0, len(DIRECTIONS), size=n).astype(np.int8)
+        # Approaching objects are rare, so the regular rules get exercised
+        motions = rng.choice(len(MOTIONS), size=n, p=[0.1, 0.6, 0.05, 0.25]).astype(np.int8)
+        center, side = rng.uniform(0.5, 2.5, size=2)
+
+        batch = DetectionBatch(
+            np.zeros((n, 4), dtype=np.float32), np.ones(n, dtype=np.float32), class_ids, NAMES
+        )
+        rule, idx = table.evaluate(
+            batch, distances, directions, motions, {"center": center, "side": side}
+        )
+
+        expected = if_chain(
+            batch.labels,
+            [None if np.isnan(d) else float(d) for d in distances],
+            [DIRECTIONS[code] for code in directions],
+            [MOTIONS[code] for code in motions],
+            center, side,
+        )
+        if rule is None:
+            assert expected == (None, None)
+        else:
+            label = batch.labels[idx]
+            assert (rule.render(label, DIRECTIONS[directions[idx]], distances[idx]), idx) == expected
+        outcomes.add(None if rule is None else rule.rule_id)
+
+    # Every rule (and no match) came up at least once
+    assert len(outcomes) == len(table.rules) + 1
@@ -0,0 +1,81 @@
+"""
+SceneContext smoothing: dwell, exit hysteresis and the traffic override.
+"""
+
+from src.context.scene_context import SceneContext
+from src.features.motion import APPROACHING, STATIONARY
+
+
+def objects(*labels):
+    return [{"label": label} for label in labels]
+
+
+def feed(context, frames):
+    """
+    :param frames: List of (detections, motions)
+    :return: Context after each frame
+    """
+    return [context.infer(detections, motions) for detections, motions in frames]
+
+
+CHAIR = (objects("chair"), [STATIONARY])
+PARKED_CAR = (objects("car"), [STATIONARY])
+EMPTY = (objects(), [])
+
+
+def test_switches_only_after_dwell():
+    context = SceneContext(window=15, dwell=5)
+
+    history = feed(context, [CHAIR] * 6)
+
+    assert history == ["CLEAR"] * 4 + ["INDOOR"] * 2
+
+
+def test_holds_across_one_frame_blips():
+    context = SceneContext(window=15, dwell=5)
+    feed(context, [CHAIR] * 15)
+    assert context.get() == "INDOOR"
+
+    crowd = (objects(*["person"] * 12), [STATIONARY] * 12)
+    for blip in (PARKED_CAR, EMPTY, crowd):
+        history = feed(context, [blip] + [CHAIR] * 3)
+        assert history == ["INDOOR"] * 4
+
+
+def test_dwell_absorbs_short_verdict_changes():
+    # A short window lets one crowded frame flip the verdict for
+    # three frames; that is still shorter than the dwell
+    context = SceneContext(window=3, dwell=5)
+    feed(context, [CHAIR] * 5)
+    assert context.get() == "INDOOR"
+
+    crowd = (objects(*["person"] * 12), [STATIONARY] * 12)
+    assert feed(context, [crowd]) == ["INDOOR"]
+    assert context.candidate == "CROWDED"
+
+    history = feed(context, [CHAIR] * 4)
+
+    assert history == ["INDOOR"] * 4
+    assert context.candidate is None
+
+
+def test_leaves_outdoor_only_below_half_the_vehicle_share():
+    context = SceneContext(window=10, dwell=1, vehicle_share=0.3)
+    feed(context, [PARKED_CAR] * 10)
+    assert context.get() == "OUTDOOR"
+
+    # Vehicle share after k indoor frames is (10 - k) / 10; entering
+    # needs 0.3, leaving needs less than 0.15
+    history = feed(context, [CHAIR] * 9)
+
+    assert history[:8] == ["OUTDOOR"] * 8     # shares 0.9 .. 0.2
+    assert history[8] == "INDOOR"             # share 0.1
+
+
+def test_approaching_vehicle_switches_immediately():
+    context = SceneContext(window=15, dwell=5)
+    feed(context, [CHAIR] * 15)
+
+    history = feed(context, [(objects("chair", "bus"), [STATIONARY, APPROACHING])])
+
+    assert history == ["OUTDOOR"]
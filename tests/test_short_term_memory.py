@@ -0,0 +1,68 @@
+"""
+Grid-backed ShortTermMemory against the original linear scan.
+"""
+
+import math
+
+import numpy as np
+
+from src.memory.short_term_memory import ShortTermMemory
+from src.utils.clock import ManualClock
+
+
+class LinearMemory:
+    """
+    Scalar reference: the list-based memory the grid replaced.
+    """
+
+    def __init__(self, ttl_seconds, distance_threshold, clock):
+        self.ttl = ttl_seconds
+        self.dist_thresh = distance_threshold
+        self.clock = clock
+        self.memory = []
+
+    def _center(self, bbox):
+        x1, y1, x2, y2 = bbox
+        return ((x1 + x2) // 2, (y1 + y2) // 2)
+
+    def is_recent(self, label, bbox):
+        now = self.clock()
+        center = self._center(bbox)
+
+        for obj in self.memory:
+            if obj["label"] == label:
+                c = obj["center"]
+                if math.sqrt((center[0] - c[0]) ** 2 + (center[1] - c[1]) ** 2) < self.dist_thresh:
+                    if now - obj["time"] < self.ttl:
+                        return True
+        return False
+
+    def update(self, label, bbox):
+        now = self.clock()
+        self.memory = [obj for obj in self.memory if now - obj["time"] < self.ttl]
+        self.memory.append({"label": label, "center": self._center(bbox), "time": now})
+
+
+def test_grid_memory_matches_linear_scan():
+    rng = np.random.default_rng(3)
+    clock = ManualClock(1000.0)
+    memory = ShortTermMemory(ttl_seconds=3.0, distance_threshold=50, capacity=10_000, clock=clock)
+    reference = LinearMemory(3.0, 50, clock)
+    hits = 0
+
+    for _ in range(5000):
+        clock.advance(float(rng.uniform(0, 0.2)))
+        label = ("person", "car", "chair")[int(rng.integers(0, 3))]
+        x, y = (int(v) for v in rng.integers(0, 640, size=2))
+        w, h = (int(v) for v in rng.integers(10, 120, size=2))
+        bbox = (x, y, x + w, y + h)
+
+        recent = memory.is_recent(label, bbox)
+        assert recent == reference.is_recent(label, bbox)
+        hits += recent
+
+        if rng.random() < 0.5:
+            memory.update(label, bbox)
+            reference.update(label, bbox)
+
+    assert 0 < hits < 5000
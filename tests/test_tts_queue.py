@@ -0,0 +1,118 @@
+"""
+VoiceAssistant queue logic, without a speech engine.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.audio.tts import VoiceAssistant
+from src.safety.alert_manager import LOW, MEDIUM, HIGH, CRITICAL
+
+
+class HeldVoice(VoiceAssistant):
+    """
+    VoiceAssistant whose engine init blocks until released, so the
+    worker never consumes the queue while a test inspects it.
+    """
+
+    def __init__(self, **kwargs):
+        self.release = threading.Event()
+        super().__init__(**kwargs)
+
+    def _init_engine(self):
+        self.release.wait()
+        self.engine = None
+
+
+@pytest.fixture
+def voice():
+    voices = []
+
+    def create(**kwargs):
+        v = HeldVoice(**kwargs)
+        voices.append(v)
+        return v
+
+    yield create
+
+    for v in voices:
+        v.close(timeout=0.1)
+        v.release.set()
+        v.worker.join(1.0)
+
+
+def drain(v):
+    messages = []
+    while v.queue:
+        severity, _, message = v._next_message()
+        messages.append((severity, message))
+    return messages
+
+
+def test_most_severe_first_then_oldest(voice):
+    v = voice(max_queue=8)
+    v.speak("low one", LOW)
+    v.speak("high", HIGH)
+    v.speak("low two", LOW)
+    v.speak("critical", CRITICAL)
+    v.speak("medium", MEDIUM)
+
+    assert drain(v) == [
+        (CRITICAL, "critical"),
+        (HIGH, "high"),
+        (MEDIUM, "medium"),
+        (LOW, "low one"),
+        (LOW, "low two"),
+    ]
+
+
+def test_duplicate_messages_coalesce(voice):
+    v = voice(max_queue=8)
+    v.speak("Obstacle ahead", HIGH)
+    v.speak("Obstacle on left", LOW)
+    v.speak("Obstacle ahead", HIGH)
+
+    assert len(v.queue) == 2
+    assert v.dropped == 1
+    assert [message for _, message in drain(v)] == ["Obstacle ahead", "Obstacle on left"]
+
+
+def test_full_queue_drops_least_severe_oldest(voice):
+    v = voice(max_queue=3)
+    v.speak("low one", LOW)
+    v.speak("low two", LOW)
+    v.speak("high", HIGH)
+    v.speak("critical", CRITICAL)
+
+    assert v.dropped == 1
+    assert [message for _, message in drain(v)] == ["critical", "high", "low two"]
+
+
+def test_stale_messages_dropped_except_critical(voice):
+    v = voice(max_age=0.05)
+    v.speak("old high", HIGH)
+    v.speak("old critical", CRITICAL)
+    time.sleep(0.1)
+    v.speak("fresh low", LOW)
+
+    assert drain(v) == [(CRITICAL, "old critical"), (LOW, "fresh low")]
+    assert v.dropped == 1
+
+
+def test_critical_preempts_lower_severity_speech(voice):
+    v = voice()
+    v.speaking_severity = HIGH
+    v.speak("Obstacle on left", LOW)
+    assert not v.preempt
+
+    v.speak("Warning. car approaching ahead.", CRITICAL)
+    assert v.preempt
+
+
+def test_critical_does_not_preempt_critical(voice):
+    v = voice()
+    v.speaking_severity = CRITICAL
+    v.speak("Warning. car approaching ahead.", CRITICAL)
+    assert not v.preempt